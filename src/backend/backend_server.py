@@ -3,6 +3,7 @@ import fastapi
 from fastapi import FastAPI, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.openapi.utils import get_openapi
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from slowapi.middleware import SlowAPIMiddleware
@@ -10,6 +11,9 @@ from slowapi.middleware import SlowAPIMiddleware
 # logging
 import logging
 
+from functools import lru_cache
+from typing import Any, cast
+
 # import env configuration
 from .helper import environment as env
 
@@ -42,13 +46,16 @@ from .auth.auth import api_key_auth, admin_key_auth
 # Import rate limiter
 from .helper.rate_limiter import limiter, RATE_LIMITS
 
+# Default JSON response class
+from .helper.responses import CoreJSONResponse
+
 PROJECT_URL: str = env.PROJECT_URL
 ANON_KEY: str = env.ANON_KEY
 
 FRONTEND_URLS: list[str] = env.FRONTEND_URL
 
-# Initialize FastAPI app
-app : FastAPI = FastAPI()
+# Initialize FastAPI app; JSON bodies are encoded by pydantic-core rather than stdlib json
+app : FastAPI = FastAPI(default_response_class=CoreJSONResponse)
 
 
 
@@ -89,6 +96,29 @@ app.include_router(recurring.router, prefix="/recurring", tags=["Recurring"])
 app.include_router(net_worth.router, prefix="/net-worth", tags=["Net Worth"])
 
 
+# OpenAPI schema is built once (all routers are registered above) and reused for /docs and /openapi.json.
+# Schema examples live in schemas/examples.py and are only attached here, not to the models themselves;
+# the module is imported on the first schema request so the example blobs stay off the startup path,
+# and never at all when INCLUDE_OPENAPI_EXAMPLES is off.
+@lru_cache(maxsize=1)
+def _openapi() -> dict[str, Any]:
+    schema = get_openapi(
+        title=app.title,
+        version=app.version,
+        openapi_version=app.openapi_version,
+        description=app.description,
+        routes=app.routes,
+    )
+    if not env.INCLUDE_OPENAPI_EXAMPLES:
+        return schema
+
+    from .schemas.examples import inject_examples
+
+    return cast(dict[str, Any], inject_examples(schema))
+
+app.openapi = _openapi  # type: ignore[method-assign]
+
+
 # ================================================================================================
 #                                       Root API Endpoints
 # ================================================================================================
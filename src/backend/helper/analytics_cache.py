@@ -0,0 +1,73 @@
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Serialized analytics responses, keyed by (user_id, generation, *request key) in LRU order.
+# Entries are per process; the TTL bounds how stale another worker's writes can leave them.
+_cache: "OrderedDict[tuple, tuple[float, bytes]]" = OrderedDict()
+_generations: Dict[str, int] = {}
+_CACHE_TTL_SECONDS = 300  # 5 minutes
+_CACHE_MAX_ENTRIES = 1024
+
+
+def _key(user_id: str, key: tuple) -> tuple:
+    return (user_id, _generations.get(user_id, 0), *key)
+
+
+def get_cached(user_id: str, key: tuple) -> Optional[bytes]:
+    """
+    Return the cached response body for this user and request key, or None on a miss or expired entry.
+    """
+    cache_key = _key(user_id, key)
+    entry = _cache.get(cache_key)
+    if entry is None:
+        return None
+
+    stored_at, body = entry
+    if time.monotonic() - stored_at >= _CACHE_TTL_SECONDS:
+        del _cache[cache_key]
+        return None
+
+    _cache.move_to_end(cache_key)
+    return body
+
+
+def store(user_id: str, key: tuple, body: bytes) -> None:
+    """
+    Cache a serialized response body, evicting the least recently used entry when full.
+    """
+    cache_key = _key(user_id, key)
+    _cache[cache_key] = (time.monotonic(), body)
+    _cache.move_to_end(cache_key)
+    while len(_cache) > _CACHE_MAX_ENTRIES:
+        _cache.popitem(last=False)
+
+
+def invalidate_user(user_id: str) -> None:
+    """
+    Drop every cached response for a user; call after any write that changes their analytics.
+
+    Bumping the generation makes old keys unreachable, so they age out through LRU eviction.
+    """
+    _generations[user_id] = _generations.get(user_id, 0) + 1
+
+
+def etag_for(body: bytes) -> str:
+    """
+    Strong ETag for a serialized response body; equal bodies always get equal tags, whichever worker built them.
+    """
+    return f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Whether an If-None-Match header value covers `etag` (handles `*`, lists and weak `W/` tags).
+    """
+    if not if_none_match:
+        return False
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
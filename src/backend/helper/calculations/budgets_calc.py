@@ -3,7 +3,7 @@ from typing import List, Optional
 import datetime
 import logging
 
-from ...schemas.base import BudgetPlan, BudgetPlanRow
+from ...schemas.base import BudgetPlan, BudgetPlanRow, to_cents
 from ...schemas.responses import (
     BudgetResponse, 
     BudgetSummaryResponse,
@@ -47,7 +47,7 @@ def get_month_budget_view(
             # The database column is 'plan_json', which should match BudgetPlan structure
             raw_plan = plan_response.data[0].get(BUDGET_COLUMNS.PLAN_JSON.value)
             if raw_plan:
-                plan_model = BudgetPlan(**raw_plan)
+                plan_model = BudgetPlan.model_validate(raw_plan)
                 plan_rows = plan_model.rows
         
         # If no plan exists, we have an empty list of rows. We still proceed to return empty structures.
@@ -90,12 +90,14 @@ def get_month_budget_view(
                 # Aggregate in memory (python) or Polars. 
                 # Since we filtered by specific categories, data volume should be manageable.
                 # Let's use simple python dict for speed on small lists.
+                # Sums are kept in integer cents (exact, no Decimal per row); Decimal is built once per category.
+                actual_cents: dict[int, int] = {}
                 for tx in tx_response.data:
                     c_id = tx.get(TRANSACTIONS_COLUMNS.CATEGORY_ID.value)
                     amt = tx.get(TRANSACTIONS_COLUMNS.AMOUNT.value, 0)
                     if c_id is not None:
-                        current = actuals_map.get(c_id, Decimal(0))
-                        actuals_map[c_id] = current + Decimal(str(amt))
+                        actual_cents[c_id] = actual_cents.get(c_id, 0) + to_cents(amt)
+                actuals_map = {c_id: Decimal(cents).scaleb(-2) for c_id, cents in actual_cents.items()}
 
         # 4. Enrich Plan Rows & Split by Group -> Extracted to helper
         # 5. Summary Calculation -> Extracted to helper
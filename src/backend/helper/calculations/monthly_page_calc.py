@@ -3,7 +3,7 @@
 import calendar
 import logging
 from datetime import date, timedelta
-from typing import List, Tuple, Dict, Any, cast
+from typing import List, Tuple, Dict, Any, Optional, cast
 from pydantic import BaseModel, Field
 
 from ..columns import TRANSACTIONS_COLUMNS
@@ -184,8 +184,10 @@ def _apply_currency_conversion(df: pl.DataFrame, base_currency: str) -> pl.DataF
     if df.is_empty() or 'currency' not in df.columns:
         return df
     from ..exchange_rates import get_rate
-    currencies = df['currency'].fill_null(base_currency).to_list()
-    rates = pl.Series('_rate', [get_rate(c, base_currency) for c in currencies], dtype=pl.Float64)
+    currencies = df['currency'].fill_null(base_currency)
+    # Look each distinct currency up once, then map the rates onto the rows in polars
+    rate_by_currency = {c: get_rate(c, base_currency) for c in currencies.unique().to_list()}
+    rates = currencies.replace_strict(rate_by_currency, return_dtype=pl.Float64)
     return df.with_columns([
         (pl.col('amount') * rates).alias('amount'),
         (pl.col('abs_amount') * rates).alias('abs_amount'),
@@ -199,19 +201,28 @@ def _calculate_monthly_totals(df: pl.DataFrame) -> MonthlyTotals:
     if df.is_empty():
         return MonthlyTotals(income=0.0, expenses=0.0, savings=0.0, investments=0.0, profit=0.0, cashflow=0.0)
 
+    # All sums in a single Polars pass instead of one filter/scan per total
+    category_type = pl.col('category_type')
+    is_income = category_type == 'income'
+    sums = df.select(
+        pl.col('amount').filter(is_income).sum().alias('income'),
+        pl.col('amount').filter(is_income & (pl.col('category_name') == 'Savings Funds Withdrawal')).sum().alias('savings_fund_income'),
+        pl.col('abs_amount').filter(category_type == 'expense').sum().alias('expenses'),
+        pl.col('abs_amount').filter(category_type == 'saving').sum().alias('savings'),
+        pl.col('abs_amount').filter(category_type == 'investment').sum().alias('investments'),
+    ).row(0, named=True)
+
     # Income
-    income_df = df.filter(pl.col('category_type') == 'income')
-    total_income = income_df.select(pl.col('amount').sum()).item() or 0.0
-    
-    savings_fund_income = income_df.filter(pl.col('category_name') == 'Savings Funds Withdrawal').select(pl.col('amount').sum()).item() or 0.0
+    total_income = sums['income'] or 0.0
+    savings_fund_income = sums['savings_fund_income'] or 0.0
     total_income_wo_savings_funds = total_income - savings_fund_income
 
     # Expenses, savings, investments (absolute)
-    total_expenses = df.filter(pl.col('category_type') == 'expense').select(pl.col('abs_amount').sum()).item() or 0.0
-    total_savings = df.filter(pl.col('category_type') == 'saving').select(pl.col('abs_amount').sum()).item() or 0.0
+    total_expenses = sums['expenses'] or 0.0
+    total_savings = sums['savings'] or 0.0
     # Net savings = (Total Savings (abs)) - (Withdrawals (positive))
     total_savings_w_withdrawals = total_savings - savings_fund_income
-    total_investments = df.filter(pl.col('category_type') == 'investment').select(pl.col('abs_amount').sum()).item() or 0.0
+    total_investments = sums['investments'] or 0.0
     
     # Profit and Cashflow
     # Profit = Clean Income - Expenses - Investments
@@ -227,12 +238,14 @@ def _calculate_monthly_totals(df: pl.DataFrame) -> MonthlyTotals:
         cashflow=round(cashflow, 2)
     )
 
-def _calculate_run_rate(df: pl.DataFrame, year: int, month: int) -> RunRateForecast:
+def _calculate_run_rate(df: pl.DataFrame, year: int, month: int, today: Optional[date] = None) -> RunRateForecast:
     """
     Calculate daily run-rate and month-end forecast.
+
+    `today` defaults to the current date; pass it to evaluate the forecast as of a fixed day.
     """
     total_days = calendar.monthrange(year, month)[1]
-    today = date.today()
+    today = today or date.today()
     
     # If analyzing past month, full duration. If current month, partial.
     if year < today.year or (year == today.year and month < today.month):
@@ -269,37 +282,19 @@ def _calculate_day_split(df: pl.DataFrame) -> DaySplit:
     if df.is_empty():
         return DaySplit(average_weekday_spend=0.0, average_weekend_spend=0.0)
         
-    expenses = df.filter(pl.col('category_type') == 'expense')
-    if expenses.is_empty():
-        return DaySplit(average_weekday_spend=0.0, average_weekend_spend=0.0)
-    
-    # Extract weekday: 1 (Mon) - 7 (Sun)
-    # Polars dt.weekday(): 1=Mon, 7=Sun
-    expenses = expenses.with_columns(
-        pl.col('date_parsed').dt.weekday().alias('weekday_iso')
-    )
-    
-    # Weekday: 1-5, Weekend: 6-7
-    weekday_exp = expenses.filter(pl.col('weekday_iso') <= 5)
-    weekend_exp = expenses.filter(pl.col('weekday_iso') >= 6)
-    
-    # We need unique dates with spending to calculate valid average
-    # Or should we divide by total weekdays/weekends in that period?
-    # Simple approach: sum / count of days *with transactions* OR sum / count of distinct dates found
-    # Better: sum / count of distinct dates where spending happened.
-    # If we want true daily average including zero days, we'd need to know the full date range range.
-    # Let's use count of days in the DF for now, as filling zeros is complex without generating date range series.
-    # Actually, simpler metrics are usually just average of spend days.
-    
-    def calc_avg(sub_df):
-        if sub_df.is_empty(): return 0.0
-        total = sub_df.select(pl.col('abs_amount').sum()).item() or 0.0
-        # Count unique days
-        n_days = sub_df.select(pl.col('date_parsed').n_unique()).item()
-        return total / n_days if n_days > 0 else 0.0
-        
-    avg_weekday = calc_avg(weekday_exp)
-    avg_weekend = calc_avg(weekend_exp)
+    # Average of spend days: total over the distinct dates that had spending, so zero days are not counted.
+    # Polars dt.weekday(): 1=Mon ... 7=Sun; weekend is 6-7. All four aggregates come out of one pass
+    is_expense = pl.col('category_type') == 'expense'
+    is_weekend = pl.col('date_parsed').dt.weekday() >= 6
+    weekday_total, weekday_days, weekend_total, weekend_days = df.select(
+        pl.col('abs_amount').filter(is_expense & ~is_weekend).sum().alias('weekday_total'),
+        pl.col('date_parsed').filter(is_expense & ~is_weekend).n_unique().alias('weekday_days'),
+        pl.col('abs_amount').filter(is_expense & is_weekend).sum().alias('weekend_total'),
+        pl.col('date_parsed').filter(is_expense & is_weekend).n_unique().alias('weekend_days'),
+    ).row(0)
+
+    avg_weekday = (weekday_total or 0.0) / weekday_days if weekday_days > 0 else 0.0
+    avg_weekend = (weekend_total or 0.0) / weekend_days if weekend_days > 0 else 0.0
     
     return DaySplit(
         average_weekday_spend=round(avg_weekday, 2),
@@ -330,8 +325,8 @@ def _calculate_concentration(df: pl.DataFrame) -> CategoryConcentration:
     share_pct = (top_3_sum / total_expenses) * 100
     
     top_cats = [
-        CategoryBreakdownData(category=row['category_name'], total=round(row['total'], 2))
-        for row in cat_breakdown.iter_rows(named=True)
+        CategoryBreakdownData(category=category, total=round(total, 2))
+        for category, total in cat_breakdown.select('category_name', 'total').iter_rows()
     ]
     
     return CategoryConcentration(
@@ -373,23 +368,19 @@ def _calculate_daily_spending_heatmap(df: pl.DataFrame) -> List[DailySpendingDat
     if df.is_empty():
         return []
 
+    # Format the ISO day inside Polars and iterate plain tuples, so no per-row dicts or date objects are built
     daily_spending = (
-        df.filter(pl.col('category_type') == 'expense')
+        df.filter((pl.col('category_type') == 'expense') & pl.col('date_parsed').is_not_null())
           .group_by('date_parsed')
           .agg(pl.col('abs_amount').sum())
           .sort('date_parsed')
+          .select(pl.col('date_parsed').dt.strftime('%Y-%m-%d'), 'abs_amount')
     )
-    
-    result = []
-    for row in daily_spending.iter_rows(named=True):
-        if row['date_parsed']:
-            result.append(
-                DailySpendingData(
-                    day=row['date_parsed'].isoformat(),
-                    amount=round(row['abs_amount'], 2)
-                )
-            )
-    return result
+
+    return [
+        DailySpendingData(day=day, amount=round(amount, 2))
+        for day, amount in daily_spending.iter_rows()
+    ]
 
 
 
@@ -410,11 +401,8 @@ def _calculate_category_breakdown(df: pl.DataFrame, cat_type: str = 'expense') -
         return []
         
     return [
-        CategoryBreakdownData(
-            category=str(row['category_name']),
-            total=round(row['abs_amount'], 2)
-        )
-        for row in category_data.iter_rows(named=True)
+        CategoryBreakdownData(category=str(category), total=round(total, 2))
+        for category, total in category_data.select('category_name', 'abs_amount').iter_rows()
     ]
 
 
@@ -425,26 +413,25 @@ def _calculate_spending_type_breakdown(df: pl.DataFrame) -> List[SpendingTypeBre
     if df.is_empty():
         return []
 
-    breakdown = []
-    
+    is_expense = pl.col('category_type') == 'expense'
     configs = [
-        ('Core', (pl.col('category_type') == 'expense') & (pl.col('spending_type') == 'Core')),
-        ('Necessary', (pl.col('category_type') == 'expense') & (pl.col('spending_type') == 'Necessary')),
-        ('Fun', (pl.col('category_type') == 'expense') & (pl.col('spending_type') == 'Fun')),
+        ('Core', is_expense & (pl.col('spending_type') == 'Core')),
+        ('Necessary', is_expense & (pl.col('spending_type') == 'Necessary')),
+        ('Fun', is_expense & (pl.col('spending_type') == 'Fun')),
         ('Future', pl.col('spending_type') == 'Future'),
     ]
-    
-    for type_name, condition in configs:
-        amount = df.filter(condition).select(pl.col('abs_amount').sum()).item()
-        if amount and amount > 0:
-            breakdown.append(
-                SpendingTypeBreakdownData(
-                    type=type_name,
-                    amount=round(amount, 2)
-                )
-            )
-    
-    return breakdown
+
+    # One select computes every bucket in a single pass over the frame
+    amounts = df.select(
+        pl.col('abs_amount').filter(condition).sum().alias(type_name)
+        for type_name, condition in configs
+    ).row(0)
+
+    return [
+        SpendingTypeBreakdownData(type=type_name, amount=round(amount, 2))
+        for (type_name, _), amount in zip(configs, amounts)
+        if amount and amount > 0
+    ]
 
 
 # ================================================================================================
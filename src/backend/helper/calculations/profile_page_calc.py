@@ -2,7 +2,8 @@ from ...auth.auth import api_key_auth, get_current_user
 from ...helper import environment as env
 from ...schemas.base import (
     IdentityData,
-    ProfileData
+    ProfileData,
+    ProfileExtensions,
 )
 
 from typing import Any
@@ -29,6 +30,19 @@ def _extract_identity_data(user_data: Any) -> list[IdentityData]:
     ]
 
 
+def _build_profile_extensions(user_data: Any) -> ProfileExtensions | None:
+    """
+    Collect the rarely-set profile fields, or None when none of them has a value.
+    """
+    extensions = {
+        field: getattr(user_data, field, None)
+        for field in ProfileExtensions.model_fields
+    }
+    if all(value is None for value in extensions.values()):
+        return None
+    return ProfileExtensions(**extensions)
+
+
 def _build_profile_data(user_data: Any) -> ProfileData:
     """
     Build a ProfileData object from Supabase user data.
@@ -40,32 +54,24 @@ def _build_profile_data(user_data: Any) -> ProfileData:
         role=getattr(user_data, 'role', None),
         is_anonymous=getattr(user_data, 'is_anonymous', False),
         
-        # Email information
+        # Contact information
         email=getattr(user_data, 'email', None),
         email_confirmed_at=getattr(user_data, 'email_confirmed_at', None),
-        email_change_sent_at=getattr(user_data, 'email_change_sent_at', None),
-        new_email=getattr(user_data, 'new_email', None),
-        
-        # Phone information
         phone=getattr(user_data, 'phone', ""),
-        phone_confirmed_at=getattr(user_data, 'phone_confirmed_at', None),
-        new_phone=getattr(user_data, 'new_phone', None),
         
         # Authentication timestamps
         created_at=getattr(user_data, 'created_at', None),
         updated_at=getattr(user_data, 'updated_at', None),
         last_sign_in_at=getattr(user_data, 'last_sign_in_at', None),
         confirmed_at=getattr(user_data, 'confirmed_at', None),
-        confirmation_sent_at=getattr(user_data, 'confirmation_sent_at', None),
-        recovery_sent_at=getattr(user_data, 'recovery_sent_at', None),
-        invited_at=getattr(user_data, 'invited_at', None),
         
         # Metadata
         app_metadata=getattr(user_data, 'app_metadata', {}),
         user_metadata=getattr(user_data, 'user_metadata', {}),
         
-        # Identity and security
+        # Identity providers
         identities=_extract_identity_data(user_data),
-        factors=getattr(user_data, 'factors', None),
-        action_link=getattr(user_data, 'action_link', None)
-    )
\ No newline at end of file
+
+        # Rarely-set fields
+        extensions=_build_profile_extensions(user_data),
+    )
@@ -3,7 +3,6 @@
 import logging
 from datetime import date, timedelta
 from typing import List, Dict, Optional, Tuple, Any, cast
-from decimal import Decimal
 from pydantic import BaseModel, Field
 
 from ..columns import TRANSACTIONS_COLUMNS
@@ -16,7 +15,8 @@ from ...schemas.base import (
     TransactionData,
     SummaryData,
     PeriodComparison,
-    CategoryInsight
+    CategoryInsight,
+    to_cents
 )
 
 
@@ -233,8 +233,10 @@ def _apply_currency_conversion(df: pl.DataFrame, base_currency: str) -> pl.DataF
     if df.is_empty() or 'currency' not in df.columns:
         return df
     from ..exchange_rates import get_rate
-    currencies = df['currency'].fill_null(base_currency).to_list()
-    rates = pl.Series('_rate', [get_rate(c, base_currency) for c in currencies], dtype=pl.Float64)
+    currencies = df['currency'].fill_null(base_currency)
+    # Look each distinct currency up once, then map the rates onto the rows in polars
+    rate_by_currency = {c: get_rate(c, base_currency) for c in currencies.unique().to_list()}
+    rates = currencies.replace_strict(rate_by_currency, return_dtype=pl.Float64)
     return df.with_columns([
         (pl.col('amount') * rates).alias('amount'),
         (pl.col('abs_amount') * rates).alias('abs_amount'),
@@ -248,18 +250,20 @@ def _calculate_summary_totals(df: pl.DataFrame) -> SummaryTotals:
     if df.is_empty():
         return SummaryTotals()
 
-    # Income
-    income_df = df.filter(pl.col('category_type') == 'income')
-    total_income = income_df.select(pl.col('amount').sum()).item() or 0.0
-    
-    savings_fund_income = income_df.filter(pl.col('category_name') == 'Savings Funds Withdrawal').select(pl.col('amount').sum()).item() or 0.0
-    total_income_wo_savings_funds = total_income - savings_fund_income
+    # Every per-type total in one pass; income is signed, expenses/savings/investments are absolute
+    is_income = pl.col('category_type') == 'income'
+    total_income, savings_fund_income, total_expense, total_saving, total_investment = (
+        value or 0.0 for value in df.select(
+            pl.col('amount').filter(is_income).sum().alias('income'),
+            pl.col('amount').filter(is_income & (pl.col('category_name') == 'Savings Funds Withdrawal')).sum().alias('savings_fund_income'),
+            pl.col('abs_amount').filter(pl.col('category_type') == 'expense').sum().alias('expense'),
+            pl.col('abs_amount').filter(pl.col('category_type') == 'saving').sum().alias('saving'),
+            pl.col('abs_amount').filter(pl.col('category_type') == 'investment').sum().alias('investment'),
+        ).row(0)
+    )
 
-    # Expenses, savings, investments (absolute)
-    total_expense = df.filter(pl.col('category_type') == 'expense').select(pl.col('abs_amount').sum()).item() or 0.0
-    total_saving = df.filter(pl.col('category_type') == 'saving').select(pl.col('abs_amount').sum()).item() or 0.0
+    total_income_wo_savings_funds = total_income - savings_fund_income
     total_saving_w_withdrawals = total_saving - savings_fund_income
-    total_investment = df.filter(pl.col('category_type') == 'investment').select(pl.col('abs_amount').sum()).item() or 0.0
     
     # Calculate profit and cashflow
     profit = total_income_wo_savings_funds - total_expense - total_investment
@@ -314,12 +318,12 @@ def _get_top_expenses(df: pl.DataFrame) -> List[CategoryInsight]:
     if total_expense == 0:
         return []
 
-    # Group by category
+    # Group by category; top_k is a partial selection (no full sort of all categories)
     top_cats = (
         expense_df.group_by('category_name')
         .agg(pl.col('abs_amount').sum().alias('total'))
+        .top_k(3, by='total')
         .sort('total', descending=True)
-        .head(3)
     )
     
     results = []
@@ -381,9 +385,11 @@ def _get_biggest_mover(current_df: pl.DataFrame, previous_df: pl.DataFrame) -> O
     if joined.is_empty():
         return None
         
-    # Find max absolute delta
-    # Sort by absolute delta desc
-    biggest = joined.sort(pl.col('delta').abs(), descending=True).row(0, named=True)
+    # Find max absolute delta (single O(n) pass instead of sorting the whole frame)
+    biggest_idx = joined.get_column('delta').abs().arg_max()
+    if biggest_idx is None:
+        return None
+    biggest = joined.row(biggest_idx, named=True)
     
     # Should we return the details of the 'current' period for this category?
     # The requirement says: "name + total + share of total expenses" (implied format for insights, though 'biggest mover' might just need name & delta)
@@ -424,7 +430,7 @@ def _get_largest_transactions(df: pl.DataFrame, limit: int = 5) -> List[Transact
             user_id_fk=str(row.get('user_id_fk', '')) if row.get('user_id_fk') else None,
             account_id_fk=str(row.get('account_id_fk', '')),
             category_id_fk=int(row.get('category_id_fk', 0)),
-            amount=Decimal(str(row.get('amount', 0))), # Original signed amount
+            amount_cents=to_cents(row.get('amount', 0)), # Original signed amount
             date=date.fromisoformat(row['date']) if row.get('date') else date.today(),
             notes=row.get('notes'),
             created_at=None, # Optional
@@ -462,8 +468,6 @@ def _calculate_enriched_summary(current_df: pl.DataFrame, previous_df: pl.DataFr
         total_expense=current_totals.expense,
         total_saving=current_totals.saving,
         total_investment=current_totals.investment,
-        profit=current_totals.profit,
-        net_cash_flow=current_totals.net_cash_flow,
         comparison=comparison,
         savings_rate=savings_rate,
         investment_rate=investment_rate,
@@ -2,7 +2,7 @@
 # imports
 import calendar
 from datetime import date
-from typing import List, Dict, Optional, Any, cast
+from typing import List, Dict, Optional, Any, Tuple, cast
 from pydantic import BaseModel, Field
 
 from ..columns import TRANSACTIONS_COLUMNS
@@ -12,6 +12,7 @@ import polars as pl
 
 # schemas
 from ...schemas.base import (
+    CategoryAmounts,
     YearlyAnalyticsData, 
     EmergencyFundData,
     YearlyHighlights,
@@ -58,10 +59,10 @@ class MonthlyDataPoint(BaseModel):
     
 class CategoryBreakdowns(BaseModel):
     """Internal data class for category breakdowns"""
-    by_category: Dict[str, float] = Field(default_factory=dict)
-    core_categories: Dict[str, float] = Field(default_factory=dict)
-    income_by_category: Dict[str, float] = Field(default_factory=dict)
-    expense_by_category: Dict[str, float] = Field(default_factory=dict)
+    by_category: CategoryAmounts = ()
+    core_categories: CategoryAmounts = ()
+    income_by_category: CategoryAmounts = ()
+    expense_by_category: CategoryAmounts = ()
 
 
 # ================================================================================================
@@ -195,8 +196,10 @@ def _apply_currency_conversion(df: pl.DataFrame, base_currency: str) -> pl.DataF
     if df.is_empty() or 'currency' not in df.columns:
         return df
     from ..exchange_rates import get_rate
-    currencies = df['currency'].fill_null(base_currency).to_list()
-    rates = pl.Series('_rate', [get_rate(c, base_currency) for c in currencies], dtype=pl.Float64)
+    currencies = df['currency'].fill_null(base_currency)
+    # Look each distinct currency up once, then map the rates onto the rows in polars
+    rate_by_currency = {c: get_rate(c, base_currency) for c in currencies.unique().to_list()}
+    rates = currencies.replace_strict(rate_by_currency, return_dtype=pl.Float64)
     return df.with_columns([
         (pl.col('amount') * rates).alias('amount'),
         (pl.col('abs_amount') * rates).alias('abs_amount'),
@@ -217,86 +220,38 @@ def _calculate_monthly_aggregations(df: pl.DataFrame, monthly_data: Dict[str, Mo
     if df.is_empty():
         return monthly_data
 
-    # Group by month and category type
-    monthly_groups = (
-        df.group_by(['month_name', 'category_type'])
-          .agg([
-              pl.col('amount').sum().alias('amount'),
-              pl.col('abs_amount').sum().alias('abs_amount')
-          ])
-    )
-    
-    # 1. Income (total)
-    income_rows = monthly_groups.filter(pl.col('category_type') == 'income')
-    for row in income_rows.iter_rows(named=True):
-        if row['month_name'] in monthly_data:
-            monthly_data[row['month_name']].income = row['amount']
-    
-    # 2. Income wo savings funds
-    income_wo_savings = (
-        df.filter(pl.col('category_type') == 'income')
-          .group_by('month_name')
+    category_type = pl.col('category_type')
+    withdrawal = (category_type == 'income') & (pl.col('category_name') == 'Savings Funds Withdrawal')
+
+    # Every monthly series is a filtered sum, so all of them come out of a single group_by pass
+    monthly_sums = (
+        df.group_by('month_name')
           .agg([
-              (pl.col('amount').sum() - 
-               pl.col('amount').filter(pl.col('category_name') == 'Savings Funds Withdrawal').sum().fill_null(0.0)
-              ).alias('income_wo_savings_funds')
+              pl.col('amount').filter(category_type == 'income').sum().alias('income'),
+              pl.col('amount').filter(withdrawal).sum().alias('withdrawals'),
+              pl.col('abs_amount').filter(category_type == 'expense').sum().alias('expense'),
+              pl.col('abs_amount').filter(category_type == 'saving').sum().alias('saving'),
+              pl.col('abs_amount').filter(category_type == 'investment').sum().alias('investment'),
+              pl.col('abs_amount').filter((category_type == 'expense') & (pl.col('spending_type') == 'Core')).sum().alias('core_expense'),
+              pl.col('abs_amount').filter((category_type == 'expense') & (pl.col('spending_type') == 'Fun')).sum().alias('fun_expense'),
+              pl.col('abs_amount').filter(category_type.is_in(['saving', 'investment']) & (pl.col('spending_type') == 'Future')).sum().alias('future_expense'),
           ])
     )
-    for row in income_wo_savings.iter_rows(named=True):
-        if row['month_name'] in monthly_data:
-            monthly_data[row['month_name']].income_wo_savings_funds = row['income_wo_savings_funds']
-            
-    # 3. Expenses
-    expense_rows = monthly_groups.filter(pl.col('category_type') == 'expense')
-    for row in expense_rows.iter_rows(named=True):
-        if row['month_name'] in monthly_data:
-            monthly_data[row['month_name']].expense = row['abs_amount']
-            
-    # 4. Savings
-    saving_rows = monthly_groups.filter(pl.col('category_type') == 'saving')
-    for row in saving_rows.iter_rows(named=True):
-        if row['month_name'] in monthly_data:
-            monthly_data[row['month_name']].saving = row['abs_amount']
-            
-    # 5. Withdrawals
-    savings_withdrawals = (
-        df.filter((pl.col('category_type') == 'income') & (pl.col('category_name') == 'Savings Funds Withdrawal'))
-          .group_by('month_name')
-          .agg(pl.col('amount').sum().alias('amount'))
-    )
-    withdrawals_map = {row['month_name']: row['amount'] for row in savings_withdrawals.iter_rows(named=True)}
-    for month in monthly_data.keys():
-        monthly_data[month].savings_w_withdrawals = monthly_data[month].saving - withdrawals_map.get(month, 0.0)
-        
-    # 6. Investment
-    investment_rows = monthly_groups.filter(pl.col('category_type') == 'investment')
-    for row in investment_rows.iter_rows(named=True):
-        if row['month_name'] in monthly_data:
-            monthly_data[row['month_name']].investment = row['abs_amount']
-            
-    # 7. Core/Fun
-    expense_details = (
-        df.filter(pl.col('category_type') == 'expense')
-          .group_by(['month_name', 'spending_type'])
-          .agg(pl.col('abs_amount').sum())
-    )
-    for row in expense_details.iter_rows(named=True):
-        m = row['month_name']
-        if m in monthly_data:
-            if row['spending_type'] == 'Core':
-                monthly_data[m].core_expense = row['abs_amount']
-            elif row['spending_type'] == 'Fun':
-                monthly_data[m].fun_expense = row['abs_amount']
-                
-    # 8. Future
-    future_rows = (
-        df.filter(pl.col('category_type').is_in(['saving', 'investment']) & (pl.col('spending_type') == 'Future'))
-          .group_by('month_name')
-          .agg(pl.col('abs_amount').sum())
-    )
-    for row in future_rows.iter_rows(named=True):
-        if row['month_name'] in monthly_data:
-            monthly_data[row['month_name']].future_expense = row['abs_amount']
+
+    for month, income, withdrawals, expense, saving, investment, core, fun, future in monthly_sums.iter_rows():
+        if month not in monthly_data:
+            continue
+        monthly_data[month] = MonthlyDataPoint(
+            income=income,
+            income_wo_savings_funds=income - withdrawals,
+            expense=expense,
+            saving=saving,
+            savings_w_withdrawals=saving - withdrawals,
+            investment=investment,
+            core_expense=core,
+            fun_expense=fun,
+            future_expense=future,
+        )
 
     return monthly_data
 
@@ -306,22 +261,32 @@ def _calculate_yearly_totals(df: pl.DataFrame) -> YearlyTotals:
     if df.is_empty():
         return YearlyTotals()
 
-    def get_sum(cond, col='abs_amount'):
-        res = df.filter(cond).select(pl.col(col).sum()).item()
-        return res if res else 0.0
+    category_type = pl.col('category_type')
+    abs_amount = pl.col('abs_amount')
+
+    # All totals are filtered sums over the same frame, so they are reduced in a single select
+    (
+        total_income,  # Using abs since income is positive
+        savings_fund_income,
+        total_expense,
+        total_saving,
+        total_investment,
+        total_core_expense,
+        total_fun_expense,
+        total_future_expense,
+    ) = df.select([
+        abs_amount.filter(category_type == 'income').sum().alias('income'),
+        abs_amount.filter((category_type == 'income') & (pl.col('category_name') == 'Savings Funds Withdrawal')).sum().alias('savings_fund_income'),
+        abs_amount.filter(category_type == 'expense').sum().alias('expense'),
+        abs_amount.filter(category_type == 'saving').sum().alias('saving'),
+        abs_amount.filter(category_type == 'investment').sum().alias('investment'),
+        abs_amount.filter((category_type == 'expense') & (pl.col('spending_type') == 'Core')).sum().alias('core_expense'),
+        abs_amount.filter((category_type == 'expense') & (pl.col('spending_type') == 'Fun')).sum().alias('fun_expense'),
+        abs_amount.filter(category_type.is_in(['saving', 'investment']) & (pl.col('spending_type') == 'Future')).sum().alias('future_expense'),
+    ]).row(0)
 
-    total_income = get_sum(pl.col('category_type') == 'income', 'abs_amount') # Using abs since income is positive
-    savings_fund_income = get_sum((pl.col('category_type') == 'income') & (pl.col('category_name') == 'Savings Funds Withdrawal'), 'abs_amount')
     total_income_wo_savings_funds = total_income - savings_fund_income
-    
-    total_expense = get_sum(pl.col('category_type') == 'expense')
-    total_saving = get_sum(pl.col('category_type') == 'saving')
     total_savings_w_withdrawals = total_saving - savings_fund_income
-    total_investment = get_sum(pl.col('category_type') == 'investment')
-    
-    total_core_expense = get_sum((pl.col('category_type') == 'expense') & (pl.col('spending_type') == 'Core'))
-    total_fun_expense = get_sum((pl.col('category_type') == 'expense') & (pl.col('spending_type') == 'Fun'))
-    total_future_expense = get_sum(pl.col('category_type').is_in(['saving', 'investment']) & (pl.col('spending_type') == 'Future'))
 
     profit = total_income_wo_savings_funds - total_expense - total_investment
     
@@ -354,47 +319,82 @@ def _calculate_category_breakdowns(df: pl.DataFrame) -> CategoryBreakdowns:
     if df.is_empty():
         return CategoryBreakdowns()
 
-    def group_to_dict(cond, col='amount'):
-        res_df = df.filter(cond).group_by('category_name').agg(pl.col(col).sum())
-        return {row['category_name']: round(row[col], 2) for row in res_df.iter_rows(named=True)}
+    is_core = (pl.col('category_type') == 'expense') & (pl.col('spending_type') == 'Core')
+    is_income = pl.col('category_type') == 'income'
+    is_expense = pl.col('category_type') == 'expense'
+
+    # One group_by yields all four breakdowns; the *_rows flags keep categories that had no matching rows out
+    per_category = (
+        df.group_by('category_name')
+          .agg([
+              pl.col('amount').sum().alias('total'),
+              pl.col('abs_amount').filter(is_core).sum().alias('core'),
+              is_core.any().alias('core_rows'),
+              pl.col('amount').filter(is_income).sum().alias('income'),
+              is_income.any().alias('income_rows'),
+              pl.col('abs_amount').filter(is_expense).sum().alias('expense'),
+              is_expense.any().alias('expense_rows'),
+          ])
+    )
 
-    by_category = group_to_dict(pl.lit(True), 'amount')
-    core_categories = group_to_dict((pl.col('category_type') == 'expense') & (pl.col('spending_type') == 'Core'), 'abs_amount')
-    income_by_category = group_to_dict(pl.col('category_type') == 'income', 'amount')
-    expense_by_category = group_to_dict(pl.col('category_type') == 'expense', 'abs_amount')
+    by_category: List[Tuple[str, float]] = []
+    core_categories: List[Tuple[str, float]] = []
+    income_by_category: List[Tuple[str, float]] = []
+    expense_by_category: List[Tuple[str, float]] = []
+    for name, total, core, core_rows, income, income_rows, expense, expense_rows in per_category.iter_rows():
+        by_category.append((name, round(total, 2)))
+        if core_rows:
+            core_categories.append((name, round(core, 2)))
+        if income_rows:
+            income_by_category.append((name, round(income, 2)))
+        if expense_rows:
+            expense_by_category.append((name, round(expense, 2)))
 
     return CategoryBreakdowns(
-        by_category=by_category,
-        core_categories=core_categories,
-        income_by_category=income_by_category,
-        expense_by_category=expense_by_category
+        by_category=_largest_first(by_category),
+        core_categories=_largest_first(core_categories),
+        income_by_category=_largest_first(income_by_category),
+        expense_by_category=_largest_first(expense_by_category)
     )
 
+def _largest_first(pairs: List[Tuple[str, float]]) -> CategoryAmounts:
+    """Order (category, amount) pairs largest amount first; ties by name so group_by order never leaks out."""
+    return tuple(sorted(pairs, key=lambda pair: (-pair[1], pair[0])))
+
 def _prepare_monthly_arrays(monthly_data: Dict[str, MonthlyDataPoint]) -> dict:
     """Prepare monthly data arrays for chart visualization."""
-    months = list(monthly_data.keys())
-    
-    return {
-        'months': months,
-        'monthly_income': [round(monthly_data[month].income_wo_savings_funds, 2) for month in months],
-        'monthly_expense': [round(monthly_data[month].expense, 2) for month in months],
-        'monthly_saving': [round(monthly_data[month].savings_w_withdrawals, 2) for month in months],
-        'monthly_investment': [round(monthly_data[month].investment, 2) for month in months],
-        'monthly_core_expense': [round(monthly_data[month].core_expense, 2) for month in months],
-        'monthly_fun_expense': [round(monthly_data[month].fun_expense, 2) for month in months],
-        'monthly_future_expense': [round(monthly_data[month].future_expense, 2) for month in months],
-        'monthly_savings_rate': [
-            round((monthly_data[month].savings_w_withdrawals / monthly_data[month].income_wo_savings_funds * 100) 
-                  if monthly_data[month].income_wo_savings_funds > 0 else 0, 2) 
-            for month in months
-        ],
-        'monthly_investment_rate': [
-            round((monthly_data[month].investment / monthly_data[month].income_wo_savings_funds * 100) 
-                  if monthly_data[month].income_wo_savings_funds > 0 else 0, 2) 
-            for month in months
-        ]
+    arrays: Dict[str, list] = {
+        'months': list(monthly_data.keys()),
+        'monthly_income': [],
+        'monthly_expense': [],
+        'monthly_saving': [],
+        'monthly_investment': [],
+        'monthly_core_expense': [],
+        'monthly_fun_expense': [],
+        'monthly_future_expense': [],
+        'monthly_savings_rate': [],
+        'monthly_investment_rate': [],
     }
 
+    # One pass over the months fills every series column-wise
+    for point in monthly_data.values():
+        income = point.income_wo_savings_funds
+        arrays['monthly_income'].append(round(income, 2))
+        arrays['monthly_expense'].append(round(point.expense, 2))
+        arrays['monthly_saving'].append(round(point.savings_w_withdrawals, 2))
+        arrays['monthly_investment'].append(round(point.investment, 2))
+        arrays['monthly_core_expense'].append(round(point.core_expense, 2))
+        arrays['monthly_fun_expense'].append(round(point.fun_expense, 2))
+        arrays['monthly_future_expense'].append(round(point.future_expense, 2))
+        arrays['monthly_savings_rate'].append(
+            round(point.savings_w_withdrawals / income * 100, 2) if income > 0 else 0
+        )
+        arrays['monthly_investment_rate'].append(
+            round(point.investment / income * 100, 2) if income > 0 else 0
+        )
+
+    return arrays
+
 def _calculate_highlights(monthly_data: Dict[str, MonthlyDataPoint]) -> YearlyHighlights:
     """Calculate best/worst months highlights."""
     
@@ -686,21 +686,21 @@ def _prepare_emergency_fund_dataframe(transactions: List[dict]) -> pl.DataFrame:
     return cast(pl.DataFrame, df)
 
 
-def _calculate_core_expenses(df: pl.DataFrame) -> tuple[Dict[str, float], Dict[str, float]]:
-    """Calculate core expenses by month and category."""
+def _calculate_core_expenses(df: pl.DataFrame) -> tuple[Dict[str, float], CategoryAmounts]:
+    """Calculate core expenses by month and category (categories largest first)."""
     if df.is_empty():
-        return {}, {}
+        return {}, ()
 
     core_expenses_df = df.filter((pl.col('category_type') == 'expense') & (pl.col('spending_type') == 'Core'))
     
     if core_expenses_df.is_empty():
-        return {}, {}
+        return {}, ()
 
     monthly_agg = core_expenses_df.group_by('month_key').agg(pl.col('abs_amount').sum())
     monthly_core_expenses = {row['month_key']: row['abs_amount'] for row in monthly_agg.iter_rows(named=True)}
     
     category_agg = core_expenses_df.group_by('category_name').agg(pl.col('abs_amount').sum())
-    core_category_breakdown = {row['category_name']: row['abs_amount'] for row in category_agg.iter_rows(named=True)}
+    core_category_breakdown = _largest_first([(name, round(amount, 2)) for name, amount in category_agg.iter_rows()])
 
     return monthly_core_expenses, core_category_breakdown
 
@@ -815,7 +815,7 @@ def _emergency_fund_analysis(access_token: str, year: int, base_currency: str =
         total_core_expenses=round(total_core_expenses, 2),
         three_month_core_target=round(average_monthly_core * 3, 2),
         six_month_core_target=round(average_monthly_core * 6, 2),
-        core_category_breakdown={k: round(v, 2) for k, v in core_category_breakdown.items()},
+        core_category_breakdown=core_category_breakdown,
         
         # Core + Necessary
         average_monthly_core_necessary=round(avg_core_nec, 2),
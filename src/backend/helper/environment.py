@@ -12,3 +12,9 @@ SUPABASE_JWT_SECRET : str = str(os.getenv("SUPABASE_JWT_SECRET")) if os.getenv("
 PROJECT_URL : str = str(os.getenv("PROJECT_URL")) if os.getenv("PROJECT_URL") else ""
 ANON_KEY : str = str(os.getenv("ANON_KEY")) if os.getenv("ANON_KEY") else ""
 SERVICE_ROLE_KEY : str = str(os.getenv("SERVICE_ROLE_KEY")) if os.getenv("SERVICE_ROLE_KEY") else ""
+
+# DB rows and computed aggregates are built without re-running validators unless this is set to false/0
+TRUST_DB_RESULTS : bool = os.getenv("TRUST_DB_RESULTS", "true").strip().lower() not in ("0", "false", "no")
+
+# Attach the schemas/examples.py payload examples to the OpenAPI schema; set to false/0 to skip loading them
+INCLUDE_OPENAPI_EXAMPLES : bool = os.getenv("INCLUDE_OPENAPI_EXAMPLES", "true").strip().lower() not in ("0", "false", "no")
@@ -0,0 +1,19 @@
+"""
+JSON response class for the Budgeting Dashboard Backend API.
+
+Renders response bodies with pydantic-core's Rust JSON encoder instead of the
+stdlib `json` module used by FastAPI's default `JSONResponse`.
+"""
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+
+class CoreJSONResponse(JSONResponse):
+    """`JSONResponse` that encodes with `pydantic_core.to_json` (compact, UTF-8, no ASCII escaping)"""
+
+    def render(self, content: Any) -> bytes:
+        # NaN/Infinity become null, as in the model_dump_json routes, rather than invalid bare literals
+        return to_json(content, inf_nan_mode='null')
@@ -1,6 +1,6 @@
 # fastapi
 import fastapi
-from fastapi import APIRouter, Depends, Query, status, Request
+from fastapi import APIRouter, Depends, Query, status, Request, Response
 
 # auth dependencies
 from ..auth.auth import api_key_auth, get_current_user
@@ -19,10 +19,12 @@ from ..data.database import get_db_client
 
 # helper
 from ..helper.columns import ACCOUNTS_COLUMNS, TRANSACTIONS_COLUMNS
+from ..schemas.adapters import ACCOUNT_LIST_ADAPTER, list_envelope_json, rows_to_models
 from ..schemas.base import AccountData
 from ..schemas.requests import AccountRequest
 from ..schemas.responses import AccountsResponse, AccountSuccessResponse
 from ..helper.calculations import accounts_calc
+from ..helper import analytics_cache
 
 # other
 import polars as pl
@@ -53,7 +55,7 @@ async def get_all_accounts(
     user: dict[str, str] = Depends(get_current_user),
     account_id: Optional[int] = Query(None, description="Optional filtering for only the given account for getting its name"),
     account_name: Optional[str] = Query(None, description="Optional filtering for only the given account for getting its name")
-) -> AccountsResponse:
+) -> Response:
     
     try:
         user_supabase_client = get_db_client(user["access_token"])
@@ -86,7 +88,6 @@ async def get_all_accounts(
             metrics = accounts_calc.calculate_account_metrics(transactions_df)
 
         # Merge metrics
-        data = []
         for item in response.data:
             acc_id = str(item.get(ACCOUNTS_COLUMNS.ID.value))
             if acc_id in metrics:
@@ -99,13 +100,14 @@ async def get_all_accounts(
                 item['current_balance'] = 0.0
                 item['net_flow_30d'] = 0.0
                 item['history_30d'] = []
-            data.append(AccountData(**item))
 
-        return AccountsResponse(
-            data=data,
-            count=len(response.data),
-            success=True,
-            message="Accounts fetched successfully"
+        # DB rows plus computed metrics are trusted, so build the models without validation
+        data = rows_to_models(ACCOUNT_LIST_ADAPTER, AccountData, response.data, validate=not env.TRUST_DB_RESULTS)
+
+        # AccountsResponse documents the shape
+        return Response(
+            content=list_envelope_json(ACCOUNT_LIST_ADAPTER, data, "Accounts fetched successfully"),
+            media_type="application/json"
         )
 
     except Exception as e:
@@ -142,6 +144,8 @@ async def create_account(
             data[ACCOUNTS_COLUMNS.CREATED_AT.value] = data[ACCOUNTS_COLUMNS.CREATED_AT.value].isoformat()
 
         response = user_supabase_client.table("dim_accounts").insert(data).execute()
+        # Account currency drives the analytics currency conversion
+        analytics_cache.invalidate_user(user["user_id"])
 
         return AccountSuccessResponse(
             success=True,
@@ -183,6 +187,8 @@ async def update_account(
             data[ACCOUNTS_COLUMNS.CREATED_AT.value] = data[ACCOUNTS_COLUMNS.CREATED_AT.value].isoformat()
             
         response = user_supabase_client.table("dim_accounts").update(data).eq(ACCOUNTS_COLUMNS.ID.value, account_id).execute()
+        # Account currency drives the analytics currency conversion
+        analytics_cache.invalidate_user(user["user_id"])
 
         return AccountSuccessResponse(
             success=True,
@@ -240,6 +246,7 @@ async def delete_account(
                 .eq(ACCOUNTS_COLUMNS.ID.value, account_id)
                 .execute()
             )
+            analytics_cache.invalidate_user(user["user_id"])
             return AccountSuccessResponse(
                 success=True,
                 message=f"Account {account_id} has existing transactions and was deactivated instead of deleted",
@@ -252,6 +259,7 @@ async def delete_account(
                 .eq(ACCOUNTS_COLUMNS.ID.value, account_id)
                 .execute()
             )
+            analytics_cache.invalidate_user(user["user_id"])
             return AccountSuccessResponse(
                 success=True,
                 message=f"Account {account_id} deleted successfully",
@@ -1,6 +1,6 @@
 # fastapi
 import fastapi
-from fastapi import APIRouter, Depends, Query, status, Request
+from fastapi import APIRouter, Depends, Query, status, Request, Response
 
 # auth dependencies
 from ..auth.auth import api_key_auth, get_current_user
@@ -39,8 +39,11 @@ async def get_budget(
     user: dict[str, str] = Depends(get_current_user),
     month: int = Query(datetime.date.today().month, ge=1, le=12, description="Month for which to retrieve budgets"),
     year: int = Query(datetime.date.today().year, ge=2000, le=2100, description="Year for which to retrieve budgets")
-) -> BudgetResponse:
-    return get_month_budget_view(month, year, user["access_token"])
+) -> Response:
+    budget_response: BudgetResponse = get_month_budget_view(month, year, user["access_token"])
+
+    # Serialize once in pydantic-core and hand FastAPI the bytes; response_model only documents the shape
+    return Response(content=budget_response.model_dump_json(), media_type="application/json")
 
 
 
@@ -1,6 +1,6 @@
 # fastapi
 import fastapi
-from fastapi import APIRouter, Depends, Query, status, Request
+from fastapi import APIRouter, Depends, Query, status, Request, Response
 
 # auth dependencies
 from ..auth.auth import api_key_auth, get_current_user
@@ -19,6 +19,8 @@ from ..data.database import get_db_client
 
 # helper
 from ..helper.columns import CATEGORIES_COLUMNS
+from ..helper import analytics_cache
+from ..schemas.adapters import CATEGORY_LIST_ADAPTER, list_envelope_json, rows_to_models
 from ..schemas.base import CategoryData
 from ..schemas.requests import CategoryRequest, CategoryUpdateRequest
 from ..schemas.responses import CategoriesResponse, CategorySuccessResponse
@@ -53,7 +55,7 @@ async def get_all_categories(
     user: dict[str, str] = Depends(get_current_user),
     category_id: Optional[int] = Query(None, description="Optional filtering for only the given category for getting its name"),
     category_name: Optional[str] = Query(None, description="Optional filtering for only the given category for getting its name")
-) -> CategoriesResponse:
+) -> Response:
     
     try:
         user_supabase_client = get_db_client(user["access_token"])
@@ -75,11 +77,12 @@ async def get_all_categories(
         
         response = query.execute()
 
-        return CategoriesResponse(
-            data=[CategoryData(**item) for item in response.data],
-            count=len(response.data),
-            success=True,
-            message="Categories retrieved successfully"
+        # Serialize the list in one pydantic-core call; CategoriesResponse documents the shape
+        categories = rows_to_models(CATEGORY_LIST_ADAPTER, CategoryData, response.data, validate=not env.TRUST_DB_RESULTS)
+
+        return Response(
+            content=list_envelope_json(CATEGORY_LIST_ADAPTER, categories, "Categories retrieved successfully"),
+            media_type="application/json"
         )
 
     except Exception as e:
@@ -115,7 +118,7 @@ async def create_category(
         return CategorySuccessResponse(
             success=True,
             message="Category created successfully",
-            data=[CategoryData(**item) for item in response.data] if response.data else None
+            data=CATEGORY_LIST_ADAPTER.validate_python(response.data) if response.data else None
         )
     
     except Exception as e:
@@ -157,6 +160,8 @@ async def update_category(
             .eq(CATEGORIES_COLUMNS.ID.value, category_id)
             .execute()
         )
+        # Category names and types feed the analytics breakdowns
+        analytics_cache.invalidate_user(user["user_id"])
 
         if not response.data:
             raise fastapi.HTTPException(
@@ -167,7 +172,7 @@ async def update_category(
         return CategorySuccessResponse(
             success=True,
             message=f"Category {category_id} updated successfully",
-            data=[CategoryData(**item) for item in response.data]
+            data=CATEGORY_LIST_ADAPTER.validate_python(response.data)
         )
     
     except fastapi.HTTPException:
@@ -222,7 +227,7 @@ async def delete_category(
             return CategorySuccessResponse(
                 success=True,
                 message=f"Category {category_id} has existing transactions and was deactivated instead of deleted",
-                data=[CategoryData(**item) for item in response.data] if response.data else None
+                data=CATEGORY_LIST_ADAPTER.validate_python(response.data) if response.data else None
             )
         else:
             # Hard delete: no transactions reference this category
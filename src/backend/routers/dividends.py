@@ -16,6 +16,7 @@ from ..helper.columns import DIVIDEND_PORTFOLIO_COLUMNS
 
 # schemas
 from ..schemas.base import DividendStockRow, DividendYieldFrequency, DividendCalculationResult
+from ..schemas.adapters import DIVIDEND_ROW_LIST_ADAPTER
 from ..schemas.requests import DividendPortfolioRequest
 from ..schemas.responses import DividendPortfolioResponse, DividendPortfolioSuccessResponse
 
@@ -82,7 +83,8 @@ def _calculate(portfolio_value: Decimal, rows: List[DividendStockRow]) -> Divide
 
 def _parse_rows(raw_rows: list) -> List[DividendStockRow]:
     """Parse and validate a list of raw dicts into DividendStockRow objects."""
-    return [DividendStockRow(**r) for r in raw_rows]
+    rows: List[DividendStockRow] = DIVIDEND_ROW_LIST_ADAPTER.validate_python(raw_rows)
+    return rows
 
 
 def _validate_weights(rows: List[DividendStockRow]) -> None:
@@ -4,7 +4,7 @@ from fastapi import APIRouter, Depends, status, Request
 
 # auth dependencies
 from ..auth.auth import api_key_auth, get_current_user
-from ..schemas.base import UserData
+from ..schemas.base import LoginSessionPayload, UserData
 from ..schemas.requests import LoginRequest, ForgotPasswordRequest, ResetPasswordRequest
 from ..schemas.responses import LoginResponse, MessageResponse, OAuthUrlResponse
 
@@ -65,7 +65,7 @@ async def login(
             access_token=response.session.access_token,
             refresh_token=response.session.refresh_token,
             user_id=response.user.id,
-            data=dict(response)
+            data=LoginSessionPayload(user=response.user, session=response.session)
         )
 
     except fastapi.HTTPException:
@@ -118,7 +118,7 @@ async def register(
             access_token=response.session.access_token,
             refresh_token=response.session.refresh_token,
             user_id=response.user.id,
-            data=dict(response)
+            data=LoginSessionPayload(user=response.user, session=response.session)
         )
 
     except fastapi.HTTPException:
@@ -1,6 +1,6 @@
 # fastapi
 import fastapi
-from fastapi import APIRouter, Depends, Query, status, Request
+from fastapi import APIRouter, Depends, Query, status, Request, Response
 
 # auth dependencies
 from ..auth.auth import api_key_auth, get_current_user
@@ -50,7 +50,7 @@ async def get_monthly_analytics(
     year: int = Query(datetime.now().year, description='Year for analytics'),
     month: int = Query(datetime.now().month, description='Month for analytics (1-12)'),
     base_currency: str = Query('CZK', description='Currency to convert all amounts into'),
-) -> MonthlyAnalyticsResponse:
+) -> Response:
     '''
     Get comprehensive monthly analytics including totals, daily spending heatmap, 
     category breakdown, and spending type analysis.
@@ -69,11 +69,15 @@ async def get_monthly_analytics(
     try:
         analytics_data: MonthlyAnalyticsData = _monthly_analytics(user['access_token'], year, month, base_currency)
 
-        return MonthlyAnalyticsResponse(
+        # Serialize once in pydantic-core and hand FastAPI the bytes; response_model only documents the shape
+        analytics_response = MonthlyAnalyticsResponse.from_trusted(
+            validate=not env.TRUST_DB_RESULTS,
             data=analytics_data,
             success=True,
             message=f'Monthly analytics for {analytics_data.month_name} {year} retrieved successfully'
         )
+
+        return Response(content=analytics_response.model_dump_json(), media_type="application/json")
         
     except ValueError as e:
         logger.warning(f'Invalid parameters for get_monthly_analytics: {str(e)}')
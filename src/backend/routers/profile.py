@@ -10,6 +10,7 @@ from ..helper.rate_limiter import limiter, RATE_LIMITS
 
 # Load environment variables
 from ..helper import environment as env
+from ..helper import analytics_cache
 
 # logging
 import logging
@@ -86,7 +87,12 @@ async def get_my_profile(
         profile_data : ProfileData = _build_profile_data(user_profile.user)
         
         
-        return ProfileResponse(data=profile_data, success=True, message="User profile retrieved successfully")
+        return ProfileResponse.from_trusted(
+            validate=not env.TRUST_DB_RESULTS,
+            data=profile_data,
+            success=True,
+            message="User profile retrieved successfully",
+        )
     
     except fastapi.HTTPException:
         # Re-raise HTTP exceptions
@@ -229,6 +235,7 @@ async def delete_my_account(
 
         for table_name, user_column in USER_DATA_TABLES:
             service_client.table(table_name).delete().eq(user_column, user_id).execute()
+        analytics_cache.invalidate_user(user_id)
 
         async with httpx.AsyncClient(timeout=10.0) as client:
             delete_response = await client.delete(
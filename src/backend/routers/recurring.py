@@ -11,6 +11,7 @@ from ..auth.auth import api_key_auth, get_current_user
 from ..data.database import get_db_client
 from ..helper.columns import RECURRING_COLUMNS, TRANSACTIONS_COLUMNS, ACCOUNTS_COLUMNS
 from ..helper.rate_limiter import RATE_LIMITS, limiter
+from ..helper import analytics_cache
 from ..schemas.base import RecurringData, RecurringSummary
 from ..schemas.requests import RecurringRequest
 from ..schemas.responses import RecurringResponse, RecurringSuccessResponse
@@ -239,6 +240,7 @@ async def post_recurring(
         # Remove None values
         tx = {k: v for k, v in tx.items() if v is not None}
         db.table("fct_transactions").insert(tx).execute()
+        analytics_cache.invalidate_user(user["user_id"])
 
         # Advance next_date
         from datetime import datetime as dt
@@ -1,6 +1,6 @@
 # fastapi
 import fastapi
-from fastapi import APIRouter, Depends, status, Query, Request
+from fastapi import APIRouter, Depends, status, Query, Request, Response
 
 # auth dependencies
 from ..auth.auth import api_key_auth, get_current_user
@@ -19,6 +19,7 @@ from ..data.database import get_db_client
 
 # schemas
 from ..helper.columns import SAVINGS_FUNDS_COLUMNS, TRANSACTIONS_COLUMNS
+from ..schemas.adapters import SAVINGS_FUND_LIST_ADAPTER, list_envelope_json, rows_to_models
 from ..schemas.base import SavingsFundsData
 from ..schemas.requests import SavingsFundsRequest
 from ..schemas.responses import SavingsFundsResponse, SavingsFundSuccessResponse
@@ -55,7 +56,7 @@ async def get_savings_funds(
     user: dict[str, str] = Depends(get_current_user),
     fund_id: Optional[str] = Query(None, description="ID of the savings fund to retrieve"),
     fund_name: Optional[str] = Query(None, description="Name of the savings fund to retrieve")
-) -> SavingsFundsResponse:
+) -> Response:
     """
     Get all savings funds for the current user with optional filtering.
     """
@@ -92,7 +93,6 @@ async def get_savings_funds(
             metrics = savings_funds_calc.calculate_fund_metrics(funds_df)
 
         # Merge metrics
-        data = []
         for item in response.data:
             fund_id = item.get(SAVINGS_FUNDS_COLUMNS.ID.value)
             # Find metrics for this fund
@@ -103,13 +103,14 @@ async def get_savings_funds(
             else:
                 item['current_amount'] = 0.0
                 item['net_flow_30d'] = 0.0
-            data.append(SavingsFundsData(**item))
 
-        return SavingsFundsResponse(
-            data=data,
-            count=len(response.data),
-            success=True,
-            message="Savings funds retrieved successfully"
+        # DB rows plus computed metrics are trusted, so build the models without validation
+        data = rows_to_models(SAVINGS_FUND_LIST_ADAPTER, SavingsFundsData, response.data, validate=not env.TRUST_DB_RESULTS)
+
+        # SavingsFundsResponse documents the shape
+        return Response(
+            content=list_envelope_json(SAVINGS_FUND_LIST_ADAPTER, data, "Savings funds retrieved successfully"),
+            media_type="application/json"
         )
 
     except Exception as e:
@@ -154,7 +155,7 @@ async def create_savings_fund(
         return SavingsFundSuccessResponse(
             success=True,
             message="Savings fund created successfully",
-            data=[SavingsFundsData(**item) for item in response.data] if response.data else None
+            data=SAVINGS_FUND_LIST_ADAPTER.validate_python(response.data) if response.data else None
         )
 
     except Exception as e:
@@ -193,7 +194,7 @@ async def update_savings_fund(
         return SavingsFundSuccessResponse(
             success=True,
             message=f"Savings fund {fund_id} updated successfully",
-            data=[SavingsFundsData(**item) for item in response.data] if response.data else None
+            data=SAVINGS_FUND_LIST_ADAPTER.validate_python(response.data) if response.data else None
         )
 
     except Exception as e:
@@ -260,7 +261,7 @@ async def delete_savings_fund(
             return SavingsFundSuccessResponse(
                 success=True,
                 message=f"Fund {fund_id} has existing transactions and was deactivated instead of deleted",
-                data=[SavingsFundsData(**item) for item in response.data] if response.data else None,
+                data=SAVINGS_FUND_LIST_ADAPTER.validate_python(response.data) if response.data else None,
             )
         else:
             # Hard delete: no transactions reference this fund
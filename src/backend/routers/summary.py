@@ -1,6 +1,6 @@
 # fastapi
 import fastapi
-from fastapi import APIRouter, Depends, Query, status, Request
+from fastapi import APIRouter, Depends, Query, status, Request, Response
 
 # auth dependencies
 from ..auth.auth import api_key_auth, get_current_user
@@ -51,7 +51,7 @@ async def get_financial_summary(
     start_date: Optional[date] = Query(None, description="Start date for filtering transactions"),
     end_date: Optional[date] = Query(None, description="End date for filtering transactions"),
     base_currency: str = Query('CZK', description="Currency to convert all amounts into"),
-) -> SummaryResponse:
+) -> Response:
     """
     Get financial summary including totals by category type.
     
@@ -71,12 +71,16 @@ async def get_financial_summary(
         elif end_date:
             date_range_msg = f" until {end_date}"
 
-        return SummaryResponse(
+        # Serialize once in pydantic-core and hand FastAPI the bytes; response_model only documents the shape
+        summary_response = SummaryResponse.from_trusted(
+            validate=not env.TRUST_DB_RESULTS,
             data=summary_data,
             success=True,
             message=f'Financial summary{date_range_msg} retrieved successfully'
         )
 
+        return Response(content=summary_response.model_dump_json(), media_type="application/json")
+
     except ValueError as e:
         logger.warning(f'Invalid parameters for get_financial_summary: {str(e)}')
         logger.info(f'Query parameters - start_date: {start_date}, end_date: {end_date}')
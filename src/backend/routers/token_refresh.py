@@ -19,7 +19,7 @@ from ..data.database import get_db_client, Client
 
 # schemas
 from ..schemas.responses import RefreshTokenResponse
-from ..schemas.base import TokenData
+from ..schemas.base import LoginSessionData, LoginUserData, TokenData
 
 
 # ================================================================================================
@@ -64,11 +64,7 @@ async def refresh_access_token(
         if response:
             logger.info("Successfully refreshed user session")
             
-            # Convert Supabase objects to dictionaries for JSON serialization
-            user_dict = response.user.model_dump() if response.user else None
-            session_dict = response.session.model_dump() if response.session else None
-            
-            if not session_dict or not user_dict:
+            if not response.session or not response.user:
                 logger.warning("Refreshed session or user is missing")
                 raise fastapi.HTTPException(
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -77,15 +73,16 @@ async def refresh_access_token(
 
             # Create TokenData object
             token_data = TokenData(
-                access_token=session_dict["access_token"],
-                refresh_token=session_dict["refresh_token"],
-                user_id=user_dict["id"]
+                access_token=response.session.access_token,
+                refresh_token=response.session.refresh_token,
+                user_id=response.user.id
             )
 
+            # Only the fields the client uses are copied off the Supabase objects
             return RefreshTokenResponse(
                 data=token_data,
-                user=user_dict,
-                session=session_dict, 
+                user=LoginUserData.model_validate(response.user),
+                session=LoginSessionData.model_validate(response.session), 
                 success=True, 
                 message="Token refresh successful"
             )
@@ -1,6 +1,7 @@
 # fastapi
 import fastapi
-from fastapi import APIRouter, Depends, Query, status, Request
+from fastapi import APIRouter, Depends, Query, status, Request, Response
+from fastapi.responses import StreamingResponse
 
 # auth dependencies
 from ..auth.auth import api_key_auth, get_current_user
@@ -18,13 +19,17 @@ from ..data.database import get_db_client
 
 # helper
 from ..helper.columns import TRANSACTIONS_COLUMNS
-from ..schemas.base import TransactionData
+from ..helper import analytics_cache
+from ..schemas.adapters import (
+    TRANSACTION_ADAPTER, TRANSACTION_LIST_ADAPTER, rows_to_models, stream_list_envelope_json, stream_ndjson
+)
+from ..schemas.base import TransactionColumns, TransactionData
 from ..schemas.requests import TransactionRequest
-from ..schemas.responses import TransactionsResponse, TransactionSuccessResponse
+from ..schemas.responses import TransactionsColumnarResponse, TransactionsResponse, TransactionSuccessResponse
 
 # other
 from datetime import date
-from typing import Optional, List
+from typing import Literal, Optional, List
 
 # ================================================================================================
 #                                   Settings and Configuration
@@ -44,7 +49,13 @@ router = APIRouter()
 
 #? This router prefix is /all
 
-@router.get("/", response_model=TransactionsResponse)
+# format=ndjson bypasses the envelope models, so its media type is documented separately
+@router.get("/", response_model=TransactionsResponse | TransactionsColumnarResponse, responses={
+    200: {
+        "description": "Enveloped JSON for format=rows/columnar; for format=ndjson, one TransactionData object per line",
+        "content": {"application/x-ndjson": {"schema": {"type": "string"}}},
+    },
+})
 @limiter.limit(RATE_LIMITS["read_only"])
 async def get_all_data(
     request: Request,
@@ -61,8 +72,13 @@ async def get_all_data(
     min_amount: Optional[float] = Query(None, description="Filter by minimum amount value"),
     max_amount: Optional[float] = Query(None, description="Filter by maximum amount value"),
     limit: Optional[int] = Query(100, ge=1, le=1000, description="Number of items to return (max 1000)"),
-    offset: Optional[int] = Query(0, ge=0, description="Number of items to skip")
-) -> TransactionsResponse:
+    offset: Optional[int] = Query(0, ge=0, description="Number of items to skip"),
+    response_format: Literal["rows", "columnar", "ndjson"] = Query(
+        "rows", alias="format",
+        description="`rows` for a list of records, `columnar` for one list per field, "
+                    "`ndjson` for one bare record per line (application/x-ndjson, no envelope)"
+    ),
+) -> Response:
     """
     Get all transactions with optional filtering and pagination.
     
@@ -126,12 +142,27 @@ async def get_all_data(
         
         response = query.execute()
         response_data = response.data or []
+
+        if response_format == "columnar":
+            columnar_response = TransactionsColumnarResponse.from_trusted(
+                validate=not env.TRUST_DB_RESULTS,
+                data=TransactionColumns.from_rows(response_data, validate=not env.TRUST_DB_RESULTS),
+                count=len(response_data),
+                success=True,
+                message="Transactions retrieved successfully",
+            )
+            return Response(content=columnar_response.model_dump_json(), media_type="application/json")
         
-        return TransactionsResponse(
-            data=[TransactionData(**item) for item in response_data],
-            count=len(response_data),
-            success=True,
-            message="Transactions retrieved successfully"
+        # Rows come straight from the typed fct_transactions table, so skip validation; serialization is
+        # then streamed in batches. TransactionsResponse documents the shape
+        transactions = rows_to_models(TRANSACTION_LIST_ADAPTER, TransactionData, response_data, validate=not env.TRUST_DB_RESULTS)
+
+        if response_format == "ndjson":
+            return StreamingResponse(stream_ndjson(TRANSACTION_ADAPTER, transactions), media_type="application/x-ndjson")
+
+        return StreamingResponse(
+            stream_list_envelope_json(TRANSACTION_LIST_ADAPTER, transactions, "Transactions retrieved successfully"),
+            media_type="application/json"
         )
     
     except Exception as e:
@@ -159,27 +190,17 @@ async def create_transaction(
     try:
         user_supabase_client = get_db_client(user["access_token"])
         
-        data = transaction_data.model_dump()
+        # JSON mode emits the cents back as an `amount` number and dates as ISO strings in a single pydantic-core pass
+        data = transaction_data.model_dump(mode="json", by_alias=True)
         data[TRANSACTIONS_COLUMNS.USER_ID.value] = user["user_id"]
         
-        # Convert Decimal to float for JSON serialization
-        if data.get(TRANSACTIONS_COLUMNS.AMOUNT.value) is not None:
-            data[TRANSACTIONS_COLUMNS.AMOUNT.value] = float(data[TRANSACTIONS_COLUMNS.AMOUNT.value])
-        
-        # Convert date to ISO string for JSON serialization
-        if data.get(TRANSACTIONS_COLUMNS.DATE.value) is not None:
-            data[TRANSACTIONS_COLUMNS.DATE.value] = data[TRANSACTIONS_COLUMNS.DATE.value].isoformat()
-            
-        # Convert datetime to ISO string for JSON serialization
-        if data.get(TRANSACTIONS_COLUMNS.CREATED_AT.value) is not None:
-            data[TRANSACTIONS_COLUMNS.CREATED_AT.value] = data[TRANSACTIONS_COLUMNS.CREATED_AT.value].isoformat()
-        
         response = user_supabase_client.table("fct_transactions").insert(data).execute()
+        analytics_cache.invalidate_user(user["user_id"])
         
         return TransactionSuccessResponse(
             success=True,
             message="Transaction created successfully",
-            data=[TransactionData(**item) for item in response.data] if response.data else None
+            data=TRANSACTION_LIST_ADAPTER.validate_python(response.data) if response.data else None
         )
     
     except Exception as e:
@@ -208,27 +229,17 @@ async def update_transaction(
     try:
         user_supabase_client = get_db_client(user["access_token"])
         
-        data = transaction_data.model_dump()
+        # JSON mode emits the cents back as an `amount` number and dates as ISO strings in a single pydantic-core pass
+        data = transaction_data.model_dump(mode="json", by_alias=True)
         data[TRANSACTIONS_COLUMNS.USER_ID.value] = user["user_id"]
-        
-        # Convert Decimal to float for JSON serialization
-        if data.get(TRANSACTIONS_COLUMNS.AMOUNT.value) is not None:
-            data[TRANSACTIONS_COLUMNS.AMOUNT.value] = float(data[TRANSACTIONS_COLUMNS.AMOUNT.value])
-        
-        # Convert date to ISO string for JSON serialization
-        if data.get(TRANSACTIONS_COLUMNS.DATE.value) is not None:
-            data[TRANSACTIONS_COLUMNS.DATE.value] = data[TRANSACTIONS_COLUMNS.DATE.value].isoformat()
-            
-        # Convert datetime to ISO string for JSON serialization
-        if data.get(TRANSACTIONS_COLUMNS.CREATED_AT.value) is not None:
-            data[TRANSACTIONS_COLUMNS.CREATED_AT.value] = data[TRANSACTIONS_COLUMNS.CREATED_AT.value].isoformat()
 
         response = user_supabase_client.table("fct_transactions").update(data).eq(TRANSACTIONS_COLUMNS.ID.value, transaction_id).execute()
+        analytics_cache.invalidate_user(user["user_id"])
 
         return TransactionSuccessResponse(
             success=True,
             message=f"Transaction {transaction_id} updated successfully",
-            data=[TransactionData(**item) for item in response.data] if response.data else None
+            data=TRANSACTION_LIST_ADAPTER.validate_python(response.data) if response.data else None
         )
     
     except Exception as e:
@@ -256,6 +267,7 @@ async def delete_transaction(
         user_supabase_client = get_db_client(user["access_token"])
         
         response = user_supabase_client.table("fct_transactions").delete().eq(TRANSACTIONS_COLUMNS.ID.value, transaction_id).execute()
+        analytics_cache.invalidate_user(user["user_id"])
         
         return TransactionSuccessResponse(
             success=True,
@@ -1,6 +1,6 @@
 # fastapi
 import fastapi
-from fastapi import APIRouter, Depends, Query, status, Request
+from fastapi import APIRouter, Depends, Query, status, Request, Response
 
 # auth dependencies
 from ..auth.auth import api_key_auth, get_current_user
@@ -11,10 +11,12 @@ from ..helper.rate_limiter import limiter, RATE_LIMITS
 # Load environment variables
 from ..helper import environment as env
 from ..helper.calculations.yearly_page_calc import _yearly_analytics, _emergency_fund_analysis
+from ..helper import analytics_cache
 
 # schemas
 from ..schemas.base import EmergencyFundData, YearlyAnalyticsData
 from ..schemas.responses import EmergencyFundResponse, YearlyAnalyticsResponse
+from ..schemas.adapters import YEARLY_ANALYTICS_RESPONSE_ADAPTER
 
 # logging
 import logging
@@ -41,6 +43,19 @@ router = APIRouter()
 #? prefix - /yearly
 
 
+def _conditional_json_response(request: Request, body: bytes) -> Response:
+    '''
+    Send `body` with its ETag, or an empty 304 when the client's If-None-Match already holds it.
+    '''
+    etag = analytics_cache.etag_for(body)
+    headers = {'ETag': etag, 'Cache-Control': 'private, no-cache'}
+
+    if analytics_cache.etag_matches(request.headers.get('If-None-Match'), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 @router.get('/analytics', response_model=YearlyAnalyticsResponse)
 @limiter.limit(RATE_LIMITS["heavy"])
 async def get_yearly_analytics(
@@ -49,19 +64,32 @@ async def get_yearly_analytics(
     user: dict[str, str] = Depends(get_current_user),
     year: int = Query(datetime.now().year, description='Year for analytics'),
     base_currency: str = Query('CZK', description='Currency to convert all amounts into'),
-) -> YearlyAnalyticsResponse:
+) -> Response:
     '''
     Get comprehensive yearly analytics including totals, monthly breakdown, and trends.
     '''
         
     try:
+        # Repeat polls for the same year are served from the serialized body until the user writes again
+        cache_key = ('yearly', year, base_currency)
+        cached_body = analytics_cache.get_cached(user['user_id'], cache_key)
+        if cached_body is not None:
+            return _conditional_json_response(request, cached_body)
+
         analytics_data: YearlyAnalyticsData = _yearly_analytics(user['access_token'], year, base_currency)
 
-        return YearlyAnalyticsResponse(
+        # Serialize once in pydantic-core and hand FastAPI the bytes; response_model only documents the shape
+        analytics_response = YearlyAnalyticsResponse.from_trusted(
+            validate=not env.TRUST_DB_RESULTS,
             data=analytics_data,
             success=True,
             message=f'Yearly analytics for {year} retrieved successfully'
         )
+
+        body = YEARLY_ANALYTICS_RESPONSE_ADAPTER.dump_json(analytics_response)
+        analytics_cache.store(user['user_id'], cache_key, body)
+
+        return _conditional_json_response(request, body)
         
     except ValueError as e:
         logger.warning(f'Invalid parameters for get_yearly_analytics: {str(e)}')
@@ -100,7 +128,7 @@ async def get_emergency_fund_analysis(
     user: dict[str, str] = Depends(get_current_user),
     year: int = Query(datetime.now().year, description='Year for emergency fund calculation'),
     base_currency: str = Query('CZK', description='Currency to convert all amounts into'),
-) -> EmergencyFundResponse:
+) -> Response:
     '''
     Get emergency fund analysis based on core expenses for the specified year.
     
@@ -110,11 +138,14 @@ async def get_emergency_fund_analysis(
     try:
         emergency_fund_data: EmergencyFundData = _emergency_fund_analysis(user['access_token'], year, base_currency)
 
-        return EmergencyFundResponse(
+        emergency_fund_response = EmergencyFundResponse.from_trusted(
+            validate=not env.TRUST_DB_RESULTS,
             data=emergency_fund_data,
             success=True,
             message=f"Emergency fund analysis for {year} retrieved successfully"
         )
+
+        return Response(content=emergency_fund_response.model_dump_json(), media_type="application/json")
         
     except ValueError as e:
         logger.warning(f'Invalid parameters for get_emergency_fund_analysis: {str(e)}')
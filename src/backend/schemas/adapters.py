@@ -0,0 +1,106 @@
+"""Module-level TypeAdapters for bulk list payloads.
+
+Building a TypeAdapter compiles its validator/serializer once; keeping them at module scope lets hot endpoints
+validate and dump whole lists in a single pydantic-core call instead of going through per-row models.
+"""
+
+from typing import Any, Iterator, List, Sequence
+
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+
+from .base import AccountData, CategoryData, DividendStockRow, SavingsFundsData, TransactionData
+from .responses import YearlyAnalyticsResponse
+
+# ================================================================================================
+#                                   Row Adapters
+# ================================================================================================
+
+TRANSACTION_ADAPTER: TypeAdapter[TransactionData] = TypeAdapter(TransactionData)
+ACCOUNT_ADAPTER: TypeAdapter[AccountData] = TypeAdapter(AccountData)
+CATEGORY_ADAPTER: TypeAdapter[CategoryData] = TypeAdapter(CategoryData)
+SAVINGS_FUND_ADAPTER: TypeAdapter[SavingsFundsData] = TypeAdapter(SavingsFundsData)
+
+# ================================================================================================
+#                                   List Adapters
+# ================================================================================================
+
+# DB-row payloads are immutable (frozen models), so they are held as tuples; the JSON is still an array
+
+TRANSACTION_LIST_ADAPTER: TypeAdapter[tuple[TransactionData, ...]] = TypeAdapter(tuple[TransactionData, ...])
+ACCOUNT_LIST_ADAPTER: TypeAdapter[tuple[AccountData, ...]] = TypeAdapter(tuple[AccountData, ...])
+CATEGORY_LIST_ADAPTER: TypeAdapter[tuple[CategoryData, ...]] = TypeAdapter(tuple[CategoryData, ...])
+SAVINGS_FUND_LIST_ADAPTER: TypeAdapter[tuple[SavingsFundsData, ...]] = TypeAdapter(tuple[SavingsFundsData, ...])
+DIVIDEND_ROW_LIST_ADAPTER: TypeAdapter[List[DividendStockRow]] = TypeAdapter(List[DividendStockRow])
+
+# ================================================================================================
+#                                   Response Adapters
+# ================================================================================================
+
+# Fixed-shape envelopes whose encoded bytes are cached; dump_json hands back bytes with no str round-trip
+YEARLY_ANALYTICS_RESPONSE_ADAPTER: TypeAdapter[YearlyAnalyticsResponse] = TypeAdapter(YearlyAnalyticsResponse)
+
+
+# ================================================================================================
+#                                   Row Loading
+# ================================================================================================
+
+def rows_to_models(list_adapter: TypeAdapter[tuple[Any, ...]], model: Any, rows: Sequence[dict], validate: bool = False) -> tuple[Any, ...]:
+    """
+    Build the frozen row models for a DB result set.
+
+    Trusted rows go through `model.from_row` (no validation); otherwise the whole list is validated in a
+    single `list_adapter.validate_python` call rather than one `model_validate` per row.
+    """
+    if validate:
+        return list_adapter.validate_python(rows)
+    return tuple(model.from_row(row) for row in rows)
+
+
+# ================================================================================================
+#                                   Envelope Helpers
+# ================================================================================================
+
+def list_envelope_json(adapter: TypeAdapter[Any], rows: Any, message: str) -> bytes:
+    """
+    Serialize a `{data, count, success, message}` list response straight to JSON bytes.
+
+    Mirrors the shape of the `*Response` list wrappers without building the wrapper model.
+    """
+    return b"".join((
+        b'{"data":',
+        adapter.dump_json(rows),
+        b',"count":',
+        str(len(rows)).encode(),
+        b',"success":true,"message":',
+        to_json(message),
+        b"}",
+    ))
+
+
+def stream_list_envelope_json(
+    adapter: TypeAdapter[Any], rows: Sequence[Any], message: str, batch_size: int = 500
+) -> Iterator[bytes]:
+    """
+    Streaming variant of `list_envelope_json`; dumps `rows` in `batch_size` chunks so only one batch of
+    serialized JSON is held in memory at a time.
+
+    `adapter` must be a list adapter; each batch's `[...]` is stripped and the fragments are comma-joined.
+    """
+    yield b'{"data":['
+    for start in range(0, len(rows), batch_size):
+        if start:
+            yield b","
+        yield adapter.dump_json(rows[start:start + batch_size])[1:-1]
+    yield b'],"count":' + str(len(rows)).encode() + b',"success":true,"message":' + to_json(message) + b"}"
+
+
+def stream_ndjson(adapter: TypeAdapter[Any], rows: Sequence[Any], batch_size: int = 500) -> Iterator[bytes]:
+    """
+    Serialize `rows` as newline-delimited JSON (one record per line, no envelope), yielding one chunk per
+    `batch_size` records.
+
+    `adapter` must be the single-row adapter, e.g. `TRANSACTION_ADAPTER`.
+    """
+    for start in range(0, len(rows), batch_size):
+        yield b"".join(adapter.dump_json(row) + b"\n" for row in rows[start:start + batch_size])
@@ -1,9 +1,80 @@
 from datetime import date as Date, datetime
-from decimal import Decimal
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
 from enum import Enum
-from typing import List, Optional
+from functools import cached_property
+from typing import Annotated, Any, List, Literal
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import (
+    BaseModel, BeforeValidator, Field, ConfigDict, PlainSerializer, TypeAdapter, WithJsonSchema, computed_field,
+    model_validator,
+)
+from pydantic.dataclasses import dataclass
+
+# ================================================================================================
+#                                   Money Helpers
+# ================================================================================================
+
+def _parse_cents(text: str) -> int | None:
+    """Parse a plain decimal string ("-49.99") into cents with integer arithmetic, or None if it is not one"""
+    stripped = text.strip()
+    unsigned = stripped[1:] if stripped[:1] in ("+", "-") else stripped
+    whole, _, frac = unsigned.partition(".")
+    if not (whole or frac) or (whole and not whole.isdigit()) or (frac and not frac.isdigit()):
+        return None
+    cents = int(whole or "0") * 100 + int((frac + "00")[:2])
+    # Half-up on the third fractional digit (away from zero, like ROUND_HALF_UP)
+    if len(frac) > 2 and frac[2] >= "5":
+        cents += 1
+    return -cents if stripped.startswith("-") else cents
+
+
+def to_cents(value: Decimal | float | int | str) -> int:
+    """Convert a monetary amount in major units to integer cents (half-up rounding)"""
+    if isinstance(value, int):
+        return value * 100
+    if isinstance(value, float):
+        # DB numerics arrive as floats; with at most two decimals the scaled value sits next to an integer,
+        # and anything that close can only round half-up to it. Other floats take the exact Decimal path
+        scaled = value * 100
+        cents = round(scaled)
+        if abs(scaled - cents) < 1e-6:
+            return cents
+    if isinstance(value, str):
+        parsed = _parse_cents(value)
+        if parsed is not None:
+            return parsed
+    return int((Decimal(str(value)) * 100).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+
+# Exact Decimal for validation and arithmetic, emitted as a JSON number by pydantic-core
+FloatDecimal = Annotated[Decimal, PlainSerializer(float, return_type=float, when_used='json')]
+
+_DECIMAL_ADAPTER: TypeAdapter[Decimal] = TypeAdapter(Decimal)
+_CENT = Decimal("0.01")
+
+
+def _amount_to_cents(value: Any) -> int:
+    """Validate an incoming amount exactly as a Decimal field would, then hold it as integer cents"""
+    amount = _DECIMAL_ADAPTER.validate_python(value)
+    try:
+        cent_amount = amount.quantize(_CENT)
+    except InvalidOperation:
+        # More digits than the decimal context can hold at cent precision
+        raise ValueError("Amount is out of range")
+    if amount != cent_amount:
+        # Rejected rather than rounded, so a stored amount is always exactly what the client sent
+        raise ValueError("Amount must have at most two decimal places")
+    return to_cents(amount)
+
+
+# Accepted like FloatDecimal (number or numeric string, at most two decimals), stored as int cents,
+# emitted in major units
+DecimalCents = Annotated[
+    int,
+    BeforeValidator(_amount_to_cents),
+    PlainSerializer(lambda cents: cents / 100, return_type=float, when_used='json'),
+    WithJsonSchema({"anyOf": [{"type": "number"}, {"type": "string"}]}, mode='validation'),
+]
 
 # ================================================================================================
 #                                   Data Schemas
@@ -15,54 +86,82 @@ class TransactionData(BaseModel):
     user_id_fk: str | None = Field(None, description="User ID who owns this transaction")
     account_id_fk: str = Field(..., description="Account id associated with the transaction")
     category_id_fk: int = Field(..., description="Transaction category id")
-    amount: Decimal = Field(..., description="Transaction amount")
+    amount_cents: int = Field(..., exclude=True, description="Transaction amount in cents")
     date: Date = Field(..., description="Transaction date")
-    notes: Optional[str] = Field(None, description="Transaction description")
-    created_at: Optional[datetime] = Field(None, description="Record creation timestamp")
-    savings_fund_id_fk: Optional[str] = Field(None, description="Savings fund ID associated with the transaction")
+    notes: str | None = Field(None, description="Transaction description")
+    created_at: str | None = Field(None, description="Record creation timestamp (ISO-8601, passed through from the DB)")
+    savings_fund_id_fk: str | None = Field(None, description="Savings fund ID associated with the transaction")
+
+    @model_validator(mode="before")
+    @classmethod
+    def _amount_to_cents(cls, data: Any) -> Any:
+        """Accept DB rows carrying `amount` in major units and store it as cents"""
+        if isinstance(data, dict) and "amount_cents" not in data and "amount" in data:
+            data = dict(data)
+            data["amount_cents"] = to_cents(data.pop("amount"))
+        return data
+
+    @classmethod
+    def from_row(cls, row: dict[str, Any], validate: bool = False) -> "TransactionData":
+        """Build from a trusted DB row without running validators; only `amount` and `date` are converted"""
+        if validate:
+            return cls.model_validate(row)
+        return cls.model_construct(**{
+            **row,
+            "amount_cents": to_cents(row["amount"]),
+            "date": Date.fromisoformat(row["date"]),
+        })
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def amount(self) -> float:
+        """Transaction amount in major units, as exposed in the API"""
+        return self.amount_cents / 100
 
     model_config = ConfigDict(
-        # Allow Decimal to be serialized as float in JSON
-        json_encoders={Decimal: float},
-        # Example for documentation
-        json_schema_extra={
-            "example": {
-                "id_pk": "",
-                "user_id_fk": "",
-                "account_id_fk": "",
-                "category_id_fk": 1,
-                "amount": 100.00,
-                "date": "2025-01-15",
-                "notes": "",
-                "created_at": "2025-01-15T10:30:00Z",
-                "savings_fund_id_fk": None
-            }
-        }
+        # Immutable DB-row model; unknown columns from Supabase are dropped
+        frozen=True,
+        extra='ignore',
     )
 
-class CategoryType(str, Enum):
-    """Enum for category types"""
-    EXPENSE = "expense"
-    INCOME = "income"
-    TRANSFER = "transfer"
-    SAVING = "saving"
-    INVESTMENT = "investment"
-    EXCLUDE = "exclude"
+class TransactionColumns(BaseModel):
+    """Column-oriented transaction listing: one list per TransactionData field, all of equal length"""
+    id_pk: List[str | None] = Field(..., description="Transaction IDs")
+    user_id_fk: List[str | None] = Field(..., description="Owning user IDs")
+    account_id_fk: List[str] = Field(..., description="Account IDs")
+    category_id_fk: List[int] = Field(..., description="Category IDs")
+    amount: List[float] = Field(..., description="Transaction amounts")
+    date: List[Date] = Field(..., description="Transaction dates")
+    notes: List[str | None] = Field(..., description="Transaction descriptions")
+    created_at: List[str | None] = Field(..., description="Record creation timestamps (ISO-8601, passed through from the DB)")
+    savings_fund_id_fk: List[str | None] = Field(..., description="Savings fund IDs")
+
+    model_config = ConfigDict(frozen=True)
+
+    @classmethod
+    def from_rows(cls, rows: List[dict[str, Any]], validate: bool = False) -> "TransactionColumns":
+        """Pivot trusted DB rows into columns; amounts and dates are normalized like `TransactionData.from_row`"""
+        columns: dict[str, Any] = {
+            "id_pk": [row.get("id_pk") for row in rows],
+            "user_id_fk": [row.get("user_id_fk") for row in rows],
+            "account_id_fk": [row["account_id_fk"] for row in rows],
+            "category_id_fk": [row["category_id_fk"] for row in rows],
+            "amount": [to_cents(row["amount"]) / 100 for row in rows],
+            "date": [row["date"] for row in rows],
+            "notes": [row.get("notes") for row in rows],
+            "created_at": [row.get("created_at") for row in rows],
+            "savings_fund_id_fk": [row.get("savings_fund_id_fk") for row in rows],
+        }
+        if validate:
+            return cls.model_validate(columns)
+        columns["date"] = [Date.fromisoformat(value) for value in columns["date"]]
+        return cls.model_construct(**columns)
 
-    def __str__(self):
-        return self.value
-    
+# Literal unions are validated by pydantic-core's literal validator (no Enum member lookup) and
+# serialize as the bare strings the frontend already types them as
+CategoryType = Literal["expense", "income", "transfer", "saving", "investment", "exclude"]
 
-class SpendingType(str, Enum):
-    """Enum for spending types"""
-    CORE = "Core"
-    NECESSARY = "Necessary"
-    FUN = "Fun"
-    FUTURE = "Future"
-    INCOME = "Income"
-
-    def __str__(self):
-        return self.value
+SpendingType = Literal["Core", "Necessary", "Fun", "Future", "Income"]
 
 
 class CategoryData(BaseModel):
@@ -70,31 +169,60 @@ class CategoryData(BaseModel):
     categories_id_pk: int = Field(..., description="Category ID")
     category_name: str = Field(..., description="Category name")
     type: CategoryType = Field(..., description="Category type (expense, income, etc.)")
-    is_active: Optional[bool] = Field(True, description="Indicates if the category is active")
-    spending_type: Optional[SpendingType] = Field(None, description="Type of spending associated with the category")
-    created_at: Optional[datetime] = Field(None, description="Record creation timestamp")
+    is_active: bool | None = Field(True, description="Indicates if the category is active")
+    spending_type: SpendingType | None = Field(None, description="Type of spending associated with the category")
+    created_at: str | None = Field(None, description="Record creation timestamp (ISO-8601, passed through from the DB)")
+
+    model_config = ConfigDict(frozen=True, extra='ignore')
+
+    @classmethod
+    def from_row(cls, row: dict[str, Any], validate: bool = False) -> "CategoryData":
+        """Build from a trusted DB row without running validators"""
+        if validate:
+            return cls.model_validate(row)
+        return cls.model_construct(**row)
+
+
+@dataclass(slots=True, frozen=True)
+class BalanceHistoryPoint:
+    """Schema for a single day of an account balance history"""
+    date: str = Field(..., description="Date in YYYY-MM-DD format")
+    balance: float = Field(..., description="Account balance at the end of the day")
 
 
 class AccountData(BaseModel):
     """Schema for individual account data"""
     accounts_id_pk: str = Field(..., description="Account ID")
-    user_id_fk: Optional[str] = Field(None, description="User ID who owns this account")
+    user_id_fk: str | None = Field(None, description="User ID who owns this account")
     account_name: str = Field(..., description="Account name")
     type: str = Field(..., description="Type of the account (e.g., 'checking', 'savings')")
-    currency: Optional[str] = Field(..., description="Currency of the account")
-    account_is_active: Optional[bool] = Field(True, description="Whether the account is active")
-    current_balance: Optional[float] = Field(0.0, description="Current balance of the account")
-    net_flow_30d: Optional[float] = Field(0.0, description="Net flow of the account in the last 30 days")
-    history_30d: Optional[List[dict]] = Field(None, description="Daily balance history for the last 30 days")
-    created_at: Optional[datetime] = Field(None, description="Record creation timestamp")
+    currency: str | None = Field(..., description="Currency of the account")
+    account_is_active: bool | None = Field(True, description="Whether the account is active")
+    current_balance: float | None = Field(0.0, description="Current balance of the account")
+    net_flow_30d: float | None = Field(0.0, description="Net flow of the account in the last 30 days")
+    history_30d: List[BalanceHistoryPoint] | None = Field(None, description="Daily balance history for the last 30 days")
+    created_at: str | None = Field(None, description="Record creation timestamp (ISO-8601, passed through from the DB)")
+
+    model_config = ConfigDict(frozen=True, extra='ignore')
+
+    @classmethod
+    def from_row(cls, row: dict[str, Any], validate: bool = False) -> "AccountData":
+        """Build from a trusted DB row (merged with computed metrics) without running validators"""
+        if validate:
+            return cls.model_validate(row)
+        history = row.get("history_30d")
+        if history is None:
+            return cls.model_construct(**row)
+        return cls.model_construct(**{**row, "history_30d": [BalanceHistoryPoint(**point) for point in history]})
 
 class UserData(BaseModel):
     """Schema for user registration data"""
     email: str = Field(..., description="User email address")
     password: str = Field(..., min_length=8, description="User password (min 8 characters)")
-    full_name: Optional[str] = Field(None, description="User full name")
+    full_name: str | None = Field(None, description="User full name")
 
-class CategoryInsight(BaseModel):
+@dataclass(slots=True, frozen=True)
+class CategoryInsight:
     """Schema for category insight data"""
     name: str = Field(..., description="Category name")
     total: float = Field(..., description="Total amount spent")
@@ -112,6 +240,8 @@ class PeriodComparison(BaseModel):
     profit_delta_pct: float = Field(..., description="Percentage change in profit vs previous period")
     cashflow_delta_pct: float = Field(..., description="Percentage change in cashflow vs previous period")
 
+    model_config = ConfigDict(frozen=True)
+
 
 class SummaryData(BaseModel):
     """Schema for financial summary data"""
@@ -119,57 +249,27 @@ class SummaryData(BaseModel):
     total_expense: float = Field(..., description="Total expense amount")
     total_saving: float = Field(..., description="Total saving amount")
     total_investment: float = Field(..., description="Total investment amount")
-    profit: float = Field(..., description="Profit (income - expenses)")
-    net_cash_flow: float = Field(..., description="Net cash flow (income - expenses - savings - investments)")
     
     # New fields
     comparison: PeriodComparison = Field(..., description="Period-over-period comparison metrics")
     savings_rate: float = Field(..., description="Savings rate as percentage of income")
     investment_rate: float = Field(..., description="Investment rate as percentage of income")
     top_expenses: List[CategoryInsight] = Field(..., description="Top 3 expense categories")
-    biggest_mover: Optional[CategoryInsight] = Field(None, description="Category with largest absolute spending change vs previous period")
+    biggest_mover: CategoryInsight | None = Field(None, description="Category with largest absolute spending change vs previous period")
     largest_transactions: List[TransactionData] = Field(..., description="List of top 5 largest transactions")
-    
 
-    
-    # by_category removed as requested
+    # Frozen so the derived totals below are computed once per instance and cached
+    model_config = ConfigDict(frozen=True)
 
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "total_income": 5000.00,
-                "total_expense": 3500.00,
-                "total_saving": 1000.00,
-                "total_investment": 500.00,
-                "profit": 1500.00,
-                "net_cash_flow": 0.00,
-                "comparison": {
-                    "income_delta": 500.00,
-                    "income_delta_pct": 11.1,
-                    "expense_delta": -200.00,
-                    "expense_delta_pct": -5.4,
-                    "saving_delta": 100.00,
-                    "investment_delta": 0.00,
-                    "profit_delta": 700.00,
-                    "cashflow_delta": 0.00
-                },
-                "savings_rate": 20.0,
-                "investment_rate": 10.0,
-                "top_expenses": [
-                     {"name": "Rent", "total": 1500.0, "share_of_total": 42.8},
-                     {"name": "Groceries", "total": 600.0, "share_of_total": 17.1},
-                     {"name": "Utilities", "total": 200.0, "share_of_total": 5.7}
-                ],
-                "biggest_mover": {"name": "Travel", "total": 500.0, "share_of_total": 14.2},
-                "largest_transactions": [],
-                "by_category": {
-                    "Salary": 5000.00,
-                    "Groceries": -800.00,
-                    "Utilities": -300.00
-                }
-            }
-        }
-    )
+    @computed_field(description="Profit (income - expenses - investments)")  # type: ignore[prop-decorator]
+    @cached_property
+    def profit(self) -> float:
+        return round(self.total_income - self.total_expense - self.total_investment, 2)
+
+    @computed_field(description="Net cash flow (income - expenses - investments - savings)")  # type: ignore[prop-decorator]
+    @cached_property
+    def net_cash_flow(self) -> float:
+        return round(self.profit - self.total_saving, 2)
 
 
 class SavingsFundsData(BaseModel):
@@ -177,39 +277,37 @@ class SavingsFundsData(BaseModel):
     user_id_fk: str = Field(..., description="ID of the user who owns the savings fund")
     fund_name: str = Field(..., description="Name of the savings fund")
     target_amount: int = Field(..., description="Target amount for the savings fund")
-    fund_is_active: Optional[bool] = Field(True, description="Whether the fund is active")
-    current_amount: Optional[float] = Field(0.0, description="Current amount in the savings fund")
-    net_flow_30d: Optional[float] = Field(0.0, description="Net flow of the savings fund in the last 30 days")
-    created_at: Optional[str] = Field(..., description="Creation timestamp of the savings fund")
+    fund_is_active: bool | None = Field(True, description="Whether the fund is active")
+    current_amount: float | None = Field(0.0, description="Current amount in the savings fund")
+    net_flow_30d: float | None = Field(0.0, description="Net flow of the savings fund in the last 30 days")
+    created_at: str | None = Field(..., description="Creation timestamp of the savings fund")
 
     model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "savings_funds_id_pk": "123aaa",
-                "user_id_fk": "456user",
-                "fund_name": "Emergency Fund",
-                "target_amount": 5000,
-                "created_at": "2025-01-15T10:30:00Z"
-            }
-        }
+        frozen=True,
+        extra='ignore',
     )
 
+    @classmethod
+    def from_row(cls, row: dict[str, Any], validate: bool = False) -> "SavingsFundsData":
+        """Build from a trusted DB row without running validators"""
+        if validate:
+            return cls.model_validate(row)
+        return cls.model_construct(**row)
+
 class RecurringData(BaseModel):
     """Schema for a recurring transaction template"""
-    recurring_id_pk: Optional[str] = Field(None, description="Recurring template ID")
-    user_id_fk: Optional[str] = Field(None, description="User ID")
+    recurring_id_pk: str | None = Field(None, description="Recurring template ID")
+    user_id_fk: str | None = Field(None, description="User ID")
     account_id_fk: str = Field(..., description="Account ID")
     category_id_fk: int = Field(..., description="Category ID")
-    savings_fund_id_fk: Optional[str] = Field(None, description="Savings fund ID")
-    amount: Decimal = Field(..., description="Transaction amount (signed)")
+    savings_fund_id_fk: str | None = Field(None, description="Savings fund ID")
+    amount: FloatDecimal = Field(..., description="Transaction amount (signed)")
     cadence: str = Field(..., description="Recurrence cadence: weekly|biweekly|monthly|quarterly|yearly")
     next_date: Date = Field(..., description="Next due date")
-    notes: Optional[str] = Field(None, description="Notes")
-    is_active: Optional[bool] = Field(True, description="Whether template is active")
-    created_at: Optional[datetime] = Field(None, description="Created at")
-    updated_at: Optional[datetime] = Field(None, description="Updated at")
-
-    model_config = ConfigDict(json_encoders={Decimal: float})
+    notes: str | None = Field(None, description="Notes")
+    is_active: bool | None = Field(True, description="Whether template is active")
+    created_at: datetime | None = Field(None, description="Created at")
+    updated_at: datetime | None = Field(None, description="Updated at")
 
 
 class RecurringSummary(BaseModel):
@@ -230,54 +328,61 @@ class TokenData(BaseModel):
     refresh_token: str = Field(..., description="Refresh token")
     user_id: str = Field(..., description="User ID")
 
+
+class LoginUserData(BaseModel):
+    """Subset of the Supabase auth user returned on login/refresh"""
+    id: str = Field(..., description="User ID")
+    email: str | None = Field(None, description="User email address")
+    role: str | None = Field(None, description="User role")
+    aud: str | None = Field(None, description="Token audience")
+    email_confirmed_at: datetime | None = Field(None, description="Email confirmation timestamp")
+    created_at: datetime | None = Field(None, description="Account creation timestamp")
+    updated_at: datetime | None = Field(None, description="Account update timestamp")
+
+    # Validated straight from the Supabase auth objects; their remaining attributes are dropped
+    model_config = ConfigDict(from_attributes=True, extra='ignore')
+
+
+class LoginSessionData(BaseModel):
+    """Subset of the Supabase auth session returned on login/refresh"""
+    access_token: str = Field(..., description="Access token")
+    refresh_token: str = Field(..., description="Refresh token")
+    expires_in: int | None = Field(None, description="Access token lifetime in seconds")
+    expires_at: int | None = Field(None, description="Access token expiry (unix timestamp)")
+    token_type: str | None = Field(None, description="Token type")
+
+    model_config = ConfigDict(from_attributes=True, extra='ignore')
+
+
+class LoginSessionPayload(BaseModel):
+    """User and session returned by the login/register endpoints"""
+    user: LoginUserData = Field(..., description="Authenticated user")
+    session: LoginSessionData | None = Field(None, description="Session tokens")
+
 # ================================================================================================
 #                                Monthly Analytics Schemas
 # ================================================================================================
 
-class DailySpendingData(BaseModel):
+@dataclass(slots=True, frozen=True)
+class DailySpendingData:
     """Schema for daily spending heatmap data"""
     day: str = Field(..., description="Date in YYYY-MM-DD format")
     amount: float = Field(..., description="Total spending amount for the day")
 
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "day": "2025-01-15",
-                "amount": 125.50
-            }
-        }
-    )
-
 
-class CategoryBreakdownData(BaseModel):
+@dataclass(slots=True, frozen=True)
+class CategoryBreakdownData:
     """Schema for category breakdown data"""
     category: str = Field(..., description="Category name")
     total: float = Field(..., description="Total amount for the category")
 
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "category": "Groceries",
-                "total": 450.75
-            }
-        }
-    )
 
-
-class SpendingTypeBreakdownData(BaseModel):
+@dataclass(slots=True, frozen=True)
+class SpendingTypeBreakdownData:
     """Schema for spending type breakdown data"""
     type: str = Field(..., description="Spending type (Core, Fun, or Future)")
     amount: float = Field(..., description="Total amount for the spending type")
 
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "type": "Core",
-                "amount": 1250.00
-            }
-        }
-    )
-
 
 
 class RunRateForecast(BaseModel):
@@ -287,18 +392,24 @@ class RunRateForecast(BaseModel):
     days_elapsed: int = Field(..., description="Number of days elapsed in the month")
     days_remaining: int = Field(..., description="Number of days remaining in the month")
 
+    model_config = ConfigDict(frozen=True)
+
 
 class DaySplit(BaseModel):
     """Schema for weekend vs weekday spending split"""
     average_weekday_spend: float = Field(..., description="Average daily spend on weekdays")
     average_weekend_spend: float = Field(..., description="Average daily spend on weekends")
 
+    model_config = ConfigDict(frozen=True)
+
 
 class CategoryConcentration(BaseModel):
     """Schema for category concentration insights"""
     top_3_share_pct: float = Field(..., description="Percentage share of expenses from top 3 categories")
     top_3_categories: List[CategoryBreakdownData] = Field(..., description="Top 3 categories by spending")
 
+    model_config = ConfigDict(frozen=True)
+
 
 class MonthlyPeriodComparison(BaseModel):
     """Schema for monthly period-over-period comparison"""
@@ -315,6 +426,8 @@ class MonthlyPeriodComparison(BaseModel):
     cashflow_delta: float = Field(..., description="Absolute change in cashflow vs previous month")
     cashflow_delta_pct: float = Field(..., description="Percentage change in cashflow vs previous month")
 
+    model_config = ConfigDict(frozen=True)
+
 
 class MonthlyAnalyticsData(BaseModel):
     """Schema for monthly analytics data"""
@@ -342,33 +455,7 @@ class MonthlyAnalyticsData(BaseModel):
     expenses_breakdown: List[CategoryBreakdownData] = Field(..., description="Expenses breakdown by category")
     spending_type_breakdown: List[SpendingTypeBreakdownData] = Field(..., description="Breakdown by spending type")
 
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "year": 2025,
-                "month": 1,
-                "month_name": "January",
-                "income": 5000.00,
-                "expenses": 2500.00,
-                "savings": 1000.00,
-                "investments": 500.00,
-                "profit": 2000.00,
-                "cashflow": 1000.00,
-                "daily_spending_heatmap": [
-                    {"day": "2025-01-15", "amount": 125.50},
-                    {"day": "2025-01-16", "amount": 75.25}
-                ],
-                "category_breakdown": [
-                    {"category": "Salary", "total": 5000.00},
-                    {"category": "Groceries", "total": 450.75}
-                ],
-                "spending_type_breakdown": [
-                    {"type": "Core", "amount": 1250.00},
-                    {"type": "Fun", "amount": 300.00}
-                ]
-            }
-        }
-    )
+    model_config = ConfigDict(frozen=True)
 
 
 # ================================================================================================
@@ -376,7 +463,8 @@ class MonthlyAnalyticsData(BaseModel):
 # ================================================================================================
 
 
-class MonthMetric(BaseModel):
+@dataclass(slots=True, frozen=True)
+class MonthMetric:
     """Schema for single month metric"""
     month: str = Field(..., description="Month name")
     value: float = Field(..., description="Metric value")
@@ -387,7 +475,10 @@ class YearlyHighlights(BaseModel):
     highest_expense_month: MonthMetric = Field(..., description="Month with highest expenses")
     highest_savings_rate_month: MonthMetric = Field(..., description="Month with highest savings rate")
 
-class TrendDirectionItem(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+@dataclass(slots=True, frozen=True)
+class TrendDirectionItem:
     """Schema for a single trend direction metric"""
     direction: str = Field(..., description="Trend direction: 'growing', 'stable', or 'declining'")
     avg_monthly_change_pct: float = Field(..., description="Average monthly change as percentage")
@@ -398,6 +489,8 @@ class TrendDirectionMetrics(BaseModel):
     savings_rate_trend: TrendDirectionItem = Field(..., description="Savings rate trend direction")
     core_expense_trend: TrendDirectionItem = Field(..., description="Core expense trend direction")
 
+    model_config = ConfigDict(frozen=True)
+
 
 class YearlySpendingBalance(BaseModel):
     """Schema for yearly spending balance"""
@@ -405,6 +498,11 @@ class YearlySpendingBalance(BaseModel):
     fun_share_pct: float = Field(..., description="Share of Fun expenses (%)")
     future_share_pct: float = Field(..., description="Share of Future expenses (%)")
 
+    model_config = ConfigDict(frozen=True)
+
+# (category name, amount) pairs, largest amount first; serialized as a JSON array of [name, amount] arrays
+CategoryAmounts = tuple[tuple[str, float], ...]
+
 class YearlyAnalyticsData(BaseModel):
     """Schema for yearly analytics data"""
     year: int = Field(..., description="Year of the analytics")
@@ -435,55 +533,12 @@ class YearlyAnalyticsData(BaseModel):
     monthly_future_expense: List[float] = Field(..., description="Monthly future expense amounts")
     monthly_savings_rate: List[float] = Field(..., description="Monthly savings rate percentages")
     monthly_investment_rate: List[float] = Field(..., description="Monthly investment rate percentages")
-    by_category: dict[str, float] = Field(..., description="Breakdown by category")
-    core_categories: dict[str, float] = Field(..., description="Core category breakdown")
-    income_by_category: dict[str, float] = Field(..., description="Income breakdown by category")
-    expense_by_category: dict[str, float] = Field(..., description="Expense breakdown by category")
+    by_category: CategoryAmounts = Field(..., description="Breakdown by category, largest first")
+    core_categories: CategoryAmounts = Field(..., description="Core category breakdown, largest first")
+    income_by_category: CategoryAmounts = Field(..., description="Income breakdown by category, largest first")
+    expense_by_category: CategoryAmounts = Field(..., description="Expense breakdown by category, largest first")
 
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "year": 2024,
-                "total_income": 60000.00,
-                "total_expense": 45000.00,
-                "total_saving": 10000.00,
-                "total_investment": 5000.00,
-                "total_core_expense": 30000.00,
-                "total_fun_expense": 15000.00,
-                "total_future_expense": 5000.00,
-                "profit": 15000.00,
-                "net_cash_flow": 0.00,
-                "savings_rate": 16.67,
-                "investment_rate": 8.33,
-                "months": ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"],
-                "monthly_income": [5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000, 5000],
-                "monthly_expense": [3750, 3750, 3750, 3750, 3750, 3750, 3750, 3750, 3750, 3750, 3750, 3750],
-                "monthly_saving": [833, 833, 833, 833, 833, 833, 833, 833, 833, 833, 833, 833],
-                "monthly_investment": [417, 417, 417, 417, 417, 417, 417, 417, 417, 417, 417, 417],
-                "monthly_core_expense": [2500, 2500, 2500, 2500, 2500, 2500, 2500, 2500, 2500, 2500, 2500, 2500],
-                "monthly_fun_expense": [1250, 1250, 1250, 1250, 1250, 1250, 1250, 1250, 1250, 1250, 1250, 1250],
-                "monthly_future_expense": [417, 417, 417, 417, 417, 417, 417, 417, 417, 417, 417, 417],
-                "monthly_savings_rate": [16.67, 16.67, 16.67, 16.67, 16.67, 16.67, 16.67, 16.67, 16.67, 16.67, 16.67, 16.67],
-                "monthly_investment_rate": [8.33, 8.33, 8.33, 8.33, 8.33, 8.33, 8.33, 8.33, 8.33, 8.33, 8.33, 8.33],
-                "by_category": {
-                    "Salary": 60000.00,
-                    "Rent": -18000.00,
-                    "Groceries": -12000.00
-                },
-                "core_categories": {
-                    "Rent": 18000.00,
-                    "Groceries": 12000.00
-                },
-                "income_by_category": {
-                    "Salary": 60000.00
-                },
-                "expense_by_category": {
-                    "Rent": 18000.00,
-                    "Groceries": 12000.00
-                }
-            }
-        }
-    )
+    model_config = ConfigDict(frozen=True)
 
 
 class EmergencyFundData(BaseModel):
@@ -495,7 +550,7 @@ class EmergencyFundData(BaseModel):
     total_core_expenses: float = Field(..., description="Total core expenses for the year")
     three_month_core_target: float = Field(..., description="Target amount for 3-month core emergency fund")
     six_month_core_target: float = Field(..., description="Target amount for 6-month core emergency fund")
-    core_category_breakdown: dict[str, float] = Field(..., description="Breakdown of core expenses by category")
+    core_category_breakdown: CategoryAmounts = Field(..., description="Breakdown of core expenses by category, largest first")
     
     # Core + Necessary Expenses (New)
     average_monthly_core_necessary: float = Field(..., description="Average monthly core + necessary expenses")
@@ -513,23 +568,7 @@ class EmergencyFundData(BaseModel):
     current_savings_amount: float = Field(..., description="Current total amount in savings funds")
     months_analyzed: int = Field(..., description="Number of months with data")
 
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "year": 2024,
-                "average_monthly_core_expenses": 2500.00,
-                "total_core_expenses": 30000.00,
-                "three_month_fund_target": 7500.00,
-                "six_month_fund_target": 15000.00,
-                "core_category_breakdown": {
-                    "Rent": 18000.00,
-                    "Groceries": 8000.00,
-                    "Utilities": 4000.00
-                },
-                "months_analyzed": 12
-            }
-        }
-    )
+    model_config = ConfigDict(frozen=True)
 
 
 # ================================================================================================
@@ -538,69 +577,63 @@ class EmergencyFundData(BaseModel):
 
 class IdentityData(BaseModel):
     """Schema for user identity provider data"""
-    id: Optional[str] = Field(None, description="Identity ID")
-    identity_id: Optional[str] = Field(None, description="Provider identity ID")
-    user_id: Optional[str] = Field(None, description="Associated user ID")
-    provider: Optional[str] = Field(None, description="Identity provider name")
-    identity_data: Optional[dict] = Field(None, description="Provider-specific identity data")
-    created_at: Optional[datetime] = Field(None, description="Identity creation timestamp")
-    last_sign_in_at: Optional[datetime] = Field(None, description="Last sign in timestamp")
-    updated_at: Optional[datetime] = Field(None, description="Identity update timestamp")
+    id: str | None = Field(None, description="Identity ID")
+    identity_id: str | None = Field(None, description="Provider identity ID")
+    user_id: str | None = Field(None, description="Associated user ID")
+    provider: str | None = Field(None, description="Identity provider name")
+    identity_data: dict | None = Field(None, description="Provider-specific identity data")
+    created_at: datetime | None = Field(None, description="Identity creation timestamp")
+    last_sign_in_at: datetime | None = Field(None, description="Last sign in timestamp")
+    updated_at: datetime | None = Field(None, description="Identity update timestamp")
+
+    model_config = ConfigDict(frozen=True)
+
+
+class ProfileExtensions(BaseModel):
+    """Rarely-set profile fields (pending changes, recovery/invite state, MFA); attached only when any is set"""
+    email_change_sent_at: datetime | None = Field(None, description="Email change request timestamp")
+    new_email: str | None = Field(None, description="Pending new email address")
+    phone_confirmed_at: datetime | None = Field(None, description="Phone confirmation timestamp")
+    new_phone: str | None = Field(None, description="Pending new phone number")
+    confirmation_sent_at: datetime | None = Field(None, description="Confirmation email sent timestamp")
+    recovery_sent_at: datetime | None = Field(None, description="Recovery email sent timestamp")
+    invited_at: datetime | None = Field(None, description="Invitation sent timestamp")
+    factors: List[dict] | None = Field(None, description="MFA factors")
+    action_link: str | None = Field(None, description="Pending action link")
+
+    model_config = ConfigDict(frozen=True)
 
 
 class ProfileData(BaseModel):
     """Schema for user profile data"""
     # Core identity
-    id: Optional[str] = Field(None, description="User ID")
-    aud: Optional[str] = Field(None, description="Audience claim")
-    role: Optional[str] = Field(None, description="User role")
+    id: str | None = Field(None, description="User ID")
+    aud: str | None = Field(None, description="Audience claim")
+    role: str | None = Field(None, description="User role")
     is_anonymous: bool = Field(False, description="Whether user is anonymous")
     
-    # Email information
-    email: Optional[str] = Field(None, description="User email address")
-    email_confirmed_at: Optional[datetime] = Field(None, description="Email confirmation timestamp")
-    email_change_sent_at: Optional[datetime] = Field(None, description="Email change request timestamp")
-    new_email: Optional[str] = Field(None, description="Pending new email address")
-    
-    # Phone information
-    phone: Optional[str] = Field(None, description="User phone number")
-    phone_confirmed_at: Optional[datetime] = Field(None, description="Phone confirmation timestamp")
-    new_phone: Optional[str] = Field(None, description="Pending new phone number")
+    # Contact information
+    email: str | None = Field(None, description="User email address")
+    email_confirmed_at: datetime | None = Field(None, description="Email confirmation timestamp")
+    phone: str | None = Field(None, description="User phone number")
     
     # Authentication timestamps
-    created_at: Optional[datetime] = Field(None, description="Account creation timestamp")
-    updated_at: Optional[datetime] = Field(None, description="Profile update timestamp")
-    last_sign_in_at: Optional[datetime] = Field(None, description="Last sign in timestamp")
-    confirmed_at: Optional[datetime] = Field(None, description="Account confirmation timestamp")
-    confirmation_sent_at: Optional[datetime] = Field(None, description="Confirmation email sent timestamp")
-    recovery_sent_at: Optional[datetime] = Field(None, description="Recovery email sent timestamp")
-    invited_at: Optional[datetime] = Field(None, description="Invitation sent timestamp")
+    created_at: datetime | None = Field(None, description="Account creation timestamp")
+    updated_at: datetime | None = Field(None, description="Profile update timestamp")
+    last_sign_in_at: datetime | None = Field(None, description="Last sign in timestamp")
+    confirmed_at: datetime | None = Field(None, description="Account confirmation timestamp")
     
     # Metadata
-    app_metadata: Optional[dict] = Field(None, description="Application-specific metadata")
-    user_metadata: Optional[dict] = Field(None, description="User-specific metadata")
+    app_metadata: dict | None = Field(None, description="Application-specific metadata")
+    user_metadata: dict | None = Field(None, description="User-specific metadata")
     
-    # Identity and security
-    identities: Optional[List[IdentityData]] = Field(None, description="User identity providers")
-    factors: Optional[List[dict]] = Field(None, description="MFA factors")
-    action_link: Optional[str] = Field(None, description="Pending action link")
+    # Identity providers
+    identities: List[IdentityData] | None = Field(None, description="User identity providers")
 
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "id": "user123",
-                "aud": "authenticated",
-                "role": "authenticated",
-                "is_anonymous": False,
-                "email": "user@example.com",
-                "email_confirmed_at": "2025-01-15T10:30:00Z",
-                "created_at": "2025-01-15T10:30:00Z",
-                "last_sign_in_at": "2025-01-20T14:00:00Z",
-                "app_metadata": {},
-                "user_metadata": {"full_name": "John Doe"}
-            }
-        }
-    )
+    # Rarely-set fields; None unless at least one of them has a value
+    extensions: ProfileExtensions | None = Field(None, description="Pending changes, recovery/invite state and MFA factors")
+
+    model_config = ConfigDict(frozen=True)
 
 # ================================================================================================
 #                                      Budget Schemas
@@ -610,33 +643,33 @@ class ProfileData(BaseModel):
 class IncomeRowResponse(BaseModel):
     name: str = Field(..., description="Name of the income source")
     amount: Decimal = Field(..., description="Amount allocated for this income source")
-    actual_amount: Optional[Decimal] = Field(None, description="Actual amount received for this income source")
-    difference_pct: Optional[Decimal] = Field(None, description="Difference between allocated and actual amount")
-    category_id: Optional[int] = Field(None, description="Linked category ID used for actuals calculation")
+    actual_amount: Decimal | None = Field(None, description="Actual amount received for this income source")
+    difference_pct: Decimal | None = Field(None, description="Difference between allocated and actual amount")
+    category_id: int | None = Field(None, description="Linked category ID used for actuals calculation")
     include_in_total: bool = Field(True, description="Whether to include this row in the total calculations")
 
 class ExpenseRowResponse(BaseModel):
     name: str = Field(..., description="Name of the expense category")
     amount: Decimal = Field(..., description="Amount allocated for this expense category")
-    actual_amount: Optional[Decimal] = Field(None, description="Actual amount spent for this expense category")
-    difference_pct: Optional[Decimal] = Field(None, description="Difference between allocated and actual amount")
-    category_id: Optional[int] = Field(None, description="Linked category ID used for actuals calculation")
+    actual_amount: Decimal | None = Field(None, description="Actual amount spent for this expense category")
+    difference_pct: Decimal | None = Field(None, description="Difference between allocated and actual amount")
+    category_id: int | None = Field(None, description="Linked category ID used for actuals calculation")
     include_in_total: bool = Field(True, description="Whether to include this row in the total calculations")
 
 class SavingsRowResponse(BaseModel):
     name: str = Field(..., description="Name of the savings goal")
     amount: Decimal = Field(..., description="Amount allocated for this savings goal")
-    actual_amount: Optional[Decimal] = Field(None, description="Actual amount saved for this savings goal")
-    difference_pct: Optional[Decimal] = Field(None, description="Difference between allocated and actual amount")
-    category_id: Optional[int] = Field(None, description="Linked category ID used for actuals calculation")
+    actual_amount: Decimal | None = Field(None, description="Actual amount saved for this savings goal")
+    difference_pct: Decimal | None = Field(None, description="Difference between allocated and actual amount")
+    category_id: int | None = Field(None, description="Linked category ID used for actuals calculation")
     include_in_total: bool = Field(True, description="Whether to include this row in the total calculations")
 
 class InvestmentRowResponse(BaseModel):
     name: str = Field(..., description="Name of the investment")
     amount: Decimal = Field(..., description="Amount allocated for this investment")
-    actual_amount: Optional[Decimal] = Field(None, description="Actual amount invested")
-    difference_pct: Optional[Decimal] = Field(None, description="Difference between allocated and actual amount")
-    category_id: Optional[int] = Field(None, description="Linked category ID used for actuals calculation")
+    actual_amount: Decimal | None = Field(None, description="Actual amount invested")
+    difference_pct: Decimal | None = Field(None, description="Difference between allocated and actual amount")
+    category_id: int | None = Field(None, description="Linked category ID used for actuals calculation")
     include_in_total: bool = Field(True, description="Whether to include this row in the total calculations")
 
 class BudgetSummaryResponse(BaseModel):
@@ -656,7 +689,7 @@ class BudgetPlanRow(BaseModel):
     name: str = Field(..., min_length=1, max_length=255, description="Name of the budget item")
     amount: Decimal = Field(..., ge=0, description="Planned amount")
     include_in_total: bool = Field(True, description="Whether to include this row in the total calculations")
-    category_id: Optional[int] = Field(None, description="Linked category ID (if any)")
+    category_id: int | None = Field(None, description="Linked category ID (if any)")
 
 class BudgetPlan(BaseModel):
     """Schema for the entire budget plan JSON structure"""
@@ -681,22 +714,10 @@ class DividendYieldFrequency(str, Enum):
 class DividendStockRow(BaseModel):
     """Schema for a single stock row in the dividend portfolio"""
     ticker: str = Field(..., min_length=1, max_length=10, description="Stock ticker symbol")
-    weight_pct: Decimal = Field(..., ge=Decimal("0"), le=Decimal("100"), description="Portfolio weight percentage (0-100)")
-    dividend_yield: Decimal = Field(..., ge=Decimal("0"), description="Dividend yield percentage")
+    weight_pct: FloatDecimal = Field(..., ge=Decimal("0"), le=Decimal("100"), description="Portfolio weight percentage (0-100)")
+    dividend_yield: FloatDecimal = Field(..., ge=Decimal("0"), description="Dividend yield percentage")
     yield_frequency: DividendYieldFrequency = Field(DividendYieldFrequency.ANNUAL, description="Dividend frequency: annual or monthly")
 
-    model_config = ConfigDict(
-        json_encoders={Decimal: float},
-        json_schema_extra={
-            "example": {
-                "ticker": "AAPL",
-                "weight_pct": 25.0,
-                "dividend_yield": 0.55,
-                "yield_frequency": "annual"
-            }
-        }
-    )
-
 
 class DividendPortfolio(BaseModel):
     """Schema for the full portfolio stored as JSON"""
@@ -705,12 +726,8 @@ class DividendPortfolio(BaseModel):
 
 class DividendCalculationResult(BaseModel):
     """Computed dividend metrics returned to the frontend"""
-    weighted_avg_yield: Decimal = Field(..., description="Weighted average annual yield (%)")
-    annual_income: Decimal = Field(..., description="Estimated annual dividend income")
-    monthly_income: Decimal = Field(..., description="Estimated monthly dividend income (annual / 12)")
-    portfolio_value: Decimal = Field(..., description="Total portfolio value used in calculations")
+    weighted_avg_yield: FloatDecimal = Field(..., description="Weighted average annual yield (%)")
+    annual_income: FloatDecimal = Field(..., description="Estimated annual dividend income")
+    monthly_income: FloatDecimal = Field(..., description="Estimated monthly dividend income (annual / 12)")
+    portfolio_value: FloatDecimal = Field(..., description="Total portfolio value used in calculations")
     rows: List[DividendStockRow] = Field(..., description="Stock rows as saved")
-
-    model_config = ConfigDict(
-        json_encoders={Decimal: float}
-    )
@@ -0,0 +1,471 @@
+"""OpenAPI examples for the request/response schemas.
+
+Kept out of the models' `json_schema_extra` so pydantic-core schemas stay lean; the examples are attached to
+the generated OpenAPI document by `inject_examples` (see `backend_server._openapi`).
+"""
+
+from types import MappingProxyType
+from typing import Any, Mapping
+
+
+# ================================================================================================
+#                                       Data Schema Examples
+# ================================================================================================
+
+TRANSACTION_DATA_EXAMPLE: dict[str, Any] = {
+    "id_pk": "1",
+    "user_id_fk": "user123",
+    "account_id_fk": "acc456",
+    "category_id_fk": 2,
+    "amount": 49.99,
+    "date": "2025-01-15",
+    "notes": "Weekly grocery shopping",
+    "created_at": "2025-01-15T10:30:00Z",
+    "savings_fund_id_fk": None
+}
+
+CATEGORY_DATA_EXAMPLE: dict[str, Any] = {
+    "categories_id_pk": 1,
+    "category_name": "Groceries",
+    "type": "expense",
+    "is_active": True,
+    "spending_type": "Core",
+    "created_at": "2025-01-15T10:30:00Z"
+}
+
+SUMMARY_DATA_EXAMPLE: dict[str, Any] = {
+    "total_income": 5000.00,
+    "total_expense": 3500.00,
+    "total_saving": 1000.00,
+    "total_investment": 500.00,
+    "profit": 1500.00,
+    "net_cash_flow": 0.00,
+    "comparison": {
+        "income_delta": 500.00,
+        "income_delta_pct": 11.1,
+        "expense_delta": -200.00,
+        "expense_delta_pct": -5.4,
+        "saving_delta": 100.00,
+        "investment_delta": 0.00,
+        "profit_delta": 700.00,
+        "cashflow_delta": 0.00
+    },
+    "savings_rate": 20.0,
+    "investment_rate": 10.0,
+    "top_expenses": [
+         {"name": "Rent", "total": 1500.0, "share_of_total": 42.8},
+         {"name": "Groceries", "total": 600.0, "share_of_total": 17.1},
+         {"name": "Utilities", "total": 200.0, "share_of_total": 5.7}
+    ],
+    "biggest_mover": {"name": "Travel", "total": 500.0, "share_of_total": 14.2},
+    "largest_transactions": []
+}
+
+SAVINGS_FUNDS_DATA_EXAMPLE: dict[str, Any] = {
+    "savings_funds_id_pk": "123aaa",
+    "user_id_fk": "456user",
+    "fund_name": "Emergency Fund",
+    "target_amount": 5000,
+    "created_at": "2025-01-15T10:30:00Z"
+}
+
+DAILY_SPENDING_DATA_EXAMPLE: dict[str, Any] = {
+    "day": "2025-01-15",
+    "amount": 125.50
+}
+
+CATEGORY_BREAKDOWN_DATA_EXAMPLE: dict[str, Any] = {
+    "category": "Groceries",
+    "total": 450.75
+}
+
+SPENDING_TYPE_BREAKDOWN_DATA_EXAMPLE: dict[str, Any] = {
+    "type": "Core",
+    "amount": 1250.00
+}
+
+MONTHLY_ANALYTICS_DATA_EXAMPLE: dict[str, Any] = {
+    "year": 2025,
+    "month": 1,
+    "month_name": "January",
+    "income": 5000.00,
+    "expenses": 2500.00,
+    "savings": 1000.00,
+    "investments": 500.00,
+    "profit": 2000.00,
+    "cashflow": 1000.00,
+    "daily_spending_heatmap": [
+        {"day": "2025-01-15", "amount": 125.50},
+        {"day": "2025-01-16", "amount": 75.25}
+    ],
+    "category_breakdown": [
+        {"category": "Salary", "total": 5000.00},
+        {"category": "Groceries", "total": 450.75}
+    ],
+    "spending_type_breakdown": [
+        {"type": "Core", "amount": 1250.00},
+        {"type": "Fun", "amount": 300.00}
+    ]
+}
+
+YEARLY_ANALYTICS_DATA_EXAMPLE: dict[str, Any] = {
+    "year": 2024,
+    "total_income": 60000.00,
+    "total_expense": 45000.00,
+    "total_saving": 10000.00,
+    "total_investment": 5000.00,
+    "total_core_expense": 30000.00,
+    "total_fun_expense": 15000.00,
+    "total_future_expense": 5000.00,
+    "profit": 15000.00,
+    "net_cash_flow": 0.00,
+    "savings_rate": 16.67,
+    "investment_rate": 8.33,
+    "months": ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"],
+    "monthly_income": [5000] * 12,
+    "monthly_expense": [3750] * 12,
+    "monthly_saving": [833] * 12,
+    "monthly_investment": [417] * 12,
+    "monthly_core_expense": [2500] * 12,
+    "monthly_fun_expense": [1250] * 12,
+    "monthly_future_expense": [417] * 12,
+    "monthly_savings_rate": [16.67] * 12,
+    "monthly_investment_rate": [8.33] * 12,
+    "by_category": [
+        ["Salary", 60000.00],
+        ["Groceries", -12000.00],
+        ["Rent", -18000.00]
+    ],
+    "core_categories": [
+        ["Rent", 18000.00],
+        ["Groceries", 12000.00]
+    ],
+    "income_by_category": [
+        ["Salary", 60000.00]
+    ],
+    "expense_by_category": [
+        ["Rent", 18000.00],
+        ["Groceries", 12000.00]
+    ]
+}
+
+EMERGENCY_FUND_DATA_EXAMPLE: dict[str, Any] = {
+    "year": 2024,
+    "average_monthly_core_expenses": 2500.00,
+    "total_core_expenses": 30000.00,
+    "three_month_fund_target": 7500.00,
+    "six_month_fund_target": 15000.00,
+    "core_category_breakdown": [
+        ["Rent", 18000.00],
+        ["Groceries", 8000.00],
+        ["Utilities", 4000.00]
+    ],
+    "months_analyzed": 12
+}
+
+PROFILE_DATA_EXAMPLE: dict[str, Any] = {
+    "id": "user123",
+    "aud": "authenticated",
+    "role": "authenticated",
+    "is_anonymous": False,
+    "email": "user@example.com",
+    "email_confirmed_at": "2025-01-15T10:30:00Z",
+    "created_at": "2025-01-15T10:30:00Z",
+    "last_sign_in_at": "2025-01-20T14:00:00Z",
+    "app_metadata": {},
+    "user_metadata": {"full_name": "John Doe"}
+}
+
+DIVIDEND_STOCK_ROW_EXAMPLE: dict[str, Any] = {
+    "ticker": "AAPL",
+    "weight_pct": 25.0,
+    "dividend_yield": 0.55,
+    "yield_frequency": "annual"
+}
+
+
+# ================================================================================================
+#                                     Request Schema Examples
+# ================================================================================================
+
+TRANSACTION_REQUEST_EXAMPLE: dict[str, Any] = {
+    "account_id_fk": "",
+    "category_id_fk": 2,
+    "amount": 49.99,
+    "date": "2025-01-15",
+    "notes": "",
+    "created_at": "2025-01-15T10:30:00Z",
+    "savings_fund_id_fk": None
+}
+
+ACCOUNT_REQUEST_EXAMPLE: dict[str, Any] = {
+    "account_name": "",
+    "type": "",
+    "currency": "",
+    "created_at": "2025-01-15T10:30:00Z"
+}
+
+SAVINGS_FUNDS_REQUEST_EXAMPLE: dict[str, Any] = {
+    "user_id": "456user",
+    "fund_name": "Emergency Fund",
+    "target_amount": 5000
+}
+
+UPDATE_PROFILE_REQUEST_EXAMPLE: dict[str, Any] = {
+    "full_name": "John Doe",
+    "currency": "CZK",
+    "locale": "cs-CZ"
+}
+
+FORGOT_PASSWORD_REQUEST_EXAMPLE: dict[str, Any] = {
+    "email": "user@example.com"
+}
+
+RESET_PASSWORD_REQUEST_EXAMPLE: dict[str, Any] = {
+    "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
+    "new_password": "newSecurePassword123"
+}
+
+CATEGORY_REQUEST_EXAMPLE: dict[str, Any] = {
+    "category_name": "Groceries",
+    "type": "expense",
+    "spending_type": "Necessary",
+    "is_active": True
+}
+
+CATEGORY_UPDATE_REQUEST_EXAMPLE: dict[str, Any] = {
+    "category_name": "Housing",
+    "type": "expense",
+    "spending_type": "Core",
+    "is_active": True
+}
+
+DIVIDEND_PORTFOLIO_REQUEST_EXAMPLE: dict[str, Any] = {
+    "portfolio_value": 10000.00,
+    "portfolio": [
+        {
+            "ticker": "AAPL",
+            "weight_pct": 50.0,
+            "dividend_yield": 0.55,
+            "yield_frequency": "annual"
+        },
+        {
+            "ticker": "JNJ",
+            "weight_pct": 50.0,
+            "dividend_yield": 3.0,
+            "yield_frequency": "annual"
+        }
+    ]
+}
+
+
+# ================================================================================================
+#                                     Response Schema Examples
+# ================================================================================================
+
+MESSAGE_RESPONSE_EXAMPLE: dict[str, Any] = {
+    "success": True,
+    "message": "Operation completed successfully"
+}
+
+OAUTH_URL_RESPONSE_EXAMPLE: dict[str, Any] = {
+    "url": "https://github.com/login/oauth/authorize?...",
+    "provider": "github"
+}
+
+CATEGORIES_RESPONSE_EXAMPLE: dict[str, Any] = {
+    "data": [CATEGORY_DATA_EXAMPLE],
+    "count": 1,
+    "success": True,
+    "message": "Categories retrieved successfully"
+}
+
+CATEGORY_SUCCESS_RESPONSE_EXAMPLE: dict[str, Any] = {
+    "success": True,
+    "message": "Category created successfully",
+    "data": [CATEGORY_DATA_EXAMPLE]
+}
+
+ACCOUNTS_RESPONSE_EXAMPLE: dict[str, Any] = {
+    "data": [
+        {
+            "accounts_id_pk": "acc456",
+            "user_id_fk": "user123",
+            "account_name": "Main Checking Account",
+            "type": "checking",
+            "currency": "USD",
+            "created_at": "2025-01-15T10:30:00Z"
+        },
+        {
+            "accounts_id_pk": "acc789",
+            "user_id_fk": "user123",
+            "account_name": "Savings Account",
+            "type": "savings",
+            "currency": "USD",
+            "created_at": "2025-01-16T11:00:00Z"
+        }
+    ],
+    "count": 2,
+}
+
+SUMMARY_RESPONSE_EXAMPLE: dict[str, Any] = {
+    "data": {
+        "total_income": 5000.00,
+        "total_expense": 3500.00,
+        "total_saving": 1000.00,
+        "total_investment": 500.00,
+        "profit": 1500.00,
+        "net_cash_flow": 0.00
+    },
+    "success": True,
+    "message": "Financial summary retrieved successfully"
+}
+
+MONTHLY_ANALYTICS_RESPONSE_EXAMPLE: dict[str, Any] = {
+    "data": {
+        "year": 2025,
+        "month": 1,
+        "month_name": "January",
+        "income": 5000.00,
+        "expenses": 2500.00,
+        "savings": 1000.00,
+        "investments": 500.00,
+        "profit": 2000.00,
+        "cashflow": 1000.00,
+        "daily_spending_heatmap": [
+            {"day": "2025-01-15", "amount": 125.50}
+        ],
+        "category_breakdown": [
+            {"category": "Salary", "total": 5000.00}
+        ],
+        "spending_type_breakdown": [
+            {"type": "Core", "amount": 1250.00}
+        ]
+    },
+    "success": True,
+    "message": "Monthly analytics for January 2025 retrieved successfully"
+}
+
+ACCOUNT_SUCCESS_RESPONSE_EXAMPLE: dict[str, Any] = {
+    "success": True,
+    "message": "Account created successfully"
+}
+
+LOGIN_RESPONSE_EXAMPLE: dict[str, Any] = {
+    "access_token": "access_token_value",
+    "refresh_token": "refresh_token_value",
+    "user_id": "user123",
+    "data": {
+        "user": {
+            "id": "user123",
+            "email": "user@example.com"
+        },
+        "session": {
+            "access_token": "access_token_value",
+            "refresh_token": "refresh_token_value"
+        }
+    }
+}
+
+TRANSACTIONS_RESPONSE_EXAMPLE: dict[str, Any] = {
+    "data": [TRANSACTION_DATA_EXAMPLE],
+    "count": 1,
+    "success": True,
+    "message": "Transactions retrieved successfully"
+}
+
+TRANSACTION_SUCCESS_RESPONSE_EXAMPLE: dict[str, Any] = {
+    "success": True,
+    "message": "Transaction created successfully",
+    "data": [TRANSACTION_DATA_EXAMPLE]
+}
+
+SAVINGS_FUNDS_RESPONSE_EXAMPLE: dict[str, Any] = {
+    "data": [SAVINGS_FUNDS_DATA_EXAMPLE],
+    "count": 1,
+    "success": True,
+    "message": "Savings funds retrieved successfully"
+}
+
+SAVINGS_FUND_SUCCESS_RESPONSE_EXAMPLE: dict[str, Any] = {
+    "success": True,
+    "message": "Savings fund created successfully",
+    "data": [SAVINGS_FUNDS_DATA_EXAMPLE]
+}
+
+PROFILE_RESPONSE_EXAMPLE: dict[str, Any] = {
+    "data": {
+        "id": "user123",
+        "email": "user@example.com",
+        "role": "authenticated"
+    },
+    "success": True,
+    "message": "Profile retrieved successfully"
+}
+
+BUDGET_SUCCESS_RESPONSE_EXAMPLE: dict[str, Any] = {
+    "success": True,
+    "message": "Budget created successfully"
+}
+
+DIVIDEND_PORTFOLIO_SUCCESS_RESPONSE_EXAMPLE: dict[str, Any] = {
+    "success": True,
+    "message": "Dividend portfolio saved successfully"
+}
+
+
+# ================================================================================================
+#                                             Registry
+# ================================================================================================
+
+# Component schema name -> example; read-only so nothing can re-register or drop an example at runtime
+SCHEMA_EXAMPLES: Mapping[str, dict[str, Any]] = MappingProxyType({
+    "TransactionData": TRANSACTION_DATA_EXAMPLE,
+    "CategoryData": CATEGORY_DATA_EXAMPLE,
+    "SummaryData": SUMMARY_DATA_EXAMPLE,
+    "SavingsFundsData": SAVINGS_FUNDS_DATA_EXAMPLE,
+    "DailySpendingData": DAILY_SPENDING_DATA_EXAMPLE,
+    "CategoryBreakdownData": CATEGORY_BREAKDOWN_DATA_EXAMPLE,
+    "SpendingTypeBreakdownData": SPENDING_TYPE_BREAKDOWN_DATA_EXAMPLE,
+    "MonthlyAnalyticsData": MONTHLY_ANALYTICS_DATA_EXAMPLE,
+    "YearlyAnalyticsData": YEARLY_ANALYTICS_DATA_EXAMPLE,
+    "EmergencyFundData": EMERGENCY_FUND_DATA_EXAMPLE,
+    "ProfileData": PROFILE_DATA_EXAMPLE,
+    "DividendStockRow": DIVIDEND_STOCK_ROW_EXAMPLE,
+    "TransactionRequest": TRANSACTION_REQUEST_EXAMPLE,
+    "AccountRequest": ACCOUNT_REQUEST_EXAMPLE,
+    "SavingsFundsRequest": SAVINGS_FUNDS_REQUEST_EXAMPLE,
+    "UpdateProfileRequest": UPDATE_PROFILE_REQUEST_EXAMPLE,
+    "ForgotPasswordRequest": FORGOT_PASSWORD_REQUEST_EXAMPLE,
+    "ResetPasswordRequest": RESET_PASSWORD_REQUEST_EXAMPLE,
+    "CategoryRequest": CATEGORY_REQUEST_EXAMPLE,
+    "CategoryUpdateRequest": CATEGORY_UPDATE_REQUEST_EXAMPLE,
+    "DividendPortfolioRequest": DIVIDEND_PORTFOLIO_REQUEST_EXAMPLE,
+    "MessageResponse": MESSAGE_RESPONSE_EXAMPLE,
+    "OAuthUrlResponse": OAUTH_URL_RESPONSE_EXAMPLE,
+    "CategoriesResponse": CATEGORIES_RESPONSE_EXAMPLE,
+    "CategorySuccessResponse": CATEGORY_SUCCESS_RESPONSE_EXAMPLE,
+    "AccountsResponse": ACCOUNTS_RESPONSE_EXAMPLE,
+    "SummaryResponse": SUMMARY_RESPONSE_EXAMPLE,
+    "MonthlyAnalyticsResponse": MONTHLY_ANALYTICS_RESPONSE_EXAMPLE,
+    "AccountSuccessResponse": ACCOUNT_SUCCESS_RESPONSE_EXAMPLE,
+    "LoginResponse": LOGIN_RESPONSE_EXAMPLE,
+    "TransactionsResponse": TRANSACTIONS_RESPONSE_EXAMPLE,
+    "TransactionSuccessResponse": TRANSACTION_SUCCESS_RESPONSE_EXAMPLE,
+    "SavingsFundsResponse": SAVINGS_FUNDS_RESPONSE_EXAMPLE,
+    "SavingsFundSuccessResponse": SAVINGS_FUND_SUCCESS_RESPONSE_EXAMPLE,
+    "ProfileResponse": PROFILE_RESPONSE_EXAMPLE,
+    "BudgetSuccessResponse": BUDGET_SUCCESS_RESPONSE_EXAMPLE,
+    "DividendPortfolioSuccessResponse": DIVIDEND_PORTFOLIO_SUCCESS_RESPONSE_EXAMPLE,
+})
+
+
+def inject_examples(openapi_schema: dict[str, Any]) -> dict[str, Any]:
+    """Attach registered examples to the matching component schemas of a generated OpenAPI document"""
+    components = openapi_schema.get("components", {}).get("schemas", {})
+    for name, schema in components.items():
+        # FastAPI suffixes models whose input and output schemas differ with -Input / -Output
+        example = SCHEMA_EXAMPLES.get(name.removesuffix("-Input").removesuffix("-Output"))
+        if example is not None:
+            schema["example"] = example
+    return openapi_schema
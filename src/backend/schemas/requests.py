@@ -1,8 +1,10 @@
 from datetime import date as Date, datetime
 from decimal import Decimal
-from typing import Optional, List
+from typing import List
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
+
+from .base import CategoryType, DecimalCents, FloatDecimal, SpendingType
 
 # ================================================================================================
 #                                   Insert Schemas
@@ -10,52 +12,29 @@ from pydantic import BaseModel, Field, ConfigDict
 
 class TransactionRequest(BaseModel):
     account_id_fk: str = Field(..., description="Account ID associated with the transaction")
-    category_id_fk: int = Field(..., description="Transaction category ID")
-    amount: Decimal = Field(..., description="Transaction amount")
+    category_id_fk: int = Field(..., gt=0, description="Transaction category ID")
+    amount_cents: DecimalCents = Field(..., alias="amount", description="Transaction amount")
     date: Date = Field(..., description="Transaction date")
-    notes: Optional[str] = Field(None, description="Transaction description")
-    created_at: Optional[datetime] = Field(None, description="Record creation timestamp")
-    savings_fund_id_fk: Optional[str] = Field(None, description="Savings fund ID associated with the transaction")
-
-    model_config = ConfigDict(
-        # Allow Decimal to be serialized as float in JSON
-        json_encoders={Decimal: float},
-        # Example for documentation
-        json_schema_extra={
-            "example": {
-                "account_id_fk": "",
-                "category_id_fk": 2,
-                "amount": 49.99,
-                "date": "2025-01-15",
-                "notes": "",
-                "created_at": "2025-01-15T10:30:00Z",
-                "savings_fund_id_fk": None
-            }
-        }
-    )
+    notes: str | None = Field(None, description="Transaction description")
+    created_at: datetime | None = Field(None, description="Record creation timestamp")
+    savings_fund_id_fk: str | None = Field(None, description="Savings fund ID associated with the transaction")
+
+    # Every dump writes `amount_cents` back under its wire name `amount` (the DB column), not only by_alias ones
+    model_config = ConfigDict(serialize_by_alias=True)
+
+    @property
+    def amount(self) -> float:
+        """Transaction amount in major units"""
+        return self.amount_cents / 100
 
 
 class AccountRequest(BaseModel):
     """Schema for creating a new account"""
     account_name: str = Field(..., description="Name of the account")
     type: str = Field(..., description="Type of the account (e.g., 'checking', 'savings')")
-    currency: Optional[str] = Field(..., description="Currency of the account")
-    created_at: Optional[datetime] = Field(None, description="Record creation timestamp")
-    account_is_active: Optional[bool] = Field(None, description="Whether the account is active")
-
-    model_config = ConfigDict(
-        # Allow Decimal to be serialized as float in JSON
-        json_encoders={Decimal: float},
-        # Example for documentation
-        json_schema_extra={
-            "example": {
-                "account_name": "",
-                "type": "",
-                "currency": "",
-                "created_at": "2025-01-15T10:30:00Z"
-            }
-        }
-    )
+    currency: str | None = Field(..., description="Currency of the account")
+    created_at: datetime | None = Field(None, description="Record creation timestamp")
+    account_is_active: bool | None = Field(None, description="Whether the account is active")
 
 class LoginRequest(BaseModel):
     """Schema for user login credentials"""
@@ -67,102 +46,43 @@ class SavingsFundsRequest(BaseModel):
     """Request schema for creating or updating savings funds"""
     user_id_fk: str = Field(..., description="ID of the user who owns the savings fund")
     fund_name: str = Field(..., description="Name of the savings fund")
-    target_amount: int = Field(..., description="Target amount for the savings fund")
-    created_at: Optional[datetime] = Field(None, description="Creation timestamp of the savings fund")
-    fund_is_active: Optional[bool] = Field(None, description="Whether the savings fund is active")
-
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "user_id": "456user",
-                "fund_name": "Emergency Fund",
-                "target_amount": 5000
-            }
-        }
-    )
+    target_amount: int = Field(..., gt=0, lt=10**12, description="Target amount for the savings fund")
+    created_at: datetime | None = Field(None, description="Creation timestamp of the savings fund")
+    fund_is_active: bool | None = Field(None, description="Whether the savings fund is active")
 
 
 class UpdateProfileRequest(BaseModel):
     """Schema for updating user profile"""
-    full_name: Optional[str] = Field(None, description="User full name")
-    currency: Optional[str] = Field(None, description="User preferred currency (e.g., USD, CZK)")
-    locale: Optional[str] = Field(None, description="User preferred locale (e.g., en-US, cs-CZ)")
-
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "full_name": "John Doe",
-                "currency": "CZK",
-                "locale": "cs-CZ"
-            }
-        }
-    )
+    full_name: str | None = Field(None, description="User full name")
+    currency: str | None = Field(None, description="User preferred currency (e.g., USD, CZK)")
+    locale: str | None = Field(None, description="User preferred locale (e.g., en-US, cs-CZ)")
 
 
 class ForgotPasswordRequest(BaseModel):
     """Schema for requesting password reset email"""
     email: str = Field(..., description="User email address")
 
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "email": "user@example.com"
-            }
-        }
-    )
-
 
 class ResetPasswordRequest(BaseModel):
     """Schema for resetting password with access token"""
     access_token: str = Field(..., description="Access token from password reset email link")
     new_password: str = Field(..., min_length=6, description="New password (minimum 6 characters)")
 
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
-                "new_password": "newSecurePassword123"
-            }
-        }
-    )
-
 
 class CategoryRequest(BaseModel):
     """Schema for creating a new category"""
     category_name: str = Field(..., min_length=1, max_length=100, description="Name of the category")
-    type: str = Field(..., description="Category type (expense, income, saving, investment, exclude)")
-    spending_type: str = Field(..., description="Spending type (Core, Necessary, Fun, Future, Income)")
-    is_active: Optional[bool] = Field(True, description="Whether the category is active")
-
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "category_name": "Groceries",
-                "type": "expense",
-                "spending_type": "Necessary",
-                "is_active": True
-            }
-        }
-    )
+    type: CategoryType = Field(..., description="Category type (expense, income, saving, investment, exclude)")
+    spending_type: SpendingType = Field(..., description="Spending type (Core, Necessary, Fun, Future, Income)")
+    is_active: bool | None = Field(True, description="Whether the category is active")
 
 
 class CategoryUpdateRequest(BaseModel):
     """Schema for updating an existing category"""
-    category_name: Optional[str] = Field(None, min_length=1, max_length=100, description="Name of the category")
-    type: Optional[str] = Field(None, description="Category type (expense, income, saving, investment, exclude)")
-    spending_type: Optional[str] = Field(None, description="Spending type (Core, Necessary, Fun, Future, Income)")
-    is_active: Optional[bool] = Field(None, description="Whether the category is active")
-
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "category_name": "Housing",
-                "type": "expense",
-                "spending_type": "Core",
-                "is_active": True
-            }
-        }
-    )
+    category_name: str | None = Field(None, min_length=1, max_length=100, description="Name of the category")
+    type: CategoryType | None = Field(None, description="Category type (expense, income, saving, investment, exclude)")
+    spending_type: SpendingType | None = Field(None, description="Spending type (Core, Necessary, Fun, Future, Income)")
+    is_active: bool | None = Field(None, description="Whether the category is active")
 
 
 # ================================================================================================
@@ -174,40 +94,15 @@ class RecurringRequest(BaseModel):
     """Schema for creating or updating a recurring template"""
     account_id_fk: str = Field(..., description="Account ID")
     category_id_fk: int = Field(..., description="Category ID")
-    savings_fund_id_fk: Optional[str] = Field(None, description="Savings fund ID")
-    amount: Decimal = Field(..., description="Transaction amount (signed)")
+    savings_fund_id_fk: str | None = Field(None, description="Savings fund ID")
+    amount: FloatDecimal = Field(..., description="Transaction amount (signed)")
     cadence: str = Field(..., description="weekly|biweekly|monthly|quarterly|yearly")
     next_date: Date = Field(..., description="Next due date")
-    notes: Optional[str] = Field(None, description="Notes")
-    is_active: Optional[bool] = Field(True, description="Whether template is active")
-
-    model_config = ConfigDict(json_encoders={Decimal: float})
+    notes: str | None = Field(None, description="Notes")
+    is_active: bool | None = Field(True, description="Whether template is active")
 
 
 class DividendPortfolioRequest(BaseModel):
     """Request schema for saving a user's dividend portfolio"""
-    portfolio_value: Decimal = Field(..., ge=Decimal("0"), description="Total portfolio value")
+    portfolio_value: FloatDecimal = Field(..., ge=Decimal("0"), description="Total portfolio value")
     portfolio: List[dict] = Field(..., description="Array of DividendStockRow objects")
-
-    model_config = ConfigDict(
-        json_encoders={Decimal: float},
-        json_schema_extra={
-            "example": {
-                "portfolio_value": 10000.00,
-                "portfolio": [
-                    {
-                        "ticker": "AAPL",
-                        "weight_pct": 50.0,
-                        "dividend_yield": 0.55,
-                        "yield_frequency": "annual"
-                    },
-                    {
-                        "ticker": "JNJ",
-                        "weight_pct": 50.0,
-                        "dividend_yield": 3.0,
-                        "yield_frequency": "annual"
-                    }
-                ]
-            }
-        }
-    )
@@ -1,12 +1,10 @@
-from decimal import Decimal
-from typing import Any, List, Optional
+from typing import Any, List, Self
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, SerializerFunctionWrapHandler, model_serializer
 
 from .base import (
     AccountData,
     CategoryData,
-    CategoryType,
     EmergencyFundData,
     MonthlyAnalyticsData,
     NetWorthTimelineData,
@@ -14,11 +12,14 @@ from .base import (
     RecurringData,
     RecurringSummary,
     SavingsFundsData,
-    SpendingType,
     SummaryData,
+    TransactionColumns,
     TransactionData,
     YearlyAnalyticsData,
     TokenData,
+    LoginSessionData,
+    LoginSessionPayload,
+    LoginUserData,
     IncomeRowResponse,
     ExpenseRowResponse,
     SavingsRowResponse,
@@ -33,241 +34,93 @@ from .base import (
 #                                        Get Schemas
 # ================================================================================================
 
+class TrustedResponse(BaseModel):
+    """Base for envelopes whose payload is built server-side from DB rows or computed aggregates"""
+
+    model_config = ConfigDict(frozen=True)
+
+    @classmethod
+    def from_trusted(cls, validate: bool = False, **fields: Any) -> Self:
+        """Build the envelope without running validators; pass `validate=True` to take the checked path"""
+        if validate:
+            return cls(**fields)
+        return cls.model_construct(**fields)
+
+
+class OmitNoneResponse(BaseModel):
+    """Base for envelopes whose unset optional fields are left off the payload rather than sent as null"""
+
+    # Only top-level keys are dropped; nulls inside the payload records are kept. No return annotation, so the
+    # serialization JSON schema still lists the model's own fields
+    @model_serializer(mode='wrap')
+    def _omit_none(self, handler: SerializerFunctionWrapHandler):
+        return {key: value for key, value in handler(self).items() if value is not None}
+
+
 class MessageResponse(BaseModel):
     """Simple response with success flag and message"""
     success: bool = Field(..., description="Indicates if the request was successful")
     message: str = Field(..., description="Response message")
 
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "success": True,
-                "message": "Operation completed successfully"
-            }
-        }
-    )
-
 
 class OAuthUrlResponse(BaseModel):
     """Response containing OAuth redirect URL"""
     url: str = Field(..., description="OAuth provider authorization URL")
     provider: str = Field(..., description="OAuth provider name")
 
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "url": "https://github.com/login/oauth/authorize?...",
-                "provider": "github"
-            }
-        }
-    )
-
-class AllDataResponse(BaseModel):
-    data: List[TransactionData] = Field(..., description="List of transaction records")
-    count: int = Field(..., description="Total number of records returned")
-    
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "data": [
-                    {
-                        "id_pk": "1",
-                        "user_id_fk": "user123",
-                        "account_id_fk": "acc456",
-                        "category_id_fk": 2,
-                        "amount": 49.99,
-                        "date": "2025-01-15",
-                        "notes": "Weekly grocery shopping",
-                        "created_at": "2025-01-15T10:30:00Z",
-                        "savings_fund_id_fk": None
-                    },
-                    {
-                        "id_pk": "2",
-                        "user_id_fk": "user123",
-                        "account_id_fk": "acc789",
-                        "category_id_fk": 3,
-                        "amount": 19.99,
-                        "date": "2025-01-16",
-                        "notes": "Coffee with friends",
-                        "created_at": "2025-01-16T11:00:00Z",
-                        "savings_fund_id_fk": None
-                    }
-                ],
-                "count": 2,
-            }
-        }
-    )
-
-
-class RefreshTokenResponse(BaseModel):
+class RefreshTokenResponse(OmitNoneResponse):
     """Response schema for token refresh endpoint"""
     data: TokenData = Field(..., description="Token data after refresh")
-    user: Optional[dict] = Field(None, description="User information after refresh")
-    session: Optional[dict] = Field(None, description="Session information after refresh")
+    user: LoginUserData | None = Field(None, description="User information after refresh")
+    session: LoginSessionData | None = Field(None, description="Session information after refresh")
     success: bool = Field(..., description="Indicates if the request was successful")
     message: str = Field(..., description="Response message")
 
 
 class CategoriesResponse(BaseModel):
-    data: List[CategoryData] = Field(..., description="List of category records")
+    data: tuple[CategoryData, ...] = Field(..., description="List of category records")
     count: int = Field(..., description="Total number of records returned")
     success: bool = Field(..., description="Indicates if the request was successful")
     message: str = Field(..., description="Response message")
 
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "data": [
-                    {
-                        "categories_id_pk": "1",
-                        "category_name": "Groceries",
-                        "type": CategoryType.EXPENSE,
-                        "spending_type": SpendingType.CORE,
-                        "is_active": True,
-                        "created_at": "2025-01-15T10:30:00Z",
-                    }
-                ],
-                "count": 1,
-                "success": True,
-                "message": "Categories retrieved successfully"
-        }}
-    )
-
 
-class CategorySuccessResponse(BaseModel):
+class CategorySuccessResponse(OmitNoneResponse):
     """Response schema for category create/update/delete operations"""
     success: bool = Field(..., description="Indicates if the operation was successful")
     message: str = Field(..., description="Success/error message")
-    data: Optional[List[CategoryData]] = Field(None, description="Category data if applicable")
-
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "success": True,
-                "message": "Category created successfully",
-                "data": [
-                    {
-                        "categories_id_pk": "1",
-                        "category_name": "Groceries",
-                        "type": "expense",
-                        "spending_type": "Necessary",
-                        "is_active": True,
-                        "created_at": "2025-01-15T10:30:00Z"
-                    }
-                ]
-            }
-        }
-    )
+    data: tuple[CategoryData, ...] | None = Field(None, description="Category data if applicable")
 
 
 class AccountsResponse(BaseModel):
     """Response schema for accounts endpoint"""
-    data: List[AccountData] = Field(..., description="List of account records")
+    data: tuple[AccountData, ...] = Field(..., description="List of account records")
     count: int = Field(..., description="Total number of records returned")
     success: bool = Field(..., description="Indicates if the request was successful")
     message: str = Field(..., description="Response message")
 
-    model_config = ConfigDict(
-        json_encoders={Decimal: float},
-        json_schema_extra={
-            "example": {
-                "data": [
-                    {
-                        "accounts_id_pk": "acc456",
-                        "user_id_fk": "user123",
-                        "account_name": "Main Checking Account",
-                        "type": "checking",
-                        "currency": "USD",
-                        "created_at": "2025-01-15T10:30:00Z"
-                    },
-                    {
-                        "accounts_id_pk": "acc789",
-                        "user_id_fk": "user123",
-                        "account_name": "Savings Account",
-                        "type": "savings",
-                        "currency": "USD",
-                        "created_at": "2025-01-16T11:00:00Z"
-                    }
-                ],
-                "count": 2,
-            }
-        }
-    )
-
 
-class SummaryResponse(BaseModel):
+class SummaryResponse(TrustedResponse):
     """Response schema for summary endpoint"""
     data: SummaryData = Field(..., description="Financial summary data")
     success: bool = Field(..., description="Indicates if the request was successful")
     message: str = Field(..., description="Response message")
 
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "data": {
-                    "total_income": 5000.00,
-                    "total_expense": 3500.00,
-                    "total_saving": 1000.00,
-                    "total_investment": 500.00,
-                    "profit": 1500.00,
-                    "net_cash_flow": 0.00,
-                    "by_category": {
-                        "Salary": 5000.00,
-                        "Groceries": -800.00,
-                        "Utilities": -300.00
-                    }
-                },
-                "success": True,
-                "message": "Financial summary retrieved successfully"
-            }
-        }
-    )
-
 
-class MonthlyAnalyticsResponse(BaseModel):
+class MonthlyAnalyticsResponse(TrustedResponse):
     """Response schema for monthly analytics endpoint"""
     data: MonthlyAnalyticsData = Field(..., description="Monthly analytics data")
     success: bool = Field(..., description="Indicates if the request was successful")
     message: str = Field(..., description="Success message")
 
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "data": {
-                    "year": 2025,
-                    "month": 1,
-                    "month_name": "January",
-                    "income": 5000.00,
-                    "expenses": 2500.00,
-                    "savings": 1000.00,
-                    "investments": 500.00,
-                    "profit": 2000.00,
-                    "cashflow": 1000.00,
-                    "daily_spending_heatmap": [
-                        {"day": "2025-01-15", "amount": 125.50}
-                    ],
-                    "category_breakdown": [
-                        {"category": "Salary", "total": 5000.00}
-                    ],
-                    "spending_type_breakdown": [
-                        {"type": "Core", "amount": 1250.00}
-                    ]
-                },
-                "success": True,
-                "message": "Monthly analytics for January 2025 retrieved successfully"
-            }
-        }
-    )
-
 
-class YearlyAnalyticsResponse(BaseModel):
+class YearlyAnalyticsResponse(TrustedResponse):
     """Response schema for yearly analytics endpoint"""
     data: YearlyAnalyticsData = Field(..., description="Yearly analytics data")
     success: bool = Field(..., description="Indicates if the request was successful")
     message: str = Field(..., description="Response message")
 
 
-class EmergencyFundResponse(BaseModel):
+class EmergencyFundResponse(TrustedResponse):
     """Response schema for emergency fund analysis endpoint"""
     data: EmergencyFundData = Field(..., description="Emergency fund analysis data")
     success: bool = Field(..., description="Indicates if the request was successful")
@@ -279,175 +132,58 @@ class AccountSuccessResponse(BaseModel):
     success: bool = Field(..., description="Indicates if the account creation was successful")
     message: str = Field(..., description="Success message for account creation")
 
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "success": True,
-                "message": "Account created successfully"
-            }
-        }
-    )
-
 class LoginResponse(BaseModel):
     """Response schema for login endpoint"""
     access_token: str = Field(..., description="Access token for authenticated requests")
     refresh_token: str = Field(..., description="Refresh token for obtaining new access tokens")
     user_id: str = Field(..., description="ID of the authenticated user")
-    data: dict[Any, Any] = Field(..., description="Login response data containing user and session info")
-
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "access_token": "access_token_value",
-                "refresh_token": "refresh_token_value",
-                "user_id": "user123",
-                "data": {
-                    "user": {
-                        "id": "user123",
-                        "email": "user@example.com"
-                    },
-                    "session": {
-                        "access_token": "access_token_value",
-                        "refresh_token": "refresh_token_value"
-                    }
-                }
-            }
-        }
-    )
+    data: LoginSessionPayload = Field(..., description="Login response data containing user and session info")
 
 
-class TransactionsResponse(BaseModel):
+class TransactionsResponse(TrustedResponse):
     """Response schema for transactions list endpoint"""
-    data: List[TransactionData] = Field(..., description="List of transaction records")
+    data: tuple[TransactionData, ...] = Field(..., description="List of transaction records")
     count: int = Field(..., description="Total number of records returned")
     success: bool = Field(..., description="Indicates if the request was successful")
     message: str = Field(..., description="Response message")
 
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "data": [
-                    {
-                        "id_pk": "1",
-                        "user_id_fk": "user123",
-                        "account_id_fk": "acc456",
-                        "category_id_fk": 2,
-                        "amount": 49.99,
-                        "date": "2025-01-15",
-                        "notes": "Weekly grocery shopping",
-                        "created_at": "2025-01-15T10:30:00Z",
-                        "savings_fund_id_fk": None
-                    }
-                ],
-                "count": 1,
-                "success": True,
-                "message": "Transactions retrieved successfully"
-            }
-        }
-    )
+
+class TransactionsColumnarResponse(TrustedResponse):
+    """Response schema for transactions endpoint with `format=columnar`"""
+    data: TransactionColumns = Field(..., description="Transaction records as parallel columns")
+    count: int = Field(..., description="Total number of records returned")
+    success: bool = Field(..., description="Indicates if the request was successful")
+    message: str = Field(..., description="Response message")
 
 
-class TransactionSuccessResponse(BaseModel):
+class TransactionSuccessResponse(OmitNoneResponse):
     """Response schema for transaction create/update/delete operations"""
     success: bool = Field(..., description="Indicates if the operation was successful")
     message: str = Field(..., description="Success/error message")
-    data: Optional[List[TransactionData]] = Field(None, description="Transaction data if applicable")
+    data: tuple[TransactionData, ...] | None = Field(None, description="Transaction data if applicable")
 
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "success": True,
-                "message": "Transaction created successfully",
-                "data": [
-                    {
-                        "id_pk": "1",
-                        "user_id_fk": "user123",
-                        "account_id_fk": "acc456",
-                        "category_id_fk": 2,
-                        "amount": 49.99,
-                        "date": "2025-01-15",
-                        "notes": "Weekly grocery shopping",
-                        "created_at": "2025-01-15T10:30:00Z",
-                        "savings_fund_id_fk": None
-                    }
-                ]
-            }
-        }
-    )
 
-
-class SavingsFundsResponse(BaseModel):
+class SavingsFundsResponse(TrustedResponse):
     """Response schema for savings funds list endpoint"""
-    data: List[SavingsFundsData] = Field(..., description="List of savings fund records")
+    data: tuple[SavingsFundsData, ...] = Field(..., description="List of savings fund records")
     count: int = Field(..., description="Total number of records returned")
     success: bool = Field(..., description="Indicates if the request was successful")
     message: str = Field(..., description="Response message")
 
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "data": [
-                    {
-                        "savings_funds_id_pk": "123aaa",
-                        "user_id_fk": "456user",
-                        "fund_name": "Emergency Fund",
-                        "target_amount": 5000,
-                        "created_at": "2025-01-15T10:30:00Z"
-                    }
-                ],
-                "count": 1,
-                "success": True,
-                "message": "Savings funds retrieved successfully"
-            }
-        }
-    )
-
 
-class SavingsFundSuccessResponse(BaseModel):
+class SavingsFundSuccessResponse(OmitNoneResponse):
     """Response schema for savings fund create/update/delete operations"""
     success: bool = Field(..., description="Indicates if the operation was successful")
     message: str = Field(..., description="Success/error message")
-    data: Optional[List[SavingsFundsData]] = Field(None, description="Savings fund data if applicable")
-
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "success": True,
-                "message": "Savings fund created successfully",
-                "data": [
-                    {
-                        "savings_funds_id_pk": "123aaa",
-                        "user_id_fk": "456user",
-                        "fund_name": "Emergency Fund",
-                        "target_amount": 5000,
-                        "created_at": "2025-01-15T10:30:00Z"
-                    }
-                ]
-            }
-        }
-    )
+    data: tuple[SavingsFundsData, ...] | None = Field(None, description="Savings fund data if applicable")
 
 
-class ProfileResponse(BaseModel):
+class ProfileResponse(TrustedResponse):
     """Response schema for profile endpoint"""
     data: ProfileData = Field(..., description="User profile data")
     success: bool = Field(..., description="Indicates if the request was successful")
     message: str = Field(..., description="Response message")
 
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "data": {
-                    "id": "user123",
-                    "email": "user@example.com",
-                    "role": "authenticated"
-                },
-                "success": True,
-                "message": "Profile retrieved successfully"
-            }
-        }
-    )
-
 # ================================================================================================
 #                                      Budget Schemas
 # ================================================================================================
@@ -469,15 +205,6 @@ class BudgetSuccessResponse(BaseModel):
     """Response schema for budget create/update/delete operations"""
     success: bool = Field(..., description="Indicates if the operation was successful")
     message: str = Field(..., description="Success/error message")
-    
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "success": True,
-                "message": "Budget created successfully"
-            }
-        }
-    )
 
 
 # ================================================================================================
@@ -494,11 +221,11 @@ class RecurringResponse(BaseModel):
     message: str = Field(..., description="Response message")
 
 
-class RecurringSuccessResponse(BaseModel):
+class RecurringSuccessResponse(OmitNoneResponse):
     """Response schema for recurring create/update/delete/post operations"""
     success: bool = Field(..., description="Indicates if the operation was successful")
     message: str = Field(..., description="Success/error message")
-    data: Optional[List[RecurringData]] = Field(None, description="Template data if applicable")
+    data: List[RecurringData] | None = Field(None, description="Template data if applicable")
 
 
 class NetWorthResponse(BaseModel):
@@ -514,21 +241,8 @@ class DividendPortfolioResponse(BaseModel):
     success: bool = Field(..., description="Indicates if the request was successful")
     message: str = Field(..., description="Response message")
 
-    model_config = ConfigDict(
-        json_encoders={Decimal: float}
-    )
-
 
 class DividendPortfolioSuccessResponse(BaseModel):
     """Response schema for dividend portfolio create/update/delete operations"""
     success: bool = Field(..., description="Indicates if the operation was successful")
     message: str = Field(..., description="Success/error message")
-
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "success": True,
-                "message": "Dividend portfolio saved successfully"
-            }
-        }
-    )
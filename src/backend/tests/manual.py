@@ -1,3 +1,5 @@
+import atexit
+import functools
 import pathlib
 import sys
 
@@ -14,32 +16,33 @@ except ImportError:
     sys.path.insert(0, str(backend_dir))
     from helper.environment import API_KEY
 
+BASE_URL = "http://localhost:8000"
+
+# One keep-alive session for every call in a run, so the connection is opened once
+SESSION = requests.Session()
+SESSION.headers.update({"X-API-KEY": f"{API_KEY}"})
+atexit.register(SESSION.close)
+
+@functools.lru_cache(maxsize=1)
 def login():
     # load password and email
     dotenv.load_dotenv()
     email = os.getenv("EMAIL")
     password = os.getenv("PASSWORD")
 
-    headers = {
-        "X-API-KEY": f"{API_KEY}"
-    }
-
-    response = requests.post(
-        "http://localhost:8000/auth/login",
-        json={"email": email, "password": password},
-        headers=headers
+    response = SESSION.post(
+        f"{BASE_URL}/auth/login",
+        json={"email": email, "password": password}
     )
     return response.json()["access_token"]
 
-ACCESS_TOKEN = login()
-URL = "http://localhost:8000/budgets/"
+URL = f"{BASE_URL}/budgets/"
 
 def test_manual_api_call():
     headers = {
-        "X-API-KEY": f"{API_KEY}",
-        "Authorization": f"Bearer {ACCESS_TOKEN}"
+        "Authorization": f"Bearer {login()}"
     }
-    response = requests.get(URL, headers=headers)
+    response = SESSION.get(URL, headers=headers)
 
     print(response.json())
 
@@ -0,0 +1,100 @@
+"""
+Unit tests for the per-process analytics response cache.
+Covers per-user invalidation, ETag matching and the write paths that must invalidate.
+"""
+
+from collections import OrderedDict
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.helper import analytics_cache
+
+KEY = ("yearly", 2026, "CZK")
+
+# ================================================================================================
+#                                   Fixtures
+# ================================================================================================
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    """
+    Gives each test its own empty cache and generation counters.
+    """
+    monkeypatch.setattr(analytics_cache, "_cache", OrderedDict())
+    monkeypatch.setattr(analytics_cache, "_generations", {})
+
+
+# ================================================================================================
+#                                   Cache Tests
+# ================================================================================================
+
+def test_analytics_cache_invalidated_per_user():
+    """Test that a write for one user drops only that user's cached analytics"""
+    analytics_cache.store("user-a", KEY, b'{"a":1}')
+    analytics_cache.store("user-b", KEY, b'{"b":1}')
+    assert analytics_cache.get_cached("user-a", KEY) == b'{"a":1}'
+
+    analytics_cache.invalidate_user("user-a")
+
+    assert analytics_cache.get_cached("user-a", KEY) is None
+    assert analytics_cache.get_cached("user-b", KEY) == b'{"b":1}'
+
+
+def test_analytics_etag_matches_if_none_match():
+    """Test that ETags are stable per body and matched against If-None-Match lists and weak tags"""
+    etag = analytics_cache.etag_for(b'{"a":1}')
+    assert etag == analytics_cache.etag_for(b'{"a":1}')
+    assert etag != analytics_cache.etag_for(b'{"a":2}')
+
+    assert analytics_cache.etag_matches(etag, etag)
+    assert analytics_cache.etag_matches(f'"other", W/{etag}', etag)
+    assert analytics_cache.etag_matches("*", etag)
+    assert not analytics_cache.etag_matches(None, etag)
+    assert not analytics_cache.etag_matches('"other"', etag)
+
+
+# ================================================================================================
+#                                   Invalidation on Writes
+# ================================================================================================
+
+def test_account_deletion_invalidates_cached_analytics(monkeypatch):
+    """Test that deleting a user's account drops their cached analytics along with their data"""
+    from backend.backend_server import app
+    from backend.auth.auth import api_key_auth, get_current_user
+    from backend.routers import profile
+
+    class FakeQuery:
+        """Supabase query builder stand-in: every builder call chains, execute() returns no rows"""
+        def __getattr__(self, name):
+            return lambda *args, **kwargs: self
+
+        def execute(self):
+            return SimpleNamespace(data=[])
+
+    class FakeAdminClient:
+        """Async HTTP client stand-in that accepts the Supabase Auth admin delete"""
+        def __init__(self, *args, **kwargs):
+            pass
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+        async def delete(self, *args, **kwargs):
+            return SimpleNamespace(status_code=204, text="")
+
+    monkeypatch.setattr(profile, "get_service_db_client", lambda: SimpleNamespace(table=lambda name: FakeQuery()))
+    monkeypatch.setattr(profile, "httpx", SimpleNamespace(AsyncClient=FakeAdminClient))
+    monkeypatch.setitem(app.dependency_overrides, api_key_auth, lambda: "key")
+    monkeypatch.setitem(app.dependency_overrides, get_current_user,
+                        lambda: {"user_id": "user-gone", "access_token": "token"})
+    analytics_cache.store("user-gone", KEY, b'{"a":1}')
+
+    response = TestClient(app).delete("/profile/me")
+
+    assert response.status_code == 200
+    assert analytics_cache.get_cached("user-gone", KEY) is None
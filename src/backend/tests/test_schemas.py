@@ -3,50 +3,179 @@ Unit tests for Pydantic schemas.
 Tests validation rules, correct types, and required fields.
 """
 
+import inspect
+from types import SimpleNamespace
+
 import pytest
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 from datetime import date
 from decimal import Decimal
 
 from schemas.requests import (
     TransactionRequest,
-    AccountRequest
+    AccountRequest,
+    SavingsFundsRequest
+)
+from schemas.base import (
+    UserData, to_cents, TransactionData, TransactionColumns, CategoryData, AccountData, SavingsFundsData,
+    LoginSessionPayload,
+)
+from schemas import base, requests, responses
+from schemas.responses import TransactionsResponse, TransactionSuccessResponse
+from schemas.adapters import (
+    TRANSACTION_ADAPTER, TRANSACTION_LIST_ADAPTER, list_envelope_json, rows_to_models, stream_list_envelope_json,
+    stream_ndjson,
 )
-from schemas.base import UserData
+
+# ================================================================================================
+#                                   Schema Build Tests
+# ================================================================================================
+
+@pytest.mark.parametrize("module", [base, requests, responses], ids=lambda m: m.__name__)
+def test_schemas_fully_built_at_import(module):
+    """Models must resolve at class creation (no forward refs left for a deferred model_rebuild)"""
+    models = [
+        obj for obj in vars(module).values()
+        if inspect.isclass(obj) and issubclass(obj, BaseModel) and obj.__module__ == module.__name__
+    ]
+    assert models
+    assert [m.__name__ for m in models if not m.__pydantic_complete__] == []
+
 
 # ================================================================================================
 #                                   Transaction Schema Tests
 # ================================================================================================
 
-def test_transaction_request_valid():
-    """Test creating a transaction request with valid data"""
-    tx_data = {
-        "amount": 100.50,
-        "date": "2026-01-01",
-        "category_id_fk": 1,
-        "account_id_fk": "123e4567-e89b-12d3-a456-426614174000",
-        "savings_fund_id_fk": None,
-        "notes": "Test Note"
-    }
-    tx = TransactionRequest(**tx_data) # type: ignore
+@pytest.mark.parametrize("tx_data", [
+    {"amount": 100.50, "date": "2026-01-01", "category_id_fk": 1,
+     "account_id_fk": "123e4567-e89b-12d3-a456-426614174000", "savings_fund_id_fk": None, "notes": "Test Note"},
+    {"amount": "100.50", "date": "2026-01-01", "category_id_fk": "1",
+     "account_id_fk": "123e4567-e89b-12d3-a456-426614174000", "savings_fund_id_fk": None, "notes": "Test Note"},
+], ids=["native", "strings"])
+def test_transaction_request_valid(tx_data):
+    """Test that native and string payloads validate to the same typed request (string to cents, string to date)"""
+    tx = TransactionRequest.model_validate(tx_data)
+    assert isinstance(tx.amount_cents, int)
+    assert isinstance(tx.date, date)
+    assert isinstance(tx.category_id_fk, int)
     assert tx.amount == Decimal("100.50")
     assert tx.category_id_fk == 1
     assert tx.date == date(2026, 1, 1)
 
 
-def test_transaction_types():
-    """Test that Pydantic coerces types correctly (string to decimal, string to date)"""
-    tx_data = {
-        "amount": "100.50",  # String
-        "date": "2026-01-01", # String
-        "category_id_fk": "5", # String
-        "account_id_fk": "acc_id",
-        "savings_fund_id_fk": None
-    }
-    tx = TransactionRequest(**tx_data) # type: ignore
-    assert isinstance(tx.amount, Decimal)
-    assert isinstance(tx.date, date)
-    assert isinstance(tx.category_id_fk, int)
+def test_transaction_amount_round_trips_as_cents():
+    """Test that the request amount is held as cents and dumped back as a major-unit number"""
+    tx = TransactionRequest.model_validate_json(
+        '{"amount": "-49.99", "date": "2026-01-01", "category_id_fk": 1, "account_id_fk": "acc_id"}'
+    )
+    assert tx.amount_cents == -4999
+    assert tx.model_dump(mode="json", by_alias=True)["amount"] == -49.99
+    assert tx.model_dump(mode="json")["amount"] == -49.99
+
+
+@pytest.mark.parametrize("amount", ["-12.345", 0.001, "1.005", "1e400", 1e30])
+def test_transaction_rejects_sub_cent_amount(amount):
+    """Test that amounts with more than two decimals, or too large to hold in cents, are rejected"""
+    with pytest.raises(ValidationError):
+        TransactionRequest.model_validate(
+            {"amount": amount, "date": "2026-01-01", "category_id_fk": 1, "account_id_fk": "acc_id"}
+        )
+
+
+def test_transaction_rejects_non_positive_category():
+    """Test that category IDs must be positive"""
+    with pytest.raises(ValidationError):
+        TransactionRequest.model_validate(
+            {"amount": 10, "date": date(2026, 1, 1), "category_id_fk": 0, "account_id_fk": "acc_id"}
+        )
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("49.99", 4999),
+    ("-49.995", -5000),
+    (".5", 50),
+    ("1e3", 100000),
+    (12, 1200),
+    (12.34, 1234),
+    (0.29, 29),
+    (2.675, 268),
+    (Decimal("1.005"), 101),
+])
+def test_to_cents(value, expected):
+    """Test conversion of major-unit amounts to integer cents"""
+    assert to_cents(value) == expected
+
+
+@pytest.mark.parametrize("n_rows", [0, 1, 3, 7])
+def test_stream_list_envelope_matches_buffered(n_rows):
+    """Test that the batched streaming envelope produces the same bytes as the buffered one"""
+    rows = TRANSACTION_LIST_ADAPTER.validate_python([
+        {"id_pk": str(i), "user_id_fk": "u", "account_id_fk": "a", "category_id_fk": 1,
+         "amount": "10.50", "date": "2026-01-01", "notes": None}
+        for i in range(n_rows)
+    ])
+    streamed = b"".join(stream_list_envelope_json(TRANSACTION_LIST_ADAPTER, rows, "ok", batch_size=3))
+    assert streamed == list_envelope_json(TRANSACTION_LIST_ADAPTER, rows, "ok")
+
+    lines = b"".join(stream_ndjson(TRANSACTION_ADAPTER, rows, batch_size=3)).splitlines()
+    assert [TRANSACTION_ADAPTER.validate_json(line) for line in lines] == list(rows)
+
+
+@pytest.mark.parametrize("model, row", [
+    (TransactionData, {"id_pk": "t1", "account_id_fk": "a", "category_id_fk": 1, "amount": 49.99,
+                       "date": "2026-01-01", "notes": None, "dim_categories_users": {"type": "expense"}}),
+    (CategoryData, {"categories_id_pk": 1, "category_name": "Groceries", "type": "expense", "spending_type": "Core"}),
+    (AccountData, {"accounts_id_pk": "a", "account_name": "Main", "type": "checking", "currency": "CZK",
+                   "history_30d": [{"date": "2026-01-01", "balance": 10.0}]}),
+    (SavingsFundsData, {"savings_funds_id_pk": "f", "user_id_fk": "u", "fund_name": "Trip",
+                        "target_amount": 1000, "created_at": None}),
+], ids=["transaction", "category", "account", "savings_fund"])
+def test_from_row_matches_validation(model, row):
+    """Test that building from a trusted DB row serializes the same as full validation"""
+    assert model.from_row(row).model_dump_json() == model.model_validate(row).model_dump_json()
+
+
+def test_transaction_columns_match_rows():
+    """Test that the columnar listing carries the same values as the row listing, field by field"""
+    rows = [
+        {"id_pk": "t1", "account_id_fk": "a", "category_id_fk": 1, "amount": 49.99, "date": "2026-01-01"},
+        {"id_pk": "t2", "account_id_fk": "b", "category_id_fk": 2, "amount": -5, "date": "2026-01-02", "notes": "x"},
+    ]
+    record_dumps = [TransactionData.from_row(row).model_dump(mode="json") for row in rows]
+    expected = {field: [record[field] for record in record_dumps] for field in record_dumps[0]}
+
+    assert TransactionColumns.from_rows(rows).model_dump(mode="json") == expected
+    assert TransactionColumns.from_rows(rows, validate=True).model_dump(mode="json") == expected
+
+
+def test_rows_to_models_validated_matches_trusted():
+    """Test that validating a result set in one adapter call yields the same rows as the trusted path"""
+    rows = [
+        {"id_pk": "t1", "account_id_fk": "a", "category_id_fk": 1, "amount": 49.99, "date": "2026-01-01"},
+        {"id_pk": "t2", "account_id_fk": "b", "category_id_fk": 2, "amount": -5, "date": "2026-01-02", "notes": "x"},
+    ]
+    trusted = rows_to_models(TRANSACTION_LIST_ADAPTER, TransactionData, rows)
+    validated = rows_to_models(TRANSACTION_LIST_ADAPTER, TransactionData, rows, validate=True)
+    assert TRANSACTION_LIST_ADAPTER.dump_json(validated) == TRANSACTION_LIST_ADAPTER.dump_json(trusted)
+
+
+def test_from_trusted_matches_validation():
+    """Test that a trusted envelope serializes the same as a validated one"""
+    rows = (TransactionData.from_row({"id_pk": "t1", "account_id_fk": "a", "category_id_fk": 1, "amount": 49.99,
+                                      "date": "2026-01-01"}),)
+    trusted = TransactionsResponse.from_trusted(data=rows, count=1, success=True, message="ok")
+    validated = TransactionsResponse.from_trusted(data=rows, count=1, success=True, message="ok", validate=True)
+    assert trusted.model_dump_json() == validated.model_dump_json()
+
+
+def test_success_envelope_omits_unset_data():
+    """Test that a None payload is left off the envelope while nulls inside records are kept"""
+    assert TransactionSuccessResponse(success=True, message="ok", data=None).model_dump_json() == '{"success":true,"message":"ok"}'
+
+    row = TransactionData.from_row({"id_pk": "t1", "account_id_fk": "a", "category_id_fk": 1, "amount": 1,
+                                    "date": "2026-01-01", "notes": None})
+    dumped = TransactionSuccessResponse(success=True, message="ok", data=(row,)).model_dump(mode="json")
+    assert dumped["data"][0]["notes"] is None
 
 
 # ================================================================================================
@@ -58,6 +187,18 @@ def test_user_data_valid():
     user = UserData(email="test@example.com", password="password123", full_name="John Doe")
     assert user.email == "test@example.com"
 
+def test_login_payload_from_auth_objects():
+    """Test that the login payload reads attributes off auth objects and drops the rest"""
+    user = SimpleNamespace(id="u1", email="test@example.com", role=None, aud="authenticated",
+                           email_confirmed_at=None, created_at=None, updated_at=None, app_metadata={"x": 1})
+    session = SimpleNamespace(access_token="a", refresh_token="r", expires_in=3600, expires_at=None,
+                              token_type="bearer", user=user)
+    payload = LoginSessionPayload(user=user, session=session) # type: ignore
+    dumped = payload.model_dump()
+    assert dumped["user"]["id"] == "u1"
+    assert "app_metadata" not in dumped["user"]
+    assert set(dumped["session"]) == {"access_token", "refresh_token", "expires_in", "expires_at", "token_type"}
+
 def test_user_email_validation():
     """Test that invalid email format raises error"""
     # Note: Pydantic's EmailStr requires 'email-validator' package.
@@ -84,3 +225,14 @@ def test_account_creation():
         account_is_active=True
     )
     assert acc.account_name == "Main Bank"
+
+
+# ================================================================================================
+#                                   Savings Fund Schema Tests
+# ================================================================================================
+
+@pytest.mark.parametrize("target_amount", [0, -100, 10**12])
+def test_savings_fund_target_out_of_range(target_amount):
+    """Test that savings fund targets must be positive and below 10^12"""
+    with pytest.raises(ValidationError):
+        SavingsFundsRequest(user_id_fk="user123", fund_name="Emergency", target_amount=target_amount) # type: ignore
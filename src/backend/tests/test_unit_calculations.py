@@ -8,22 +8,13 @@ import pytest
 from datetime import date
 from decimal import Decimal
 import polars as pl
-import sys
-import os
-
-# Add 'src' to sys.path to allow importing 'backend' as a package
-# This assumes the file structure: src/backend/tests/test_unit_calculations.py
-# We want to add 'src' to path.
-current_dir = os.path.dirname(os.path.abspath(__file__))
-src_path = os.path.abspath(os.path.join(current_dir, "../../"))
-if src_path not in sys.path:
-    sys.path.insert(0, src_path)
-
-# Import calculation modules using the full package path
+
+# Import calculation modules using the full package path (`src` is on pytest's pythonpath)
 from backend.helper.calculations.summary_calc import (
     _prepare_transactions_dataframe as summary_prepare_df,
     _calculate_summary_totals,
     _calculate_period_comparison,
+    _calculate_enriched_summary,
     SummaryTotals
 )
 
@@ -38,7 +29,8 @@ from backend.helper.calculations.monthly_page_calc import (
 #                                   Fixtures
 # ================================================================================================
 
-@pytest.fixture
+# Both fixtures are read-only for the tests, so they are built once per module
+@pytest.fixture(scope="module")
 def sample_transactions_data():
     """
     Returns a list of raw transaction dictionaries as would come from Supabase.
@@ -76,7 +68,7 @@ def sample_transactions_data():
         }
     ]
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_dataframe(sample_transactions_data):
     """
     Returns a prepared Polars DataFrame from the sample data.
@@ -133,75 +125,88 @@ def test_calculate_summary_totals(sample_dataframe):
     # Saving: 500
     # Investment: 300
     
-    assert totals.income == 5000.0
-    assert totals.expense == 1200.0
-    assert totals.saving == 500.0
-    assert totals.investment == 300.0
+    assert totals.income == pytest.approx(5000.0, rel=1e-9)
+    assert totals.expense == pytest.approx(1200.0, rel=1e-9)
+    assert totals.saving == pytest.approx(500.0, rel=1e-9)
+    assert totals.investment == pytest.approx(300.0, rel=1e-9)
     
     # Profit = Income - Expense - Investment
     # 5000 - 1200 - 300 = 3500
-    assert totals.profit == 3500.0
+    assert totals.profit == pytest.approx(3500.0, rel=1e-9)
     
     # Net Cash Flow = Profit - Saving
     # 3500 - 500 = 3000
-    assert totals.net_cash_flow == 3000.0
+    assert totals.net_cash_flow == pytest.approx(3000.0, rel=1e-9)
 
 
-def test_calculate_period_comparison():
-    """Test period comparison logic (deltas and percentages)"""
-    current = SummaryTotals(
+def test_enriched_summary_derives_profit_and_cash_flow(sample_dataframe):
+    """Test that SummaryData's computed profit/net_cash_flow match the totals and are serialized"""
+    totals = _calculate_summary_totals(sample_dataframe)
+    summary = _calculate_enriched_summary(sample_dataframe, sample_dataframe.clear())
+
+    assert summary.profit == totals.profit
+    assert summary.net_cash_flow == totals.net_cash_flow
+
+    dumped = summary.model_dump()
+    assert dumped["profit"] == pytest.approx(3500.0, rel=1e-9)
+    assert dumped["net_cash_flow"] == pytest.approx(3000.0, rel=1e-9)
+
+
+@pytest.fixture(scope="module")
+def current_totals():
+    """Summary totals for the current period"""
+    return SummaryTotals(
         income=10000.0, expense=5000.0, saving=2000.0, investment=1000.0, profit=4000.0, net_cash_flow=2000.0
     )
-    previous = SummaryTotals(
+
+@pytest.fixture(scope="module")
+def previous_totals():
+    """Summary totals for the previous period"""
+    return SummaryTotals(
         income=8000.0, expense=4000.0, saving=1000.0, investment=1000.0, profit=3000.0, net_cash_flow=2000.0
     )
-    
-    comp = _calculate_period_comparison(current, previous)
+
+def test_calculate_period_comparison(current_totals, previous_totals):
+    """Test period comparison logic (deltas and percentages)"""
+    comp = _calculate_period_comparison(current_totals, previous_totals)
     
     # Income: 10000 vs 8000 -> +2000 (+25%)
-    assert comp.income_delta == 2000.0
-    assert comp.income_delta_pct == 25.0
+    assert comp.income_delta == pytest.approx(2000.0, rel=1e-9)
+    assert comp.income_delta_pct == pytest.approx(25.0, rel=1e-9)
     
     # Expense: 5000 vs 4000 -> +1000 (+25%)
-    assert comp.expense_delta == 1000.0
-    assert comp.expense_delta_pct == 25.0
+    assert comp.expense_delta == pytest.approx(1000.0, rel=1e-9)
+    assert comp.expense_delta_pct == pytest.approx(25.0, rel=1e-9)
     
     # Saving: 2000 vs 1000 -> +100%
-    assert comp.saving_delta_pct == 100.0
+    assert comp.saving_delta_pct == pytest.approx(100.0, rel=1e-9)
     
     # Investment: 1000 vs 1000 -> 0%
-    assert comp.investment_delta_pct == 0.0
+    assert comp.investment_delta_pct == pytest.approx(0.0, rel=1e-9)
     
     # Tests zero division safety
     zero_prev = SummaryTotals()
-    comp_zero = _calculate_period_comparison(current, zero_prev)
-    assert comp_zero.income_delta_pct == 100.0  # Or whatever fallback defined
+    comp_zero = _calculate_period_comparison(current_totals, zero_prev)
+    assert comp_zero.income_delta_pct == pytest.approx(100.0, rel=1e-9)  # Or whatever fallback defined
 
 
 # ================================================================================================
 #                                   Monthly Calculation Tests
 # ================================================================================================
 
-def test_calculate_run_rate(sample_dataframe):
-    """Test run rate calculation logic"""
-    # Note: Run rate depends on "today". We simulate by constructing the DF accordingly.
-    # The function _calculate_run_rate uses date.today() internally, so testing "current month" logic
-    # is tricky without mocking date.today().
-    # However, we can test "past month" logic easily (year=2020) where days_elapsed = total_days.
-    
+@pytest.mark.parametrize("today, days_elapsed, days_remaining, projected", [
+    (date(2027, 2, 15), 31, 0, 1200.0),   # past month: projection equals actual expenses
+    (date(2026, 1, 10), 10, 21, 3720.0),  # current month: 1200 / 10 days, extrapolated over 31
+    (date(2025, 12, 31), 0, 31, 1200.0),  # future month: nothing elapsed, no extrapolation
+], ids=["past", "current", "future"])
+def test_calculate_run_rate(sample_dataframe, today, days_elapsed, days_remaining, projected):
+    """Test run rate calculation for Jan 2026 as seen from a fixed day"""
     # Total expenses in sample: 1200
-    # Analyzing Jan 2026 (assuming it's in the past relative to the code or fully elapsed logic)
-    # If we pass a past date, days_remaining should be 0, projected = actual.
-    
-    from datetime import date
-    current_year = date.today().year
-    past_year = current_year - 1
-    
-    forecast = _calculate_run_rate(sample_dataframe, year=past_year, month=1)
-    
-    # For a past month, projection should equal actual expenses
-    assert forecast.projected_month_end_expenses == 1200.0
-    assert forecast.days_remaining == 0
+    forecast = _calculate_run_rate(sample_dataframe, year=2026, month=1, today=today)
+
+    assert forecast.days_elapsed == days_elapsed
+    assert forecast.days_remaining == days_remaining
+    assert forecast.projected_month_end_expenses == pytest.approx(projected, rel=1e-9)
 
 
 def test_calculate_day_split(sample_dataframe):
@@ -215,8 +220,87 @@ def test_calculate_day_split(sample_dataframe):
     # Weekday average: 1 day (Mon) with 1000 -> 1000
     # Weekend average: 1 day (Sat) with 200 -> 200
     
-    assert split.average_weekday_spend == 1000.0
-    assert split.average_weekend_spend == 200.0
+    assert split.average_weekday_spend == pytest.approx(1000.0, rel=1e-9)
+    assert split.average_weekend_spend == pytest.approx(200.0, rel=1e-9)
+
+
+# ================================================================================================
+#                                   Yearly Calculation Tests
+# ================================================================================================
+
+from backend.helper.calculations.yearly_page_calc import (
+    _prepare_transactions_dataframe as yearly_prepare_df,
+    _initialize_monthly_data,
+    _calculate_monthly_aggregations,
+    _calculate_yearly_totals,
+    _calculate_category_breakdowns,
+    _prepare_emergency_fund_dataframe,
+    _calculate_core_expenses,
+)
+
+def test_currency_conversion_looks_up_each_currency_once(monkeypatch):
+    """Test that rows are converted per currency with one rate lookup per distinct currency"""
+    from backend.helper import exchange_rates
+    from backend.helper.calculations.yearly_page_calc import _apply_currency_conversion
+
+    lookups = []
+    def fake_rate(from_currency, to_currency):
+        lookups.append(from_currency)
+        return {"EUR": 25.0, "CZK": 1.0}[from_currency]
+    monkeypatch.setattr(exchange_rates, "get_rate", fake_rate)
+
+    df = pl.DataFrame({"amount": [2.0, -1.0, 4.0], "abs_amount": [2.0, 1.0, 4.0], "currency": ["EUR", None, "EUR"]})
+    converted = _apply_currency_conversion(df, "CZK")
+
+    assert converted["amount"].to_list() == [50.0, -1.0, 100.0]
+    assert sorted(lookups) == ["CZK", "EUR"]
+
+
+def test_calculate_yearly_aggregations(sample_transactions_data):
+    """Test monthly series and yearly totals, including the savings fund withdrawal adjustment"""
+    rows = sample_transactions_data + [{
+        "amount": 100.0,
+        "date": "2026-02-03",
+        "dim_categories_users": {"category_type": "income", "category_name": "Savings Funds Withdrawal", "spending_type": "Income"},
+    }]
+    df = yearly_prepare_df(rows)
+
+    monthly = _calculate_monthly_aggregations(df, _initialize_monthly_data())
+    assert monthly['Jan'].income_wo_savings_funds == 5000.0
+    assert monthly['Jan'].core_expense == 1000.0
+    assert monthly['Jan'].future_expense == 800.0
+    assert monthly['Feb'].income == 100.0
+    assert monthly['Feb'].income_wo_savings_funds == 0.0
+    assert monthly['Feb'].savings_w_withdrawals == -100.0
+    assert monthly['Mar'].income == 0.0
+
+    totals = _calculate_yearly_totals(df)
+    assert totals.income == 5000.0
+    assert totals.expense == 1200.0
+    assert totals.saving == 400.0
+    assert totals.investment == 300.0
+    assert totals.profit == 3500.0
+    assert totals.net_cash_flow == 3100.0
+
+
+def test_calculate_category_breakdowns(sample_transactions_data):
+    """Test that each breakdown only lists categories with matching transactions, largest first"""
+    breakdowns = _calculate_category_breakdowns(yearly_prepare_df(sample_transactions_data))
+
+    assert breakdowns.by_category == (
+        ("Salary", 5000.0), ("Groceries", -200.0), ("Stocks", -300.0), ("Emergency Fund", -500.0), ("Rent", -1000.0)
+    )
+    assert breakdowns.core_categories == (("Rent", 1000.0),)
+    assert breakdowns.income_by_category == (("Salary", 5000.0),)
+    assert breakdowns.expense_by_category == (("Rent", 1000.0), ("Groceries", 200.0))
+
+
+def test_core_category_breakdown_largest_first(sample_transactions_data):
+    """Test that emergency-fund core expenses are broken down by category as largest-first pairs"""
+    monthly, by_category = _calculate_core_expenses(_prepare_emergency_fund_dataframe(sample_transactions_data))
+
+    assert sum(monthly.values()) == 1000.0
+    assert by_category == (("Rent", 1000.0),)
 
 
 # ================================================================================================
@@ -226,7 +310,8 @@ def test_calculate_day_split(sample_dataframe):
 from backend.schemas.base import BudgetPlanRow
 from backend.helper.calculations.budgets_calc import _calculate_budget_view
 
-@pytest.fixture
+# Plan rows and actuals are only read by the budget view, so both are built once per module
+@pytest.fixture(scope="module")
 def sample_budget_plan_rows():
     """
     Returns a list of BudgetPlanRow objects for testing.
@@ -240,7 +325,7 @@ def sample_budget_plan_rows():
         BudgetPlanRow(category_id=6, group="Expense", name="Unused", amount=Decimal("100.0"), include_in_total=True), # No actuals
     ]
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_budget_actuals():
     """
     Returns a map of category_id -> total_amount (actuals).
@@ -277,43 +362,59 @@ def test_calculate_budget_view(sample_budget_plan_rows, sample_budget_actuals):
     # Savings: 500
     # Investment: 300
     # Remaining: 5000 - 1100 - 500 - 300 = 3100
-    assert resp.summary.total_income == 5000.0
-    assert resp.summary.total_expense == 1100.0
-    assert resp.summary.total_savings == 500.0
-    assert resp.summary.total_investments == 300.0
-    assert resp.summary.remaining_budget == 3100.0
+    assert resp.summary.total_income == pytest.approx(5000.0, rel=1e-9)
+    assert resp.summary.total_expense == pytest.approx(1100.0, rel=1e-9)
+    assert resp.summary.total_savings == pytest.approx(500.0, rel=1e-9)
+    assert resp.summary.total_investments == pytest.approx(300.0, rel=1e-9)
+    assert resp.summary.remaining_budget == pytest.approx(3100.0, rel=1e-9)
     
     # Check Rows Logic
     
     # Income (Salary)
     # Planned 5000, Actual 5000 -> Diff 0%
     salary = next(r for r in resp.income_rows if r.name == "Salary")
-    assert salary.amount == 5000.0
-    assert salary.actual_amount == 5000.0
-    assert salary.difference_pct == 0.0
+    assert salary.amount == pytest.approx(5000.0, rel=1e-9)
+    assert salary.actual_amount == pytest.approx(5000.0, rel=1e-9)
+    assert salary.difference_pct == pytest.approx(0.0, rel=1e-9)
     
     # Expense (Rent)
     # Planned 1000, Actual -1200 -> Inverted to 1200 for view
     # Diff: (1200 - 1000) / 1000 = 0.2 -> 20%
     rent = next(r for r in resp.expense_rows if r.name == "Rent")
-    assert rent.amount == 1000.0
-    assert rent.actual_amount == 1200.0
-    assert rent.difference_pct == 20.0
+    assert rent.amount == pytest.approx(1000.0, rel=1e-9)
+    assert rent.actual_amount == pytest.approx(1200.0, rel=1e-9)
+    assert rent.difference_pct == pytest.approx(20.0, rel=1e-9)
     
     # Expense (Groceries)
     # Planned 0, Actual -50 -> Inverted 50
     # Diff: (50 - 0) / 0 -> Correctly handled as 0 in code to avoid ZeroDivision
     groceries = next(r for r in resp.expense_rows if r.name == "Groceries")
-    assert groceries.amount == 0.0
-    assert groceries.actual_amount == 50.0
-    assert groceries.difference_pct == 0.0
+    assert groceries.amount == pytest.approx(0.0, rel=1e-9)
+    assert groceries.actual_amount == pytest.approx(50.0, rel=1e-9)
+    assert groceries.difference_pct == pytest.approx(0.0, rel=1e-9)
     
     # Expense (Unused)
     # Planned 100, Actual None (0 default) -> Inverted 0
     # Diff: (0 - 100) / 100 = -1.0 -> -100%
     unused = next(r for r in resp.expense_rows if r.name == "Unused")
-    assert unused.amount == 100.0
-    assert unused.actual_amount == 0.0
-    assert unused.difference_pct == -100.0
+    assert unused.amount == pytest.approx(100.0, rel=1e-9)
+    assert unused.actual_amount == pytest.approx(0.0, rel=1e-9)
+    assert unused.difference_pct == pytest.approx(-100.0, rel=1e-9)
+
+
+# ================================================================================================
+#                                   Profile Tests
+# ================================================================================================
+
+from types import SimpleNamespace
+from backend.helper.calculations.profile_page_calc import _build_profile_data
 
+def test_profile_extensions_only_attached_when_set():
+    """Test that rarely-set profile fields are grouped under extensions only when one has a value"""
+    user = SimpleNamespace(id="user123", email="user@example.com", identities=[])
+    assert _build_profile_data(user).extensions is None
 
+    pending = SimpleNamespace(id="user123", email="user@example.com", identities=[], new_email="new@example.com")
+    profile = _build_profile_data(pending)
+    assert profile.extensions is not None
+    assert profile.extensions.new_email == "new@example.com"
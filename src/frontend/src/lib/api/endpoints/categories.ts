@@ -15,7 +15,7 @@ interface CategoriesResponse {
 }
 
 interface CategorySuccessResponse {
-    data: Category[] | null;
+    data?: Category[];
     success: boolean;
     message: string;
 }
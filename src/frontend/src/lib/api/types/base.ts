@@ -21,6 +21,17 @@ export interface User {
     updated_at?: string;
 }
 
+/**
+ * Session tokens returned on login/register
+ */
+export interface LoginSessionData {
+    access_token: string;
+    refresh_token: string;
+    expires_in: number | null;
+    expires_at: number | null;
+    token_type: string | null;
+}
+
 /**
  * Identity provider data for user authentication
  */
@@ -35,6 +46,21 @@ export interface IdentityData {
     updated_at: string | null;
 }
 
+/**
+ * Rarely-set profile fields (pending changes, recovery/invite state, MFA)
+ */
+export interface ProfileExtensions {
+    email_change_sent_at: string | null;
+    new_email: string | null;
+    phone_confirmed_at: string | null;
+    new_phone: string | null;
+    confirmation_sent_at: string | null;
+    recovery_sent_at: string | null;
+    invited_at: string | null;
+    factors: Record<string, unknown>[] | null;
+    action_link: string | null;
+}
+
 /**
  * User profile data from Supabase Auth
  */
@@ -45,18 +71,11 @@ export interface ProfileData {
     is_anonymous: boolean;
     email: string | null;
     email_confirmed_at: string | null;
-    email_change_sent_at: string | null;
-    new_email: string | null;
     phone: string | null;
-    phone_confirmed_at: string | null;
-    new_phone: string | null;
     created_at: string | null;
     updated_at: string | null;
     last_sign_in_at: string | null;
     confirmed_at: string | null;
-    confirmation_sent_at: string | null;
-    recovery_sent_at: string | null;
-    invited_at: string | null;
     app_metadata: Record<string, unknown> | null;
     user_metadata: {
         full_name?: string;
@@ -66,8 +85,8 @@ export interface ProfileData {
         [key: string]: unknown;
     } | null;
     identities: IdentityData[] | null;
-    factors: Record<string, unknown>[] | null;
-    action_link: string | null;
+    /** Rarely-set fields; null unless at least one of them has a value */
+    extensions: ProfileExtensions | null;
 }
 
 // ================================================================================================
@@ -90,6 +109,22 @@ export interface Transaction {
     savings_fund_id_fk: string | null;
 }
 
+/**
+ * Column-oriented transaction listing (`GET /transactions?format=columnar`)
+ * Matches backend TransactionColumns schema; every list has the same length
+ */
+export interface TransactionColumns {
+    id_pk: (string | null)[];
+    user_id_fk: (string | null)[];
+    account_id_fk: string[];
+    category_id_fk: number[];
+    amount: number[];
+    date: string[];
+    notes: (string | null)[];
+    created_at: (string | null)[];
+    savings_fund_id_fk: (string | null)[];
+}
+
 // ================================================================================================
 //                                   Category Types
 // ================================================================================================
@@ -380,10 +415,11 @@ export interface YearlyAnalyticsData {
     monthly_future_expense: number[];
     monthly_savings_rate: number[];
     monthly_investment_rate: number[];
-    by_category: Record<string, number>;
-    core_categories: Record<string, number>;
-    income_by_category: Record<string, number>;
-    expense_by_category: Record<string, number>;
+    /** [category, amount] pairs, largest amount first */
+    by_category: [string, number][];
+    core_categories: [string, number][];
+    income_by_category: [string, number][];
+    expense_by_category: [string, number][];
 }
 
 // ================================================================================================
@@ -402,7 +438,8 @@ export interface EmergencyFundData {
     total_core_expenses: number;
     three_month_core_target: number;
     six_month_core_target: number;
-    core_category_breakdown: Record<string, number>;
+    /** [category, amount] pairs, largest amount first */
+    core_category_breakdown: [string, number][];
 
     // Core + Necessary Expenses
     average_monthly_core_necessary: number;
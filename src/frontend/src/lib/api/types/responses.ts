@@ -6,8 +6,10 @@
 
 import type {
     User,
+    LoginSessionData,
     ProfileData,
     Transaction,
+    TransactionColumns,
     Category,
     Account,
     SavingsFund,
@@ -46,10 +48,7 @@ export interface AuthResponse {
     user_id: string;
     data: {
         user: User;
-        session: {
-            access_token: string;
-            refresh_token: string;
-        };
+        session: LoginSessionData | null;
     };
 }
 
@@ -62,13 +61,8 @@ export interface RefreshResponse {
         refresh_token: string;
         user_id: string;
     };
-    user: {
-        id: string;
-    };
-    session: {
-        access_token: string;
-        refresh_token: string;
-    };
+    user?: User;
+    session?: LoginSessionData;
     success: boolean;
     message: string;
 }
@@ -101,6 +95,16 @@ export interface TransactionsResponse {
     message: string;
 }
 
+/**
+ * Transactions list response in columnar form (`format=columnar`)
+ */
+export interface TransactionsColumnarResponse {
+    data: TransactionColumns;
+    count: number;
+    success: boolean;
+    message: string;
+}
+
 /**
  * Single transaction response
  */
@@ -127,7 +131,7 @@ export interface CategoriesResponse {
  * Category success response (create/update/delete)
  */
 export interface CategorySuccessResponse {
-    data: Category[] | null;
+    data?: Category[];
     success: boolean;
     message: string;
 }
@@ -52,9 +52,9 @@ export default function EmergencyFundPage() {
     placeholderData: keepPreviousData,
   });
 
-  const coreCategoryBreakdownData = useMemo(() => Object.entries(data?.core_category_breakdown ?? {})
-    .map(([name, amount]) => ({ name, amount }))
-    .sort((a, b) => b.amount - a.amount), [data]);
+  // Pairs arrive sorted largest-first
+  const coreCategoryBreakdownData = useMemo(() => (data?.core_category_breakdown ?? [])
+    .map(([name, amount]) => ({ name, amount })), [data]);
 
   if (loading) {
     return <AnalyticsSkeleton />;
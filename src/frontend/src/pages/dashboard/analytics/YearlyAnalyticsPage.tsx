@@ -145,10 +145,10 @@ export default function YearlyAnalyticsPage() {
       Future: data.monthly_future_expense[index] || 0,
   })) ?? [], [data]);
 
-  const categoryBreakdownData = useMemo(() => Object.entries(data?.expense_by_category ?? {})
-    .map(([name, value]) => ({ name, value }))
-    .sort((a, b) => b.value - a.value)
-    .slice(0, 8), [data]);
+  // Pairs arrive sorted largest-first
+  const categoryBreakdownData = useMemo(() => (data?.expense_by_category ?? [])
+    .slice(0, 8)
+    .map(([name, value]) => ({ name, value })), [data]);
 
   const balanceData = useMemo(() => {
     if (!data) return [];